@@ -0,0 +1,256 @@
+import hashlib
+import marshal
+import os
+import sys
+import threading
+import time
+import zlib
+from array import array
+
+import lexer as lexer_module
+import parser as parser_module
+import grammar_tables
+from parser import Node
+from token_buffer import TokenBuffer
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'python-highlighter')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# diske yazımlar arasındaki en kısa süre (saniye); arada saklanan analizler
+# bir sonraki store'a veya flush'a kalır
+WRITE_INTERVAL = 2.0
+
+# Dosya başlığı; biçim değişirse sürüm artırılır
+MAGIC = b'PHC1'
+SUFFIX = '.phc'
+
+# Ağaç akışındaki başlık işaretleri; değerler str/None olduğu için tamsayılarla karışmaz
+LEAF, BRANCH, LIST = 0, 1, 2
+
+
+def source_fingerprint(*modules):
+    """Lexer/Parser kaynaklarının özeti: kod değişince eski kayıtlar kullanılmaz"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{sys.version_info[:2]}:{marshal.version}".encode())
+    for module in modules:
+        with open(module.__file__, 'rb') as file:
+            digest.update(file.read())
+    return digest.digest()
+
+
+def encode_tree(root):
+    """Düğüm ağacını son sıralı (postorder) düz listeye çevir.
+
+    Öğeler önce yazılır, ardından kapsayıcı: yaprak düğüm için değer, LEAF,
+    tür, başlangıç, bitiş; diğer düğümler için öğeler, BRANCH, tür, başlangıç,
+    bitiş, öğe sayısı; düğüm değerindeki listeler için öğeler, LIST, öğe sayısı.
+    """
+    out = []
+    append = out.append
+    # yığındaki demetler, öğelerden sonra yazılacak başlıklardır
+    stack = [root]
+    pop, push = stack.pop, stack.append
+    while stack:
+        item = pop()
+        cls = item.__class__
+        if cls is Node:
+            value = item.value
+            if value.__class__ is tuple:
+                push((BRANCH, item.type, item.start, item.end, len(value)))
+                stack.extend(reversed(value))
+            else:
+                out += (value, LEAF, item.type, item.start, item.end)
+        elif cls is list:
+            push((LIST, len(item)))
+            stack.extend(reversed(item))
+        elif cls is tuple:
+            out += item
+        else:
+            append(item)
+    return out
+
+
+def decode_tree(items):
+    """encode_tree çıktısından düğüm ağacını yığın makinesiyle yeniden kur"""
+    stack = []
+    push = stack.append
+    index = 0
+    count = len(items)
+    while index < count:
+        marker = items[index]
+        if marker.__class__ is not int:
+            push(marker)
+            index += 1
+        elif marker == LEAF:
+            stack[-1] = Node(items[index + 1], stack[-1], items[index + 2], items[index + 3])
+            index += 4
+        elif marker == BRANCH:
+            first = len(stack) - items[index + 4]
+            value = tuple(stack[first:])
+            del stack[first:]
+            push(Node(items[index + 1], value, items[index + 2], items[index + 3]))
+            index += 5
+        else:
+            first = len(stack) - items[index + 1]
+            value = stack[first:]
+            del stack[first:]
+            push(value)
+            index += 2
+    if len(stack) != 1:
+        raise ValueError("Corrupt cache file")
+    return stack[0]
+
+
+class AnalysisCache:
+    """İçerik özetiyle anahtarlanan, token akışı ve parse ağacı saklayan disk önbelleği.
+
+    Her belge için bir dosya yazılır: düz tokenların TokenBuffer sütunları
+    (tür kimlikleri, başlangıç ve bitiş ofsetleri), ağaç ise encode_tree akışı
+    olarak marshal'lanıp sıkıştırılır. Token değerleri yüklenirken kaynaktan
+    dilimlenir. Klasör
+    max_bytes'ı aşınca en uzun süredir okunmayan dosyalar silinir (okunan
+    dosyanın değişiklik zamanı yenilenir).
+
+    store analizi diske yazar; yazarken her duraksamada yazmamak için son
+    yazımdan beri WRITE_INTERVAL geçmediyse son analiz bellekte bekler ve
+    bir sonraki store'da, aynı içerik yeniden yüklendiğinde veya editör
+    kapanırken flush ile yazılır.
+    """
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES, lexer=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lexer = lexer or lexer_module.Lexer()
+        self.namespace = source_fingerprint(lexer_module, parser_module, grammar_tables,
+                                            sys.modules[TokenBuffer.__module__],
+                                            sys.modules[type(self.lexer).__module__])
+        # (anahtar, TokenBuffer, escape vurgulamalı tokenlar, ağaç); tampon None
+        # değilse kayıt henüz diske yazılmamıştır
+        self.recent = None
+        self.lock = threading.Lock()
+        self.last_write = float('-inf')
+        self.hits = self.misses = self.writes = self.evictions = 0
+        self.total_bytes = None
+
+    def key(self, code):
+        digest = hashlib.blake2b(self.namespace, digest_size=20)
+        digest.update(code.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, code):
+        """Önbellekteki (escape vurgulamalı tokenlar, parse ağacı) çifti veya None"""
+        key = self.key(code)
+        recent = self.recent
+        if recent is not None and recent[0] == key:
+            # ikinci kez görülen içerik beklemedeyse diske alınır
+            self.flush()
+            self.hits += 1
+            return recent[2], recent[3]
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            kinds, starts, ends, tree = decode_entry(data)
+            buffer = TokenBuffer.from_columns(code, kinds, starts, ends)
+            escaped_tokens = buffer.escaped_tokens(self.lexer.string_part_offsets)
+            os.utime(path)
+        except (OSError, ValueError, EOFError, TypeError, IndexError, zlib.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        # bekleyen analiz yerini yüklenen kayda bırakmadan önce yazılır
+        self.flush()
+        self.recent = (key, None, escaped_tokens, tree)
+        return escaped_tokens, tree
+
+    def store(self, code, tokens, escaped_tokens, tree):
+        """Yeni analiz sonucunu hatırla ve diske yaz; tokens ofsetli düz Token listesidir"""
+        self.recent = (self.key(code), TokenBuffer.from_tokens(code, tokens), escaped_tokens, tree)
+        if time.monotonic() - self.last_write >= WRITE_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Bekleyen son analizi diske yaz; editör kapanırken de çağrılır"""
+        with self.lock:
+            recent = self.recent
+            if recent is None or recent[1] is None:
+                return
+            key, buffer, escaped_tokens, tree = recent
+            self.recent = (key, None, escaped_tokens, tree)
+            self.last_write = time.monotonic()
+        self.write(key, encode_entry(buffer, tree))
+
+    def write(self, key, data):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self.entries())
+            path = self.path(key)
+            # yarım yazılmış dosya okunmasın diye geçici adla yazılıp taşınır
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, 'wb') as file:
+                file.write(data)
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temporary, path)
+        except OSError:
+            return False
+        self.writes += 1
+        self.total_bytes += len(data) - previous
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+        return True
+
+    def entries(self):
+        """(yol, boyut, son kullanım) üçlüleri"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if name.endswith(SUFFIX):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((os.path.join(self.directory, name), stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def evict(self):
+        """En eski kullanılan dosyaları boyut sınırının altına inene kadar sil"""
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self.total_bytes = total
+
+
+def encode_entry(buffer, tree):
+    """Düz tokenların TokenBuffer'ı ve ağaçtan dosya içeriği"""
+    payload = (buffer.kinds.tobytes(), buffer.starts.tobytes(), buffer.ends.tobytes(), encode_tree(tree))
+    return MAGIC + zlib.compress(marshal.dumps(payload), 1)
+
+
+def decode_entry(data):
+    """Dosya içeriğinden (tür kimlikleri, başlangıçlar, bitişler, ağaç)"""
+    if not data.startswith(MAGIC):
+        raise ValueError("Unknown cache file format")
+    kind_bytes, start_bytes, end_bytes, tree = marshal.loads(zlib.decompress(data[len(MAGIC):]))
+    kinds = array('B')
+    kinds.frombytes(kind_bytes)
+    starts = array('I')
+    starts.frombytes(start_bytes)
+    ends = array('I')
+    ends.frombytes(end_bytes)
+    if not len(kinds) == len(starts) == len(ends):
+        raise ValueError("Corrupt cache file")
+    return kinds, starts, ends, decode_tree(tree)
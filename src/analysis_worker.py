@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+
+# Sonuç kuyruğunun yoklanma aralığı (ms); yalnızca sonucu beklenen istek varken yoklanır
+POLL_INTERVAL = 15
+
+
+class AnalysisWorker:
+    """Analiz işini (tokenize, ayrıştırma) arka plan iş parçacığında çalıştırır.
+
+    Her submit belgenin nesil numarasını bir artırır ve isteği tek kişilik
+    bekleme yuvasına koyar; iş parçacığı henüz başlamadığı eski isteği hiç
+    çalıştırmaz. Sonuçlar kuyruğa konur, ana iş parçacığı kuyruğu after()
+    ile yoklar: son neslin sonucu apply'a, yerini yenisine bırakmış
+    nesillerinki (analyze hata verdiyse None) discard'a verilir. analyze
+    Tk'ya dokunmamalıdır; apply ve discard ana iş parçacığında çalışır,
+    böylece tuş vuruşları analizi beklemez.
+
+    background=False ise submit analizi hemen çalıştırıp uygular (Tk'sız
+    ölçümler ve tek iş parçacıklı kullanım için).
+    """
+    def __init__(self, widget, analyze, apply, discard=None, background=True, poll_interval=POLL_INTERVAL):
+        self.widget = widget
+        self.analyze = analyze
+        self.apply = apply
+        self.discard = discard
+        self.background = background
+        self.poll_interval = poll_interval
+        self.generation = 0   # son istenen nesil
+        self.completed = 0    # sonucu ana iş parçacığına ulaşan son nesil
+        self.applied = 0      # sonucu uygulanan son nesil
+        self.dropped = 0      # atılan eski sonuç sayısı
+        self.duration = 0.0   # ana iş parçacığına ulaşan son analizin süresi (sn)
+        self.pending = None
+        self.results = queue.Queue()
+        self.condition = threading.Condition()
+        self.poll_scheduled = False
+        self.closed = False
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target=self.run, name="analysis-worker", daemon=True)
+            self.thread.start()
+
+    def submit(self, *args):
+        """Yeni nesil için analiz iste; nesil numarasını döndür"""
+        self.generation += 1
+        generation = self.generation
+        if not self.background:
+            self.handle(self.call(generation, args))
+            return generation
+        with self.condition:
+            self.pending = (generation, args)
+            self.condition.notify()
+        self.schedule_poll()
+        return generation
+
+    def busy(self):
+        """Son neslin sonucu henüz uygulanmadıysa True"""
+        return self.completed != self.generation
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                generation, args = self.pending
+                self.pending = None
+            self.results.put(self.call(generation, args))
+
+    def call(self, generation, args):
+        start = time.perf_counter()
+        try:
+            return generation, self.analyze(*args), None, time.perf_counter() - start
+        except Exception as error:
+            # ana iş parçacığında yeniden yükseltilir
+            return generation, None, error, time.perf_counter() - start
+
+    def schedule_poll(self):
+        if not self.poll_scheduled:
+            self.poll_scheduled = True
+            self.widget.after(self.poll_interval, self.poll)
+
+    def poll(self):
+        """Kuyruktaki sonuçları uygula veya at; iş sürüyorsa yeniden yokla"""
+        self.poll_scheduled = False
+        try:
+            while True:
+                try:
+                    item = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                self.handle(item)
+        finally:
+            if self.busy() and not self.closed:
+                self.schedule_poll()
+
+    def handle(self, item):
+        generation, result, error, self.duration = item
+        self.completed = generation
+        if generation != self.generation or error is not None:
+            self.dropped += 1
+            if self.discard is not None:
+                self.discard(result)
+            if error is not None and generation == self.generation:
+                raise error
+            return
+        self.applied = generation
+        self.apply(result)
+
+    def flush(self, timeout=None):
+        """Son neslin sonucunu bekleyip uygula; zaman aşımında False"""
+        while self.busy():
+            try:
+                item = self.results.get(timeout=timeout)
+            except queue.Empty:
+                return False
+            self.handle(item)
+        return True
+
+    def close(self):
+        """İş parçacığını durdur; bekleyen istek çalıştırılmaz"""
+        with self.condition:
+            self.closed = True
+            self.pending = None
+            self.condition.notify()
@@ -0,0 +1,1444 @@
+"""Performans ölçümleri
+
+Kullanım: python benchmark.py [ölçüm_adı ...]
+Ad verilmezse tüm ölçümler çalışır.
+"""
+import gc
+import html
+import io
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+import tracemalloc
+
+from lexer import Lexer, LineIndex
+from parser import Parser, Node, tree_children
+from incremental import IncrementalLexer, IncrementalParser
+from dispatch_lexer import DispatchLexer
+from stdlib_lexer import StdlibLexer
+from token_buffer import TokenBuffer, token_list_memory
+from analysis_cache import AnalysisCache
+from treeview_sync import TreeviewRows, TreeviewNodes
+from highlighter import Highlighter, BracketMatcher, AutoCompleter, merge_ranges, complement_ranges
+from document import Document, plain_tokens
+from edit_proxy import EditDelta, EditSource
+from scheduler import PassScheduler
+from render import HtmlRenderer, AnsiRenderer
+from themes import light_theme, dark_theme
+import grammar
+
+# Ölçümlerde kullanılan örnek satırlar (lexer ve parser için geçerli)
+SAMPLE_LINES = [
+    'def add(a, b): return a + b',
+    'x = [1, 2, 3] # list example',
+    'if x > 10: print("big\\n") elif x > 5: print("medium") else: print("small")',
+    'total = sum([1, 2, 3])',
+    'while x > 0: x = x - 1',
+    'for i in range(10): y = i * 3.14',
+    'class MyClass: pass',
+    'text_length = len("Hello \\"world\\"")',
+]
+
+SIZES = (1000, 10000, 50000)
+
+
+def make_source(line_count):
+    """Verilen satır sayısında örnek kaynak kod üret"""
+    lines = [SAMPLE_LINES[i % len(SAMPLE_LINES)] for i in range(line_count)]
+    return '\n'.join(lines)
+
+
+def timed(func, *args, repeat=3):
+    """En iyi süreyi saniye cinsinden döndür"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(label, line_count, seconds):
+    per_line = seconds / line_count * 1e6
+    print(f"{label:<32} {line_count:>7} satır  {seconds * 1000:9.1f} ms  {per_line:7.2f} µs/satır")
+
+
+def bench_positions():
+    """Konumlu tokenize: satır başına süre boyuttan bağımsız kalmalı"""
+    lexer = Lexer()
+    for line_count in SIZES:
+        code = make_source(line_count)
+        report("tokenize_with_positions", line_count, timed(lexer.tokenize_with_positions, code))
+
+
+def bench_incremental():
+    """Tek karakterlik düzenleme: süre dosya uzunluğundan bağımsız kalmalı"""
+    for line_count in SIZES:
+        code = make_source(line_count)
+        lexer = IncrementalLexer()
+        lexer.reset(code)
+        offset = code.find('\n', len(code) // 2) - 1
+        edits = 200
+        start = time.perf_counter()
+        for _ in range(edits):
+            lexer.edit(offset, 0, 'x')
+            lexer.edit(offset, 1, '')
+        elapsed = (time.perf_counter() - start) / (edits * 2)
+        print(f"{'IncrementalLexer.edit':<32} {line_count:>7} satır  {elapsed * 1e6:9.1f} µs/düzenleme")
+    # line_tokens görünümü konumlu düz Token listesiyle aynı olmalı
+    for code in (make_source(SIZES[0]), 'x = """a\nb\\n c"""\ny = 1', '   \n'):
+        lexer = IncrementalLexer()
+        lexer.reset(code)
+        lexer.edit(code.find('\n') + 1, 0, '"""\n"""\n')
+        view = lexer.line_tokens()
+        expected = plain_tokens(lexer.tokens_with_positions(), lexer.code)
+        assert list(view) == expected and [view[index] for index in range(len(view))] == expected
+
+
+def peak_memory(func, *args):
+    """Fonksiyonun çalışırken ulaştığı en yüksek bellek (bayt)"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_streaming():
+    """Dosyadan akışlı tokenize: tepe bellek dosya boyutundan bağımsız kalmalı"""
+    lexer = Lexer()
+
+    def read_all(path):
+        with open(path, encoding='utf-8') as source:
+            lexer.tokenize(source.read())
+
+    def stream(path):
+        with open(path, 'rb') as source:
+            for _ in lexer.iter_tokens(source):
+                pass
+
+    for line_count in SIZES:
+        with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False, encoding='utf-8') as handle:
+            handle.write(make_source(line_count))
+        try:
+            size = os.path.getsize(handle.name)
+            print(f"{line_count:>7} satır ({size / 1e6:.1f} MB): "
+                  f"tokenize {peak_memory(read_all, handle.name) / 1e6:7.1f} MB tepe, "
+                  f"iter_tokens {peak_memory(stream, handle.name) / 1e6:7.2f} MB tepe, "
+                  f"{timed(stream, handle.name, repeat=1) * 1000:.0f} ms")
+        finally:
+            os.unlink(handle.name)
+
+
+def bench_token_buffer():
+    """Token başına bellek: demet listeleri ve TokenBuffer"""
+    lexer = Lexer()
+    for line_count in SIZES:
+        code = make_source(line_count)
+        tuples = lexer.tokenize_with_escape_highlighting(code)
+        positioned = lexer.tokenize_with_positions(code)
+        buffer = TokenBuffer.from_code(code, lexer)
+        count = len(buffer)
+        # analiz önbelleğinin yolu: düz Token listesinden sütunlar, sütunlardan escape görünümü
+        plain = TokenBuffer.from_tokens(code, lexer.attach_positions(lexer.tokenize(code), LineIndex(code)))
+        loaded = TokenBuffer.from_columns(code, plain.kinds, plain.starts, plain.ends)
+        assert loaded.lines == plain.lines and list(loaded) == lexer.tokenize(code)
+        assert loaded.escaped_tokens(lexer.string_part_offsets) == tuples
+        print(f"{line_count:>7} satır, {count} token: "
+              f"demet {token_list_memory(tuples) / count:6.1f} B/token, "
+              f"Token {token_list_memory(positioned) / count:6.1f} B/token, "
+              f"TokenBuffer {buffer.memory_usage() / count:5.1f} B/token")
+
+
+def bench_views():
+    """Düz ve escape görünümleri: iki ayrı tarama ile tek tarama"""
+    lexer = Lexer()
+
+    def two_scans(code):
+        lexer.tokenize(code)
+        lexer.tokenize_with_escape_highlighting(code)
+
+    for line_count in SIZES[:2]:
+        code = make_source(line_count)
+        report("tokenize + escape (2 tarama)", line_count, timed(two_scans, code))
+        report("tokenize_views (1 tarama)", line_count, timed(lexer.tokenize_views, code))
+
+
+# Arka uçların Lexer ile aynı çıktıyı vermesi gereken sorunlu girdiler
+EDGE_SOURCES = [
+    '$', 'x = 1 ? 2', 'name = "unclosed', "s = 'a\\'b' @\n", 'if x:\n\tpass\r\n',
+    '   \n\n', 'é = 1', '1abc = 2', 'x=1.5.3', 'a.b ** 2', 'x += 1', 'f"{x}"',
+    'if x:\n  y = 1\n z = 2', '# yalnız yorum',
+]
+
+
+def lexer_output(lexer, code):
+    """scan_spans ve tokenize çıktıları; hata verirse mesajı"""
+    try:
+        return list(lexer.scan_spans(code)), lexer.tokenize(code)
+    except ValueError as error:
+        return str(error)
+
+
+def assert_same_output(lexer_class, sources):
+    """Verilen arka uç her kaynakta, iki kipte de Lexer ile aynı çıktıyı vermeli"""
+    for recover in (False, True):
+        for code in sources:
+            expected = lexer_output(Lexer(recover), code)
+            assert lexer_output(lexer_class(recover), code) == expected, (lexer_class.__name__, recover, code)
+
+
+def bench_dispatch():
+    """Alternasyon regex'i ile ilk karakter dallanmalı tarayıcı"""
+    def drain(spans):
+        for _ in spans:
+            pass
+
+    assert_same_output(DispatchLexer, [make_source(SIZES[0])] + EDGE_SOURCES)
+    for line_count in SIZES[:2]:
+        code = make_source(line_count)
+        for lexer in (Lexer(), DispatchLexer()):
+            name = type(lexer).__name__
+            report(f"{name}.scan_spans", line_count, timed(lambda: drain(lexer.scan_spans(code))))
+            report(f"{name}.tokenize", line_count, timed(lexer.tokenize, code))
+
+
+def bench_stdlib():
+    """Regex, dallanmalı ve standart kütüphane C tokenizer arka uçları"""
+    def drain(spans):
+        for _ in spans:
+            pass
+
+    def falls_back(code):
+        lexer = StdlibLexer(recover=True)
+        drain(lexer.scan_spans(code))
+        return lexer.fallback_count > 0
+
+    # C tokenizer'ın çevrildiği kaynaklar; EDGE_SOURCES'taki diğer her girdi Lexer'a döner
+    direct = [make_source(SIZES[0]), '   \n\n', 'x = (1, 2)  # yorum\nif x: y = "a\\"b"\n',
+              'while x >= 0:\n    x = x - 1\n']
+    assert_same_output(StdlibLexer, direct + EDGE_SOURCES)
+    assert not any(falls_back(code) for code in direct)
+    assert all(falls_back(code) for code in EDGE_SOURCES if code not in direct)
+    for line_count in SIZES[:2]:
+        code = make_source(line_count)
+        for lexer in (Lexer(), DispatchLexer(), StdlibLexer()):
+            name = type(lexer).__name__
+            report(f"{name}.scan_spans", line_count, timed(lambda: drain(lexer.scan_spans(code))))
+            report(f"{name}.tokenize", line_count, timed(lexer.tokenize, code))
+    # geçersiz karakter içeren kodda StdlibLexer Lexer'a geri döner
+    lexer = StdlibLexer(recover=True)
+    code = make_source(SIZES[1]) + '\n$'
+    report("StdlibLexer (geri dönüş)", SIZES[1], timed(lexer.tokenize, code))
+    print(f"geri dönüş sayısı: {lexer.fallback_count}")
+
+
+def retained_memory(build):
+    """build() sonucunun bellekte tuttuğu bayt sayısı (sonuç canlı tutulurken)"""
+    tracemalloc.start()
+    try:
+        result = build()
+        return tracemalloc.get_traced_memory()[0], result
+    finally:
+        tracemalloc.stop()
+
+
+def bench_interning():
+    """Parse ağacı ve token tablosu canlıyken token başına bellek"""
+    line_count = SIZES[1]
+    code = make_source(line_count)
+    lexer = Lexer()
+
+    def build():
+        tokens, escaped = lexer.tokenize_views(code)
+        table = lexer.attach_positions(escaped, LineIndex(code))
+        trees = []
+        # Parser tek seferde en fazla 1000 ifade kabul ettiği için 500 satırlık bloklar halinde
+        first = 0
+        for block_end in range(500, line_count + 500, 500):
+            last = first
+            while last < len(tokens) and tokens[last][2][0] <= block_end:
+                last += 1
+            parser = Parser(tokens[first:last])
+            parser.parse()
+            trees.append(parser.tree)
+            first = last
+        return tokens, table, trees
+
+    size, (tokens, table, trees) = retained_memory(build)
+    count = len(table)
+    print(f"{line_count} satır, {count} token: token + tablo + ağaç {size / 1e6:.1f} MB, "
+          f"{size / count:.1f} B/token")
+
+
+# İfade ağırlıklı satırlar: her işlenen için tüm öncelik seviyeleri dolaşılır
+EXPRESSION_LINES = [
+    'y = a + b * c - d / e + f * (g - h) * i',
+    'if a > b and c < d or e == f and not g: z = (a + 1) * (b - 2) / c',
+    'total = total + price * count - discount / 2 + tax * rate',
+    'flag = x >= 1 and x <= 10 or y != 0 and y == z',
+    'print(a * b + c, len(items) - 1, (x + y) * (x - y))',
+]
+
+
+def bench_expressions():
+    """İfade ağırlıklı kodda parse süresi"""
+    lexer = Lexer()
+    # Parser tek seferde 1000'den az ifade kabul eder
+    line_count = 500
+    code = '\n'.join(EXPRESSION_LINES[i % len(EXPRESSION_LINES)] for i in range(line_count))
+    tokens = lexer.tokenize(code)
+
+    def parse():
+        Parser(tokens).parse()
+
+    report("Parser.parse (ifade ağırlıklı)", line_count, timed(parse, repeat=20))
+
+
+def bench_stress():
+    """Yığınlı parser: 100k ifade ve 10k derinlikte iç içe yapılar, süre doğrusal kalmalı"""
+    lexer = Lexer()
+
+    def parse(tokens):
+        parser = Parser(tokens, iterative=True)
+        parser.parse()
+        return parser.tree
+
+    for count in (10000, 100000):
+        tokens = lexer.tokenize(make_source(count))
+        tree = parse(tokens)
+        statements = len(tree[0][1])
+        assert statements >= count, statements
+        report(f"{statements} ifade", count, timed(parse, tokens, repeat=1))
+
+    nested = {
+        'NotExpr': lambda depth: 'x = ' + 'not ' * depth + 'y',
+        'ParenExpr': lambda depth: 'x = ' + '(' * depth + 'y' + ')' * depth,
+        'ListLiteral': lambda depth: 'x = ' + '[' * depth + ']' * depth,
+        'FunctionCall': lambda depth: 'x = ' + 'f(' * depth + 'y' + ')' * depth,
+        'ExceptClause': lambda depth: 'try: x = 1\n' + 'except: y = 2\n' * depth,
+        # ifade gövdeleri de yığınla ayrıştırılır
+        'IfStatement': lambda depth: 'if x: ' * depth + 'pass',
+        'WhileStatement': lambda depth: 'while x: ' * depth + 'pass',
+    }
+    for name, make in nested.items():
+        for depth in (1000, 10000):
+            tokens = lexer.tokenize(make(depth))
+            seconds = timed(parse, tokens, repeat=1)
+            # ağacın en derin düğümüne kadar in: derinlik girdiyle aynı olmalı
+            node, levels = parse(tokens)[0], 0
+            while isinstance(node, Node):
+                if node.type == name:
+                    levels += 1
+                if not (isinstance(node.value, tuple) and node.value):
+                    break
+                node = node.value[-1]
+                if isinstance(node, list):  # FunctionCall: [ad, argümanlar]
+                    node = node[-1] if node else None
+            assert levels == depth, (name, levels)
+            print(f"{name:<14} derinlik {depth:>6}  {seconds * 1000:8.1f} ms  "
+                  f"{seconds / depth * 1e6:6.2f} µs/seviye")
+    try:
+        Parser(lexer.tokenize(nested['ParenExpr'](10000))).parse()
+        print("özyinelemeli parser: 10000 derinlik ayrıştırıldı")
+    except RecursionError:
+        print(f"özyinelemeli parser: 10000 derinlikte RecursionError (sınır {sys.getrecursionlimit()})")
+
+
+def bench_reparse():
+    """Tek satırlık düzenlemeden sonra tam ve artımlı ayrıştırma; artımlı süre
+    tarayıcı düzenlemesini ve token görünümünü de içerir, boyuttan bağımsız kalmalı"""
+    lexer = Lexer()
+    costs = []
+    for line_count in SIZES:
+        code = make_source(line_count)
+        # ortadaki ilk 'a + b' 'a + b * c' olur
+        offset = code.index('a + b', len(code) // 2) + len('a + b')
+        edited_code = code[:offset] + ' * c' + code[offset:]
+        after = lexer.tokenize(edited_code)
+        line_start = edited_code.rfind('\n', 0, offset) + 1
+        statement = lexer.tokenize(edited_code[line_start:edited_code.find('\n', offset)])
+        expected = Parser(lexer.attach_positions(after, LineIndex(edited_code)), iterative=True)
+        expected.parse()
+
+        def full():
+            Parser(after, iterative=True).parse()
+
+        def one_statement():
+            Parser(statement, iterative=True).parse()
+
+        incremental_lexer = IncrementalLexer(lexer)
+        parser = IncrementalParser()
+        # soğuk ilk güncelleme görünümü pencere pencere okur, tümünü bir kerede değil
+        incremental_lexer.reset(code)
+        view = incremental_lexer.line_tokens()
+        spans = []
+        positioned = view.positioned
+
+        def counted(first, last):
+            spans.append(last - first)
+            return positioned(first, last)
+
+        view.positioned = counted
+        IncrementalParser().update(view)
+        assert max(spans) < len(incremental_lexer.lines), max(spans)
+
+        def incremental():
+            incremental_lexer.reset(code)
+            parser.update(incremental_lexer.line_tokens())
+            start = time.perf_counter()
+            # Document'in yolu: tarayıcı düzenlemesi, görünüm ve yeniden taranan satır aralığı
+            old_count = len(incremental_lexer.lines)
+            first, last = incremental_lexer.edit(offset, 0, ' * c')
+            parser.update(incremental_lexer.line_tokens(), (first, last, len(incremental_lexer.lines) - old_count))
+            return time.perf_counter() - start
+
+        incremental_seconds = min(incremental() for _ in range(5))
+        assert parser.tree == expected.tree
+        costs.append(incremental_seconds)
+        print(f"{line_count:>7} satır: tam {timed(full, repeat=1) * 1000:8.1f} ms, "
+              f"artımlı {incremental_seconds * 1000:6.2f} ms "
+              f"({parser.reused}/{len(parser.nodes)} ifade yeniden kullanıldı), "
+              f"tek ifade {timed(one_statement) * 1000:.3f} ms")
+    assert costs[-1] < costs[0] * 5, costs
+
+
+def legacy_tree(item):
+    """Node ağacını eski ("Tür", değer) demet/liste biçimine çevir"""
+    if isinstance(item, Node):
+        value = item.value
+        return (item.type, [legacy_tree(child) for child in value] if isinstance(value, tuple) else value)
+    if isinstance(item, list):
+        return [legacy_tree(child) for child in item]
+    return item
+
+
+def bench_nodes():
+    """Slotlu Node ağacı ile eski demet ağacının düğüm başına belleği"""
+    line_count = SIZES[1]
+    code = make_source(line_count)
+    lexer = Lexer()
+    tokens = lexer.attach_positions(lexer.tokenize(code), LineIndex(code))
+
+    def parse():
+        parser = Parser(tokens, iterative=True)
+        parser.parse()
+        return parser.tree
+
+    tree = parse()
+    count, stack = 0, list(tree)
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children())
+    del tree
+    for label, build in (("demet ağacı (aralıksız)", lambda: legacy_tree(parse()[0])),
+                         ("Node ağacı (aralıklı)", parse)):
+        size, _ = retained_memory(build)
+        print(f"{label:<26} {count} düğüm  {size / 1e6:6.2f} MB  {size / count:6.1f} B/düğüm")
+
+
+def bench_recovery():
+    """Hatalı satırlar içeren kodda panik modlu ayrıştırma: her hata ayrı ve dar aralıklı"""
+    lexer = Lexer()
+    typo = 'y = (1 + = 2'
+    for line_count in SIZES[:2]:
+        lines = make_source(line_count).split('\n')
+        for index in range(line_count // 10, line_count, line_count // 5):
+            lines[index] = typo
+        code = '\n'.join(lines)
+        tokens = lexer.attach_positions(lexer.tokenize(code), LineIndex(code))
+
+        def parse():
+            parser = Parser(tokens, iterative=True, recover=True)
+            parser.parse()
+            return parser
+
+        parser = parse()
+        assert len(parser.errors) == 5, parser.errors
+        assert all(code[error.start:error.end] in typo for error in parser.errors)
+        tagged = sum(error.end - error.start for error in parser.errors)
+        report(f"{len(parser.errors)} hata, {tagged}/{len(code)} karakter", line_count,
+               timed(parse, repeat=1))
+
+        # hatasız koddan tek hatalı satıra geçiş ve geri dönüş artımlı ayrıştırmada
+        # (tarayıcı düzenlemesi ve token görünümü dahil)
+        clean_code = make_source(line_count)
+        lines = clean_code.split('\n')
+        line_start = sum(map(len, lines[:line_count // 2])) + line_count // 2
+        old_line = lines[line_count // 2]
+        incremental_lexer = IncrementalLexer(lexer)
+        incremental_lexer.reset(clean_code)
+        incremental = IncrementalParser(recover=True)
+        incremental.update(incremental_lexer.line_tokens())
+
+        def replace_line(removed, inserted):
+            first, last = incremental_lexer.edit(line_start, len(removed), inserted)
+            incremental.update(incremental_lexer.line_tokens(), (first, last, 0))
+
+        start = time.perf_counter()
+        replace_line(old_line, typo)
+        assert len(incremental.errors) == 1, incremental.errors
+        replace_line(typo, old_line)
+        assert not incremental.errors
+        print(f"{'artımlı: hata ekle + düzelt':<32} {line_count:>7} satır  "
+              f"{(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def bench_grammar():
+    """Gramer tabloları tutarlı mı; tablo ile ifade seçimi yapan parser'ın ifade başına süresi"""
+    started = time.perf_counter()
+    problems = grammar.check()
+    print(f"grammar.check: {len(problems)} sorun ({(time.perf_counter() - started) * 1000:.1f} ms)")
+    for problem in problems:
+        print(f"  {problem}")
+    # her üretimden bir ifade: seçim if/elif zinciri yerine tek sözlük aramasıyla yapılır
+    lines = ['raise ValueError', 'pass', 'x = 1', 'return True', 'while x: break',
+             'for i in x: continue', '# yorum', 'print(x)', 'match x: case 1: pass']
+    line_count = SIZES[1]
+    tokens = Lexer().tokenize('\n'.join(lines[i % len(lines)] for i in range(line_count)))
+
+    def parse():
+        Parser(tokens, iterative=True).parse()
+
+    report("Parser.parse (ifade seçimi)", line_count, timed(parse))
+
+
+class CountingTreeview:
+    """Tk olmadan ölçüm için Treeview arayüzü; Tk çağrılarını sayar.
+
+    yview, top'tan başlayan height kök satırını görünür sayar.
+    """
+    def __init__(self, height=40):
+        self.items = {"": []}
+        self.data = {}
+        self.calls = 0
+        self.created = 0
+        self.height = height
+        self.top = 0
+
+    def insert(self, parent, index, values=(), tags=(), **options):
+        self.calls += 1
+        self.created += 1
+        item = f"I{self.created:06X}"
+        children = self.items[parent]
+        children.insert(len(children) if index == "end" else index, item)
+        self.items[item] = []
+        self.data[item] = (parent, tuple(values), tuple(tags))
+        return item
+
+    def item(self, item, values=None, tags=None, **options):
+        self.calls += 1
+        parent, old_values, old_tags = self.data[item]
+        if values is None and tags is None and not options:
+            return {"values": list(old_values), "tags": list(old_tags)}
+        self.data[item] = (parent, old_values if values is None else tuple(values),
+                           old_tags if tags is None else tuple(tags))
+
+    def get_children(self, item=""):
+        self.calls += 1
+        return tuple(self.items[item])
+
+    def exists(self, item):
+        self.calls += 1
+        return item in self.data
+
+    def parent(self, item):
+        self.calls += 1
+        return self.data[item][0]
+
+    def delete(self, *items):
+        self.calls += 1
+        for item in items:
+            stack = [item]
+            while stack:
+                current = stack.pop()
+                stack.extend(self.items.pop(current))
+                parent = self.data.pop(current)[0]
+                if parent in self.items and current in self.items[parent]:
+                    self.items[parent].remove(current)
+
+    def yview(self):
+        self.calls += 1
+        count = len(self.items[""]) or 1
+        return self.top / count, min(self.top + self.height, count) / count
+
+    def yview_moveto(self, fraction):
+        self.calls += 1
+        self.top = int(fraction * len(self.items[""]) + 0.5)
+
+    def rows(self, item="", depth=0):
+        """Yer tutucu ve gruplar atlanarak (derinlik, değerler, etiketler) sırası"""
+        rows = []
+        for child in self.items[item]:
+            _, values, tags = self.data[child]
+            if "group" in tags:
+                rows.extend(self.rows(child, depth))
+            elif "placeholder" not in tags:
+                rows.append((depth, values, tags))
+                rows.extend(self.rows(child, depth + 1))
+        return rows
+
+    def node_items(self, item=""):
+        """rows() sırasıyla düğüm öğeleri"""
+        items = []
+        for child in self.items[item]:
+            tags = self.data[child][2]
+            if "group" in tags:
+                items.extend(self.node_items(child))
+            elif "placeholder" not in tags:
+                items.append(child)
+                items.extend(self.node_items(child))
+        return items
+
+
+def bench_treeview():
+    """Ağaç Yapısı sekmesi: tüm düğümleri ekleme ile tembel ekleme"""
+    lexer = Lexer()
+    for line_count in SIZES[:2]:
+        code = make_source(line_count)
+        parser = Parser(lexer.attach_positions(lexer.tokenize(code), LineIndex(code)), iterative=True)
+        parser.parse()
+        for label, lazy in (("tüm düğümler", False), ("tembel", True)):
+            treeview = CountingTreeview()
+            seconds = timed(TreeviewNodes(treeview).populate, parser.tree, lazy, repeat=1)
+            print(f"{label:<14} {line_count:>7} satır  {seconds * 1000:8.1f} ms  "
+                  f"{len(treeview.data):>6} öğe  {treeview.calls:>6} Tk çağrısı")
+        # tüm öğeler açıldığında tembel ağaç tam ağaçla aynı olmalı
+        lazy_view = CountingTreeview()
+        lazy_nodes = TreeviewNodes(lazy_view)
+        lazy_nodes.populate(parser.tree, lazy=True)
+        while lazy_nodes.lazy_items:
+            lazy_nodes.expand(next(iter(lazy_nodes.lazy_items)))
+        full_view = CountingTreeview()
+        TreeviewNodes(full_view).populate(parser.tree)
+        assert lazy_view.rows() == full_view.rows()
+
+
+def token_rows(lexer, code):
+    """Analiz panelindeki token tablosunun satırları"""
+    return [((token_type, value, line, col), (token_type.lower(),))
+            for token_type, value, (line, col) in lexer.tokenize_views(code)[1]]
+
+
+def bench_panes():
+    """Analiz paneli: her düzenlemede tabloları silip yeniden doldurma ile farkla güncelleme"""
+    lexer = DispatchLexer()
+    line_count = SIZES[1]
+    lines = make_source(line_count).split('\n')
+    middle = line_count // 2
+    edits = [
+        ("karakter yaz", lines[:middle] + [lines[middle].replace('add', 'adds', 1)] + lines[middle + 1:]),
+        ("satır ekle", lines[:middle] + ['z = 1'] + lines[middle:]),
+        ("satır sil", lines[:middle] + lines[middle + 1:]),
+        ("ifade böl", lines[:middle] + ['if x > 10:', '    y = 1'] + lines[middle + 1:]),
+    ]
+    code = '\n'.join(lines)
+    rows = token_rows(lexer, code)
+
+    def parse(parser, source):
+        parser.update(lexer.attach_positions(lexer.tokenize(source), LineIndex(source)))
+
+    for label, edited_lines in edits:
+        edited = '\n'.join(edited_lines)
+        edited_rows = token_rows(lexer, edited)
+
+        token_view = CountingTreeview()
+        token_sync = TreeviewRows(token_view, shift_key=lambda row: (row[0][0], row[0][1], row[0][3], row[1]))
+        token_sync.update(rows)
+        token_view.top = line_count  # görünür satırlar düzenlemenin altında
+        token_view.calls = 0
+        token_sync.update(edited_rows)
+        immediate = token_view.calls
+        deferred = len(token_sync.pending)
+        # tablo baştan sona kaydırılınca tüm satırlar güncellenmiş olmalı
+        token_sync.show_range(0, 1)
+        assert [token_view.data[item][1:] for item in token_view.items[""]] == edited_rows
+        # düzenleme görünür satırların üstündeyse üstteki satır yerinde kalır
+        token_view.top = len(rows) - 100
+        top_item = token_view.items[""][token_view.top]
+        token_sync.update(rows)
+        assert token_view.items[""][token_view.top] == top_item
+
+        parser = IncrementalParser(recover=True)
+        parse(parser, code)
+        tree_view = CountingTreeview()
+        tree_nodes = TreeviewNodes(tree_view)
+        tree_nodes.sync(parser.tree)
+        # açılmış bir grup düzenlemeden etkilenmiyorsa açık kalmalı
+        last_group = tree_nodes.top_items[-1]
+        tree_nodes.expand(last_group)
+        tree_view.calls = 0
+        parse(parser, edited)
+        tree_nodes.sync(parser.tree)
+        assert last_group in tree_view.data and last_group not in tree_nodes.lazy_items
+        tree_calls = tree_view.calls
+
+        # tüm öğeler açıldığında sıfırdan doldurulmuş ağaçla aynı satır ve aralıklar
+        while tree_nodes.lazy_items:
+            tree_nodes.expand(next(iter(tree_nodes.lazy_items)))
+        fresh = Parser(lexer.attach_positions(lexer.tokenize(edited), LineIndex(edited)), iterative=True,
+                       recover=True)
+        fresh.parse()
+        fresh_view = CountingTreeview()
+        fresh_nodes = TreeviewNodes(fresh_view)
+        fresh_nodes.populate(fresh.tree)
+        assert tree_view.rows() == fresh_view.rows()
+        assert [tree_nodes.item_span(item) for item in tree_view.node_items()] == \
+            [fresh_nodes.item_span(item) for item in fresh_view.node_items()]
+
+        print(f"{label:<14} tokenlar: {len(edited_rows) + 1:>6} → {immediate:>3} Tk çağrısı "
+              f"({deferred:>5} satır görününce)   ağaç: {tree_calls:>3} Tk çağrısı")
+
+
+class CountingText:
+    """Tk olmadan Highlighter ölçümü için Text arayüzü; Tk çağrılarını sayar.
+
+    Etiketler Tk'daki gibi karakter kümeleridir (birleşmiş ofset aralıkları)
+    ve insert_at/delete_at düzenlemelerinde Tk gibi davranır: silinen
+    karakterler aralıklardan düşer, eklenen metin iki yanında da bulunan
+    etiketleri alır. Satırlar 1 piksel yüksekliğinde sayılır: görünür alan
+    top'tan başlayan height satırdır. Hata etiketi için Label yerine de
+    kullanılabilir.
+    """
+    def __init__(self, code="", height=40):
+        self.code = code
+        self.lines = LineIndex(code)
+        self.height = height
+        self.top = 1
+        self.tags = {}
+        self.calls = 0
+        # tag add/remove çağrıları ve bunlara verilen aralık sayısı
+        self.tag_calls = 0
+        self.tag_range_count = 0
+        # tk.call(self._w, 'tag', 'remove', ...) için
+        self.tk = self
+        self._w = '.text'
+        # after_idle ile sıraya konan işler (update_idletasks çalıştırır)
+        self.idle = []
+        # Tk'daki widget komutu vekili gibi düzenlemeleri EditDelta olarak bildirir
+        self.edit_proxy = EditSource()
+
+    def get(self, start, end):
+        self.calls += 1
+        return self.code + '\n'
+
+    def index(self, index):
+        self.calls += 1
+        line = self.top + int(index.split(',')[1])
+        return f"{min(line, len(self.lines.starts))}.0"
+
+    def winfo_exists(self):
+        self.calls += 1
+        return True
+
+    def winfo_height(self):
+        self.calls += 1
+        return self.height
+
+    def offset(self, index):
+        """'satır.sütun', 'satır.0+Nc' veya 'end' indeksinden ofset"""
+        if index == 'end':
+            return len(self.code) + 1
+        base, _, chars = index.partition('+')
+        line, column = base.split('.')
+        return self.lines.starts[int(line) - 1] + int(column) + (int(chars[:-1]) if chars else 0)
+
+    def ranges(self, indices):
+        ranges = []
+        for position in range(0, len(indices), 2):
+            start, end = self.offset(indices[position]), self.offset(indices[position + 1])
+            # Tk boş aralıkta komutun kalanını sessizce atlar
+            assert start < end, f"empty tag range {indices[position]}-{indices[position + 1]}"
+            ranges.append((start, end))
+        self.tag_calls += 1
+        self.tag_range_count += len(ranges)
+        return ranges
+
+    def tag_add(self, tag, *indices):
+        self.calls += 1
+        self.tags[tag] = merge_ranges(sorted(self.tags.get(tag, []) + self.ranges(indices)))
+
+    def tag_remove(self, tag, *indices):
+        self.calls += 1
+        kept = complement_ranges(merge_ranges(sorted(self.ranges(indices))), 0, len(self.code) + 1)
+        result = []
+        position = 0
+        for start, end in self.tags.get(tag, []):
+            while position < len(kept) and kept[position][1] <= start:
+                position += 1
+            index = position
+            while index < len(kept) and kept[index][0] < end:
+                result.append((max(start, kept[index][0]), min(end, kept[index][1])))
+                index += 1
+        self.tags[tag] = result
+
+    def call(self, widget, command, subcommand, *args):
+        assert (command, subcommand) == ('tag', 'remove')
+        self.tag_remove(*args)
+
+    def tag_ranges(self, tag):
+        self.calls += 1
+        return [self.lines.tk_index(pos) for tag_range in self.tags.get(tag, ()) for pos in tag_range]
+
+    def tags_in_lines(self, first, last):
+        """[first, last] satırlarında başlayan (etiket, başlangıç, bitiş) kümesi"""
+        tk_index = self.lines.tk_index
+        return {(tag, tk_index(start), tk_index(end)) for tag, ranges in self.tags.items()
+                for start, end in ranges
+                if tag != 'ERROR' and first <= self.lines.line_of(start) + 1 <= last}
+
+    def insert_at(self, offset, text):
+        """Tk insert'i gibi: iki yanı da etiketli konuma eklenen metin etiketi alır"""
+        length = len(text)
+        index, column = self.lines.tk_index(offset), self.lines.line_column(offset)[1] - 1
+        self.code = self.code[:offset] + text + self.code[offset:]
+        self.lines = LineIndex(self.code)
+        self.edit_proxy.emit(EditDelta(index, column, '', text))
+        for tag, ranges in self.tags.items():
+            self.tags[tag] = [(start if start < offset else start + length, end if end <= offset else end + length)
+                              for start, end in ranges]
+
+    def delete_at(self, first, last):
+        """Tk delete'i gibi: silinen karakterler aralıklardan düşer"""
+        length = last - first
+        index, removed = self.lines.tk_index(first), self.code[first:last]
+        column = self.lines.line_column(first)[1] - 1
+        self.code = self.code[:first] + self.code[last:]
+        self.lines = LineIndex(self.code)
+        self.edit_proxy.emit(EditDelta(index, column, removed, ''))
+
+        def moved(pos):
+            return pos if pos <= first else max(first, pos - length)
+        for tag, ranges in self.tags.items():
+            self.tags[tag] = merge_ranges((moved(start), moved(end)) for start, end in ranges)
+
+    def tag_configure(self, *args, **options):
+        self.calls += 1
+
+    def tag_raise(self, *args):
+        self.calls += 1
+
+    def config(self, **options):
+        self.calls += 1
+
+    def bind(self, *args, **options):
+        self.calls += 1
+
+    def after(self, delay, func):
+        self.calls += 1
+
+    def after_idle(self, func):
+        self.calls += 1
+        self.idle.append(func)
+
+    def update_idletasks(self):
+        """Tk'daki gibi: boşta çalışacak işleri çalıştır"""
+        while self.idle:
+            self.idle.pop(0)()
+
+
+def bench_viewport():
+    """Vurgulama: tüm belgeyi etiketleme ile yalnızca görünür alanı etiketleme"""
+    for line_count in SIZES:
+        code = make_source(line_count)
+        full_text = CountingText(code)
+        full = Highlighter(full_text, CountingText())
+        full_seconds = timed(full.highlight, repeat=1)
+        viewport_text = CountingText(code)
+        viewport = Highlighter(viewport_text, CountingText(), viewport=True)
+        viewport_seconds = timed(viewport.highlight, repeat=1)
+        print(f"tüm belge      {line_count:>7} satır  {full_seconds * 1000:8.1f} ms  "
+              f"{full_text.tag_range_count:>7} etiket aralığı")
+        print(f"görünür alan   {line_count:>7} satır  {viewport_seconds * 1000:8.1f} ms  "
+              f"{viewport_text.tag_range_count:>7} etiket aralığı")
+        # ortaya kaydırınca yalnızca yeni görünen satırlar etiketlenir; sonuç tüm belgeyle aynı
+        for top in (line_count // 2, line_count // 2 + 20, line_count - 10):
+            viewport_text.tag_range_count = 0
+            viewport_text.top = top
+            viewport.schedule_visible_highlight()
+            viewport_text.update_idletasks()
+            last = top + viewport_text.height
+            assert viewport_text.tags_in_lines(top, last) == full_text.tags_in_lines(top, last)
+            print(f"  kaydırma → {top:>6}. satır: {viewport_text.tag_range_count:>4} etiket aralığı")
+        viewport_text.tag_calls = 0
+        viewport.schedule_visible_highlight()
+        viewport_text.update_idletasks()
+        assert viewport_text.tag_calls == 0
+
+
+def bench_tag_updates():
+    """Vurgulama: tuş başına Tk çağrıları (her etiket için tek çağrı, yalnızca değişen satırlar)"""
+    typed = 'total_2 = x + 1'
+    for line_count in SIZES:
+        code = make_source(line_count)
+        for viewport in (False, True):
+            text = CountingText(code)
+            label = CountingText()
+            highlighter = Highlighter(text, label, viewport=viewport)
+            highlighter.highlight()
+            text.top = line_count // 2
+            highlighter.schedule_visible_highlight()
+            text.update_idletasks()
+            position = text.lines.starts[line_count // 2]
+            # önceki yol: tüm etiketleri silip her tokenı ayrı tag_add ile eklemek
+            tagged = sum(1 for line_tokens in highlighter.applied_lines if line_tokens
+                         for token_type, _, _ in line_tokens if token_type in highlighter.syntax_colors)
+            previous = len(highlighter.syntax_colors) + tagged
+            keystrokes = [('insert', char) for char in typed + '\n'] + [('delete', None)] * 4 + \
+                [('insert', '"'), ('delete', None)]
+            calls, tag_calls, ranges = [], [], []
+            for kind, char in keystrokes:
+                if kind == 'insert':
+                    text.insert_at(position, char)
+                    position += 1
+                else:
+                    text.delete_at(position - 1, position)
+                    position -= 1
+                text.calls = label.calls = text.tag_calls = text.tag_range_count = 0
+                highlighter.highlight()
+                calls.append(text.calls + label.calls)
+                tag_calls.append(text.tag_calls)
+                ranges.append(text.tag_range_count)
+            # sonuç her şeyi baştan etiketlemeyle aynı
+            fresh = CountingText(text.code)
+            Highlighter(fresh, CountingText()).highlight()
+            first, last = (text.top, text.top + text.height) if viewport else (1, line_count + 1)
+            assert text.tags_in_lines(first, last) == fresh.tags_in_lines(first, last)
+            mode = "görünür alan" if viewport else "tüm belge"
+            print(f"{mode:<13} {line_count:>7} satır  tuş başına {min(calls)}-{max(calls)} Tk çağrısı "
+                  f"(etiket: {min(tag_calls)}-{max(tag_calls)} çağrı, {max(ranges)} aralığa kadar)"
+                  + (f"  önceki yol: {previous}" if not viewport else ""))
+
+    # tek geçişe düşen birden fazla düzenleme (otomatik tamamlama: kelimeyi sil, tamamını ekle)
+    code = make_source(SIZES[0])
+    text = CountingText(code)
+    highlighter = Highlighter(text, CountingText())
+    highlighter.highlight()
+    start = text.code.index('total = sum')
+    text.insert_at(start + 5, 'x')
+    text.delete_at(start, start + 2)
+    text.insert_at(start, 'to')
+    highlighter.highlight()
+    fresh = CountingText(text.code)
+    Highlighter(fresh, CountingText()).highlight()
+    assert text.tags_in_lines(1, SIZES[0]) == fresh.tags_in_lines(1, SIZES[0])
+
+
+def bench_background():
+    """Vurgulama: büyük yapıştırmada ana iş parçacığının bekleme süresi (eşzamanlı / arka plan)"""
+    typed = 'x = 1'
+    # çöp toplayıcı açık kalır: toplamaların süresi ana iş parçacığının beklemesine eklenebilir
+    collections, started = [], []
+
+    def on_collection(phase, info):
+        if phase == 'start':
+            started.append(time.perf_counter())
+        else:
+            collections.append(time.perf_counter() - started.pop())
+
+    gc.callbacks.append(on_collection)
+    for line_count in SIZES:
+        code = make_source(line_count)
+        sync_text = CountingText()
+        sync = Highlighter(sync_text, CountingText(), viewport=True)
+        sync.highlight()
+        sync_text.insert_at(0, code)
+        blocked = timed(sync.highlight, repeat=1)
+
+        text = CountingText()
+        highlighter = Highlighter(text, CountingText(), viewport=True, background=True)
+        highlighter.highlight()
+        highlighter.worker.flush()
+        text.insert_at(0, code)
+        del collections[:]
+        submit = timed(highlighter.highlight, repeat=1)
+        # analiz sürerken olay döngüsü: tuş vuruşları ve sonuç yoklaması
+        longest, ticks = 0.0, 0
+        keystrokes = iter(typed)
+        while highlighter.worker.busy():
+            start = time.perf_counter()
+            char = next(keystrokes, None)
+            if char is not None:
+                text.insert_at(len(text.code), char)
+                highlighter.highlight()
+            highlighter.worker.poll()
+            longest = max(longest, time.perf_counter() - start)
+            ticks += 1
+            time.sleep(0.001)
+        for char in keystrokes:
+            text.insert_at(len(text.code), char)
+            highlighter.highlight()
+        assert highlighter.worker.flush(60)
+        # sonuç baştan eşzamanlı vurgulamayla aynı
+        fresh = CountingText(text.code)
+        Highlighter(fresh, CountingText()).highlight()
+        first, last = text.top, text.top + text.height
+        assert text.tags_in_lines(first, last) == fresh.tags_in_lines(first, last)
+        highlighter.worker.close()
+        print(f"{line_count:>7} satır  eşzamanlı: {blocked * 1000:8.1f} ms bekleme  "
+              f"arka plan: {submit * 1000:6.2f} ms bekleme, en uzun adım {longest * 1000:6.2f} ms "
+              f"({ticks} adım, {highlighter.worker.dropped} eski sonuç atıldı), "
+              f"{len(collections)} çöp toplama, en uzunu {max(collections, default=0) * 1000:.2f} ms")
+    gc.callbacks.remove(on_collection)
+
+
+class VirtualLoop:
+    """Sanal saatli Tk olay döngüsü: tuş olayları, after zamanlayıcıları ve
+    after_idle işleri Tk sırasıyla çalışır; geçişler saati süreleri kadar ilerletir"""
+    def __init__(self):
+        self.now = 0.0
+        self.timers = []
+        self.idle = []
+        self.order = 0
+
+    def clock(self):
+        return self.now
+
+    def after(self, delay, func):
+        self.order += 1
+        self.timers.append((self.now + delay / 1000, self.order, func))
+
+    def after_idle(self, func):
+        self.idle.append(func)
+
+    def bind(self, *args, **options):
+        pass
+
+    def winfo_exists(self):
+        return True
+
+    def run(self, keystrokes, on_key):
+        """Tuşlar geliş zamanlarında işlenir; dönen değer tuş başına bekleme süreleri"""
+        keystrokes = list(keystrokes)
+        waits = []
+        while keystrokes or self.timers or self.idle:
+            timer = min(self.timers) if self.timers else None
+            if keystrokes and keystrokes[0] <= self.now and (timer is None or keystrokes[0] <= timer[0]):
+                waits.append(self.now - keystrokes.pop(0))
+                on_key()
+            elif timer is not None and timer[0] <= self.now:
+                self.timers.remove(timer)
+                timer[2]()
+            elif self.idle:
+                self.idle.pop(0)()
+            else:
+                self.now = min(([keystrokes[0]] if keystrokes else []) + ([timer[0]] if timer else []))
+        return waits
+
+
+def bench_scheduler():
+    """Geçiş zamanlama: sabit 100 ms bekleme ile ölçülen süreye ve yazma hızına göre uyarlanan bekleme"""
+    # geçiş: (ana iş parçacığı süresi, arka plan süresi) sn; analiz iş parçacığında sürer,
+    # ana iş parçacığı sonucu uygular (etiketler, Treeview'lar)
+    costs = {'brackets': (0.0003, 0.0), 'highlight': (0.01, 0.12), 'analysis': (0.06, 0.4)}
+    # iki yazma patlaması (tuş aralığı 120 ms), arada 1,5 sn duraksama
+    keystrokes = [index * 0.12 for index in range(25)] + [4.5 + index * 0.12 for index in range(25)]
+
+    def simulate(adaptive):
+        loop = VirtualLoop()
+        runs = {name: [] for name in costs}
+        requests = {name: [] for name in costs}
+
+        def make_pass(name):
+            main_cost, background_cost = costs[name]
+
+            def run():
+                runs[name].append(loop.now)
+                loop.now += main_cost
+            return run
+
+        passes = {name: make_pass(name) for name in costs}
+        if adaptive:
+            scheduler = PassScheduler(loop, clock=loop.clock)
+            for name, (_, background_cost) in costs.items():
+                scheduler.add(name, passes[name], background=lambda cost=background_cost: cost)
+
+            def on_key():
+                scheduler.note_keystroke()
+                for name in costs:
+                    requests[name].append(loop.now)
+                    scheduler.schedule(name)
+        else:
+            scheduled = set()
+
+            def fixed(name):
+                def fire():
+                    scheduled.discard(name)
+                    passes[name]()
+                if name not in scheduled:
+                    scheduled.add(name)
+                    loop.after(100, fire)
+
+            def on_key():
+                for name in costs:
+                    requests[name].append(loop.now)
+                fixed('brackets')
+                fixed('highlight')
+                # update_line_numbers her olayda analizi bekletmeden istiyordu
+                passes['analysis']()
+
+        waits = loop.run(keystrokes, on_key)
+        busy = sum(len(runs[name]) * costs[name][0] for name in costs)
+        # iş parçacığına giden analizler (bekleme yuvası ardışık istekleri birleştirmese)
+        background = sum(len(runs[name]) * costs[name][1] for name in costs)
+        label = "uyarlanan" if adaptive else "sabit 100 ms"
+        print(f"{label:<13} tuş bekleme en fazla {max(waits) * 1000:5.1f} ms, ana iş parçacığı "
+              f"{busy * 1000:6.0f} ms, arka plan {background * 1000:6.0f} ms")
+        for name in costs:
+            # istekten sonraki ilk çalışmaya kadar geçen süre
+            latencies = []
+            for request in requests[name]:
+                later = [run for run in runs[name] if run >= request]
+                if later:
+                    latencies.append(later[0] - request)
+            print(f"  {name:<10} {len(runs[name]):>3} çalışma, istekten çalışmaya ortalama "
+                  f"{sum(latencies) / len(latencies) * 1000:7.1f} ms")
+        if adaptive:
+            for name, stats in scheduler.stats().items():
+                print(f"  {name:<10} ölçülen: ortalama {stats.average * 1000:6.2f} ms, "
+                      f"arka plan {stats.background * 1000:6.1f} ms, bekleme {stats.delay} ms")
+            assert all(runs[name] for name in costs)
+        # son istek de karşılanmış olmalı
+        assert all(runs[name][-1] >= requests[name][-1] for name in costs)
+        return busy, len(runs['brackets'])
+
+    fixed_busy, _ = simulate(False)
+    adaptive_busy, bracket_runs = simulate(True)
+    assert adaptive_busy < fixed_busy and bracket_runs == len(keystrokes)
+
+
+def bench_document():
+    """Tuş başına metin alma, tarama ve ayrıştırma: tüketicilerin ayrı ayrı yaptığı ile ortak Document"""
+    costs = []
+    for line_count in SIZES:
+        code = make_source(line_count)
+        lexer = DispatchLexer(recover=True)
+        strict_lexer = DispatchLexer()
+        highlight_lexer = IncrementalLexer(lexer)
+        highlight_lexer.update(code)
+        highlight_parser = IncrementalParser(recover=True)
+        panel_parser = IncrementalParser(recover=True)
+
+        def separate(text):
+            # vurgulayıcı: artımlı tarama ve ayrıştırma
+            highlight_parser.update((highlight_lexer.update(text.get('1.0', 'end').rstrip('\n')),
+                                     highlight_lexer.tokens_with_positions())[1])
+            # parantez eşleştirici ve otomatik tamamlayıcı: kendi kopyaları, tam tarama
+            text.get('1.0', 'end')
+            TokenBuffer.from_code(text.get('1.0', 'end').rstrip('\n'), lexer, escapes=False).values_of_kind('IDENTIFIER')
+            # analiz paneli: tam tarama ve ayrıştırma
+            panel_code = text.get('1.0', 'end').rstrip('\n')
+            tokens, _ = strict_lexer.tokenize_views(panel_code)
+            panel_parser.update(strict_lexer.attach_positions(tokens, LineIndex(panel_code)))
+
+        shared_text = CountingText(code)
+        document = Document(shared_text)
+        highlighter = Highlighter(shared_text, CountingText(), document=document)
+        brackets = BracketMatcher(shared_text, document=document)
+        completer = AutoCompleter(shared_text, document=document)
+        bracket_index = shared_text.lines.tk_index(code.index('('))
+
+        def shared(text):
+            highlighter.highlight()
+            brackets.find_matching_bracket(bracket_index, '(')
+            completer.find_matches('tot')
+            # analiz paneli: aynı görüntünün tokenları ve ağacı
+            snapshot = document.snapshot()
+            snapshot.tokens()
+            snapshot.parse()
+
+        separate_text = CountingText(code)
+        separate(separate_text)
+        shared(shared_text)
+        # ortadaki satırın sonuna yeni bir satır yazılır
+        position = shared_text.lines.starts[line_count // 2] - 1
+        typed = '\nx = 1'
+        for label, text, step in (("ayrı ayrı", separate_text, separate), ("ortak belge", shared_text, shared)):
+            before = (text.calls, document.fetches, document.lexes, document.parses)
+            seconds = 0.0
+            for index, char in enumerate(typed):
+                text.insert_at(position + index, char)
+                start = time.perf_counter()
+                step(text)
+                seconds += time.perf_counter() - start
+            if text is separate_text:
+                # yalnızca get çağrıları; üç tarama (vurgulayıcı, tamamlayıcı, panel), iki ayrıştırma
+                fetches, lexes, parses = text.calls - before[0], 3 * len(typed), 2 * len(typed)
+            else:
+                # metin Tk'dan alınmaz, vekilin bildirdiği düzenlemeler uygulanır
+                fetches, lexes, parses = (document.fetches - before[1], document.lexes - before[2],
+                                          document.parses - before[3])
+                assert (fetches, lexes, parses) == (0, len(typed), len(typed))
+                assert document.snapshot().text == text.code
+            print(f"{label:<12} {line_count:>7} satır  tuş başına {fetches / len(typed):.0f} metin alma, "
+                  f"{lexes / len(typed):.0f} tarama, {parses / len(typed):.0f} ayrıştırma, "
+                  f"{seconds / len(typed) * 1000:8.1f} ms")
+
+        # görüntünün taranması ve ayrıştırılması tek başına: satırlar ve ağaç kopyalanmaz,
+        # hatalı satırlar satır başına sayılardan bulunur; süre belge uzunluğundan bağımsız
+        def lex_and_parse():
+            snapshot = document.snapshot()
+            snapshot.lex()
+            snapshot.parse()
+
+        keystroke = None
+        for index, char in enumerate(typed):
+            shared_text.insert_at(position + len(typed) + index, char)
+            seconds = timed(lex_and_parse, repeat=1)
+            keystroke = seconds if keystroke is None else min(keystroke, seconds)
+        assert document.snapshot().tree is not None
+        costs.append(keystroke)
+        print(f"{'':<12} {line_count:>7} satır  tuş başına tarama ve ayrıştırma {keystroke * 1000:6.2f} ms")
+    assert costs[-1] < costs[0] * 5, costs
+
+
+def bench_edit_proxy():
+    """Gerçek Tk Text üzerinde düzenleme vekili: rastgele insert, delete, replace
+    ve geri almadan sonra Document metni widget'ınkiyle aynı kalmalı. Ekran
+    gerektirir (Linux'ta: xvfb-run python benchmark.py edit_proxy)"""
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        print(f"ekran yok, atlandı: {error}")
+        return
+    root.withdraw()
+    try:
+        text = tk.Text(root, undo=True)
+        text.insert('1.0', make_source(200))
+        document = Document(text)
+        document.snapshot()
+        rng = random.Random(24)
+        pieces = ('x', ' = 1', '\n', '(a, b)', '"s"', '\U0001F600', '\nif x:\n    y = 2\n')
+
+        def position():
+            line_count = int(text.index('end-1c').partition('.')[0])
+            return f"{rng.randint(1, line_count)}.{rng.randint(0, 40)}"
+
+        def inside():
+            # son satır sonundaki karakterin silinmesi 'end'e uzanır, bilinmeyen değişikliktir
+            index = position()
+            return index if text.compare(index, '<', 'end-1c') else '1.0'
+
+        def ordered():
+            first, last = position(), position()
+            return (first, last) if text.compare(first, '<=', last) else (last, first)
+
+        operations = {
+            'insert': lambda: text.insert(position(), rng.choice(pieces)),
+            'delete': lambda: text.delete(*ordered()),
+            'delete_char': lambda: text.delete(inside()),
+            'replace': lambda: text.replace(*ordered(), rng.choice(pieces)),
+            'insert_end': lambda: text.insert('end', rng.choice(pieces)),
+        }
+        known = unknown = 0
+        for step in range(2000):
+            fetches = document.fetches
+            if step % 50 == 49:
+                # geri alma ve 'end'e uzanan silme bilinmeyen değişikliktir: metin Tk'dan alınır
+                if step % 100 == 49:
+                    try:
+                        text.edit_undo()
+                    except tk.TclError:
+                        pass
+                else:
+                    text.delete(position(), 'end')
+                unknown += 1
+                expect_fetch = None
+            else:
+                name = rng.choice(list(operations))
+                operations[name]()
+                known += 1
+                expect_fetch = False
+            snapshot = document.snapshot()
+            widget_text = text.get('1.0', 'end-1c')
+            assert snapshot.text == widget_text, f"adım {step}: Document metni widget'tan koptu"
+            if expect_fetch is False:
+                assert document.fetches == fetches, f"adım {step}: bilinen düzenleme için metin alındı"
+            assert snapshot.lex()
+            assert document.incremental_lexer.code == snapshot.code, f"adım {step}: tarayıcı metni koptu"
+        print(f"{known} bilinen ve {unknown} bilinmeyen düzenleme: Document metni widget ile aynı "
+              f"(toplam {document.fetches} metin alma)")
+    finally:
+        root.destroy()
+
+
+def load_in_new_process(directory, code):
+    """Önbelleği ayrı bir Python sürecinde aç; kayıt diskten yüklenirse True"""
+    path = os.path.join(directory, 'source.py')
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        file.write(code)
+    script = ("import sys\n"
+              "from analysis_cache import AnalysisCache\n"
+              "from dispatch_lexer import DispatchLexer\n"
+              "with open(sys.argv[2], encoding='utf-8', newline='') as file:\n"
+              "    code = file.read()\n"
+              "sys.exit(AnalysisCache(sys.argv[1], lexer=DispatchLexer()).load(code) is None)\n")
+    result = subprocess.run([sys.executable, '-c', script, directory, path],
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    return result.returncode == 0
+
+
+def bench_cache():
+    """Analiz önbelleği: ilk analiz ile aynı içeriğin diskten yüklenmesi; LRU boyut sınırı"""
+    lexer = DispatchLexer()
+
+    def analyze(code):
+        tokens, escaped_tokens = lexer.tokenize_views(code)
+        positioned = lexer.attach_positions(tokens, LineIndex(code))
+        return positioned, escaped_tokens, IncrementalParser(recover=True).update(positioned)
+
+    def load(directory, code):
+        return AnalysisCache(directory, lexer=lexer).load(code)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for line_count in SIZES:
+            code = make_source(line_count)
+            cold = timed(analyze, code, repeat=1)
+            positioned, escaped_tokens, tree = analyze(code)
+            cache = AnalysisCache(directory, lexer=lexer)
+            cache.store(code, positioned, escaped_tokens, tree)
+            # store diske yazar: editörü yeniden açan ikinci süreç önbellekten yükler
+            assert load_in_new_process(directory, code)
+            # yeni oturum: bellekte kayıt yok, dosyadan okunur
+            warm = timed(load, directory, code, repeat=1)
+            loaded_tokens, loaded_tree = AnalysisCache(directory, lexer=lexer).load(code)
+            assert loaded_tokens == escaped_tokens and loaded_tree == tree
+            assert [(node.start, node.end) for node in tree_children(loaded_tree[0])] == \
+                [(node.start, node.end) for node in tree_children(tree[0])]
+            size = os.path.getsize(cache.path(cache.key(code)))
+            report("ilk analiz", line_count, cold)
+            report(f"önbellekten ({size / len(positioned):.1f} B/token)", line_count, warm)
+
+        # sınır aşılınca en uzun süredir okunmayan kayıt silinir
+        code = make_source(SIZES[0])
+        positioned, escaped_tokens, tree = analyze(code)
+        entry_size = os.path.getsize(cache.path(cache.key(code)))
+        cache = AnalysisCache(os.path.join(directory, 'lru'), max_bytes=entry_size * 3, lexer=lexer)
+        documents = [f"{code}\n# {index}" for index in range(5)]
+        for index, document in enumerate(documents):
+            cache.store(document, positioned, escaped_tokens, tree)
+            # WRITE_INTERVAL içindeki yazımlar beklemede kalır
+            cache.flush()
+            time.sleep(0.01)
+            # ilk belge her yazımdan sonra yeniden okunduğu için hep en yeni kalır
+            cache.recent = None
+            assert AnalysisCache(cache.directory, lexer=lexer).load(documents[0]) is not None
+        kept = [AnalysisCache(cache.directory, lexer=lexer).load(document) is not None for document in documents]
+        assert kept[0] and sum(kept) <= 3, kept
+        print(f"LRU: {cache.evictions} kayıt silindi, kalan {sum(kept)}/{len(documents)}")
+
+
+def bench_render():
+    """Başsız vurgulama: token başına etiketli tüm metni kurmak ile
+    birleştirilmiş aralıkları akışlı yazmak; çok sayıda küçük parça ve büyük belgeler"""
+    lexer = DispatchLexer(recover=True)
+    colors = light_theme['highlighter_colors']
+
+    def naive_html(code):
+        # her token için ayrı span; tüm çıktı tek dizge olarak kurulur
+        result = ''
+        pos = 0
+        for token in lexer.tokenize_with_positions(code):
+            result += html.escape(code[pos:token.start], False)
+            result += f'<span style="color:{colors.get(token.type, "#000000")}">' \
+                      f'{html.escape(token.value, False)}</span>'
+            pos = token.end
+        return result + html.escape(code[pos:], False)
+
+    class NullWriter:
+        def __init__(self):
+            self.size = 0
+            self.writes = 0
+
+        def write(self, text):
+            self.size += len(text)
+            self.writes += 1
+
+    renderers = {
+        'HTML': HtmlRenderer(light_theme, lexer),
+        'HTML koyu': HtmlRenderer(dark_theme, lexer),
+        'ANSI': AnsiRenderer(light_theme, lexer),
+        'ANSI 256': AnsiRenderer(dark_theme, lexer, true_color=False),
+    }
+    strip = {
+        'HTML': lambda text: re.sub(r'\n\Z', '', html.unescape(re.sub(r'<[^>]*>', '', text))),
+        'ANSI': lambda text: re.sub(r'\x1b\[[0-9;]*m', '', text),
+    }
+
+    # parça başına: aynı işleyici binlerce kısa kod parçası için kullanılır
+    snippets = ['\n'.join(SAMPLE_LINES[(index + offset) % len(SAMPLE_LINES)] for offset in range(index % 7 + 1))
+                for index in range(2000)]
+    source_lines = sum(snippet.count('\n') + 1 for snippet in snippets)
+    report(f"token başına ({len(snippets)} parça)", source_lines,
+           timed(lambda: [naive_html(snippet) for snippet in snippets]))
+    for name, renderer in renderers.items():
+        for snippet in snippets[:50]:
+            out = io.StringIO()
+            renderer.render(snippet, out)
+            assert strip[name.split()[0]](out.getvalue()) == snippet, (name, snippet)
+        report(f"{name} ({len(snippets)} parça)", source_lines,
+               timed(lambda: [renderer.render(snippet, NullWriter()) for snippet in snippets]))
+
+    renderer = renderers['HTML']
+    for line_count in SIZES:
+        code = make_source(line_count)
+        out = io.StringIO()
+        renderer.render(code, out)
+        assert strip['HTML'](out.getvalue()) == code
+        naive_spans = len(lexer.tokenize_with_positions(code))
+        spans = out.getvalue().count('<span')
+        writer = NullWriter()
+        renderer.render(code, writer)
+        report("token başına", line_count, timed(naive_html, code, repeat=1))
+        report(f"akışlı HTML ({writer.writes} yazma)", line_count, timed(renderer.render, code, NullWriter(), repeat=1))
+        report("akışlı ANSI", line_count, timed(renderers['ANSI'].render, code, NullWriter(), repeat=1))
+        print(f"  span: {naive_spans} -> {spans}, tepe bellek: token başına "
+              f"{peak_memory(naive_html, code) / 1e6:.1f} MB, "
+              f"akışlı {peak_memory(renderer.render, code, NullWriter()) / 1e6:.1f} MB")
+
+
+BENCHMARKS = {
+    'positions': bench_positions,
+    'incremental': bench_incremental,
+    'streaming': bench_streaming,
+    'token_buffer': bench_token_buffer,
+    'views': bench_views,
+    'dispatch': bench_dispatch,
+    'stdlib': bench_stdlib,
+    'interning': bench_interning,
+    'expressions': bench_expressions,
+    'stress': bench_stress,
+    'reparse': bench_reparse,
+    'nodes': bench_nodes,
+    'recovery': bench_recovery,
+    'grammar': bench_grammar,
+    'treeview': bench_treeview,
+    'panes': bench_panes,
+    'viewport': bench_viewport,
+    'tag_updates': bench_tag_updates,
+    'background': bench_background,
+    'scheduler': bench_scheduler,
+    'document': bench_document,
+    'edit_proxy': bench_edit_proxy,
+    'cache': bench_cache,
+    'render': bench_render,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Bilinmeyen ölçüm: {name} (mevcut: {', '.join(BENCHMARKS)})")
+            continue
+        print(f"=== {name} ===")
+        BENCHMARKS[name]()
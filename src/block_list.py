@@ -0,0 +1,214 @@
+from bisect import bisect_right
+from itertools import accumulate, chain, islice
+
+# bloktaki öğe sayısı; splice yalnızca değişen blokları yeniden kurar
+BLOCK_SIZE = 256
+
+
+class BlockList:
+    """Değişmez, BLOCK_SIZE öğelik demet bloklarına bölünmüş liste.
+
+    splice yeni bir BlockList döndürür; değişen bölgenin dışındaki bloklar
+    eski listeyle paylaşılır, bu yüzden düzenleme süresi ve kopyalanan
+    bellek blok sayısıyla (öğe sayısı / BLOCK_SIZE) ölçeklenir. Eski sürümler
+    geçerli kalır: bir sürümü okuyan iş parçacığı sonraki düzenlemelerden
+    etkilenmez. summed=True ise öğeler sayıdır ve prefix/find önek
+    toplamlarını blok toplamlarından bulur.
+    """
+    __slots__ = ('blocks', 'ends', 'totals', 'sums')
+
+    def __init__(self, items=(), summed=False):
+        items = items if items.__class__ is list else list(items)
+        size = BLOCK_SIZE
+        self._set([tuple(items[first:first + size]) for first in range(0, len(items), size)],
+                  [sum(items[first:first + size]) for first in range(0, len(items), size)] if summed else None)
+
+    def _set(self, blocks, totals, ends=None):
+        self.blocks = blocks
+        # blokların bitiş indeksleri ve (summed ise) bitişe kadarki toplamlar
+        self.ends = ends if ends is not None else list(accumulate(map(len, blocks)))
+        self.totals = totals
+        self.sums = list(accumulate(totals)) if totals is not None else None
+
+    def __len__(self):
+        return self.ends[-1] if self.ends else 0
+
+    def __iter__(self):
+        return chain.from_iterable(self.blocks)
+
+    def __getitem__(self, index):
+        if index.__class__ is slice:
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return list(self.items(start, stop))
+        ends = self.ends
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BlockList index out of range")
+        block = bisect_right(ends, index)
+        return self.blocks[block][index - ends[block - 1] if block else index]
+
+    def items(self, start, stop):
+        """start ile stop arasındaki öğeler (yineleyici)"""
+        if start >= stop:
+            return iter(())
+        block = bisect_right(self.ends, start)
+        base = self.ends[block - 1] if block else 0
+        return islice(chain.from_iterable(self.blocks[block:]), start - base, stop - base)
+
+    def block_of(self, index):
+        """index'i içeren blok ve blokun ilk öğesinin indeksi"""
+        block = bisect_right(self.ends, index)
+        return block, self.ends[block - 1] if block else 0
+
+    def splice(self, start, stop, items):
+        """[start:stop] aralığı items ile değiştirilmiş yeni liste"""
+        blocks, ends = self.blocks, self.ends
+        if not blocks:
+            return BlockList(items, self.totals is not None)
+        first = min(bisect_right(ends, start), len(blocks) - 1)
+        last = max(first, min(bisect_right(ends, stop - 1), len(blocks) - 1))
+        base = ends[first - 1] if first else 0
+        region = list(chain.from_iterable(blocks[first:last + 1]))
+        region[start - base:stop - base] = items
+        # küçülen bölge bir sonraki blokla birleştirilir; bloklar ufalanmaz
+        if len(region) < BLOCK_SIZE // 2 and last + 1 < len(blocks):
+            last += 1
+            region.extend(blocks[last])
+        count = len(region)
+        old_blocks = blocks[first:last + 1]
+        if count == ends[last] - base:
+            # uzunluk değişmedi: blokların sınırları ve bitişleri aynen kalır
+            new_blocks = []
+            index = 0
+            for block in old_blocks:
+                new_blocks.append(tuple(region[index:index + len(block)]))
+                index += len(block)
+            new_ends = ends
+        else:
+            size = -(-count // -(-count // BLOCK_SIZE)) if count else BLOCK_SIZE
+            new_blocks = [tuple(region[index:index + size]) for index in range(0, count, size)]
+            new_ends = None
+        result = BlockList.__new__(BlockList)
+        totals = self.totals
+        if totals is not None:
+            new_totals = [sum(block) for block in new_blocks]
+            if new_ends is not None and new_totals == totals[first:last + 1]:
+                # toplamlar da aynı: önek toplamları paylaşılır
+                result.blocks = blocks[:first] + new_blocks + blocks[last + 1:]
+                result.ends, result.totals, result.sums = ends, totals, self.sums
+                return result
+            totals = totals[:first] + new_totals + totals[last + 1:]
+        result._set(blocks[:first] + new_blocks + blocks[last + 1:], totals, new_ends)
+        return result
+
+    def prefix(self, index):
+        """İlk index öğenin toplamı (summed=True)"""
+        if index <= 0:
+            return 0
+        if index >= len(self):
+            return self.sums[-1] if self.sums else 0
+        block, base = self.block_of(index)
+        return (self.sums[block - 1] if block else 0) + sum(self.blocks[block][:index - base])
+
+    def find(self, total):
+        """Önek toplamı total'i aşan ilk öğenin indeksi; yoksa uzunluk (summed=True)"""
+        sums = self.sums
+        block = bisect_right(sums, total)
+        if block == len(sums):
+            return len(self)
+        accumulated = sums[block - 1] if block else 0
+        index = self.ends[block - 1] if block else 0
+        for item in self.blocks[block]:
+            accumulated += item
+            if accumulated > total:
+                return index
+            index += 1
+        return index
+
+    def total(self):
+        return self.sums[-1] if self.sums else 0
+
+
+class BlockLineIndex:
+    """LineIndex ile aynı sorguları yanıtlayan, düzenlenebilir satır indeksi.
+
+    Satır uzunlukları (satır sonu dahil) toplamlı bir BlockList'te tutulur;
+    edited düzenlemeyi uygulanmış yeni bir indeks döndürür ve tüm metni
+    yeniden taramaz. Son sorgulanan blokun satır başlangıçları saklanır,
+    böylece yakın satırlara art arda yapılan sorgular blok içini yeniden
+    toplamaz.
+    """
+    def __init__(self, lengths):
+        self.lengths = lengths
+        # (blok, blokun ilk satırı, blokun satır başlangıçları); tek atamayla yenilenir
+        self._block = None
+
+    @classmethod
+    def from_code(cls, code):
+        return cls(BlockList([len(line) + 1 for line in code.split('\n')], summed=True))
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def _block_starts(self, block):
+        cached = self._block
+        if cached is not None and cached[0] == block:
+            return cached
+        lengths = self.lengths
+        first_line = lengths.ends[block - 1] if block else 0
+        base = lengths.sums[block - 1] if block else 0
+        starts = list(accumulate(chain((base,), lengths.blocks[block])))
+        cached = self._block = (block, first_line, starts)
+        return cached
+
+    def line_start(self, line):
+        """0 tabanlı satırın başlangıç ofseti"""
+        if line >= len(self.lengths):
+            return self.lengths.total()
+        _, first_line, starts = self._block_starts(bisect_right(self.lengths.ends, line))
+        return starts[line - first_line]
+
+    def line_of(self, pos):
+        lengths = self.lengths
+        block = min(bisect_right(lengths.sums, pos), len(lengths.blocks) - 1)
+        _, first_line, starts = self._block_starts(block)
+        return first_line + min(bisect_right(starts, pos) - 1, len(starts) - 2)
+
+    def line_column(self, pos):
+        """Ofsetten 1 tabanlı (satır, sütun)"""
+        line = self.line_of(pos)
+        return line + 1, pos - self.line_start(line) + 1
+
+    def tk_index(self, pos):
+        """Ofsetten Tk 'satır.sütun' indeksi"""
+        line = self.line_of(pos)
+        return f"{line + 1}.{pos - self.line_start(line)}"
+
+    def offset(self, line, col):
+        """1 tabanlı (satır, sütun) çiftinden mutlak ofset"""
+        return self.line_start(line - 1) + col - 1
+
+    def line_starts(self, first, last):
+        """first ile last arasındaki (0 tabanlı, last hariç) satırların başlangıçları"""
+        start = self.line_start(first)
+        for length in self.lengths.items(first, last):
+            yield start
+            start += length
+
+    def edited(self, offset, removed_length, inserted):
+        """Metnin offset'inden removed_length karakter silinip inserted eklenmiş hali için indeks"""
+        first = self.line_of(offset)
+        last = self.line_of(offset + removed_length)
+        first_start = self.line_start(first)
+        total = self.line_start(last) + self.lengths[last] - first_start - removed_length + len(inserted)
+        parts = inserted.split('\n')
+        if len(parts) == 1:
+            new_lengths = [total]
+        else:
+            new_lengths = [offset - first_start + len(parts[0]) + 1]
+            new_lengths.extend(len(part) + 1 for part in parts[1:-1])
+            new_lengths.append(total - sum(new_lengths))
+        return BlockLineIndex(self.lengths.splice(first, last + 1, new_lengths))
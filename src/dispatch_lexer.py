@@ -0,0 +1,127 @@
+import re
+
+from lexer import Lexer, LineIndex, KEYWORDS, BUILTINS
+
+# Modül düzeyinde paylaşılan tablolar: her DispatchLexer örneği bunları kullanır
+KEYWORD_SET = frozenset(KEYWORDS)
+BUILTIN_SET = frozenset(BUILTINS)
+IDENTIFIER_START = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+
+WORD_REGEX = re.compile(r'\w+')
+NUMBER_REGEX = re.compile(r'\d+(\.\d+)?\b')
+WHITESPACE_REGEX = re.compile(r'[ \t]+')
+STRING_REGEXES = {
+    '"': re.compile(r'"([^"\\]|\\.)*"'),
+    "'": re.compile(r"'([^'\\]|\\.)*'"),
+}
+
+# İlk karaktere göre tek karakterlik tokenlar
+SINGLE_CHAR_TOKENS = {
+    ':': 'COLON', '(': 'LPAREN', ')': 'RPAREN', ',': 'COMMA',
+    '[': 'LBRACKET', ']': 'RBRACKET', '\n': 'NEWLINE',
+    '+': 'OPERATOR', '-': 'OPERATOR', '*': 'OPERATOR', '/': 'OPERATOR',
+}
+# İkinci karakteri '=' olabilen tokenlar: (tek başına tür, '=' ile tür)
+EQUALS_TOKENS = {
+    '=': ('ASSIGN', 'OPERATOR'),
+    '<': ('OPERATOR', 'OPERATOR'),
+    '>': ('OPERATOR', 'OPERATOR'),
+    '!': (None, 'OPERATOR'),
+}
+
+
+def is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class DispatchLexer(Lexer):
+    """İlk karaktere göre dallanan tarayıcı.
+
+    Büyük alternasyon ifadesi yerine her konumda yalnızca ilk karaktere
+    uyan kural denenir; kelimeler tek seferde okunup anahtar kelime ve
+    yerleşik fonksiyon kümelerinde aranır. Ürettiği token akışı ve hata
+    mesajları Lexer ile aynıdır.
+    """
+
+    def match_at(self, code, pos):
+        """pos'ta başlayan tokenın (tür, bitiş) çifti; eşleşme yoksa None"""
+        char = code[pos]
+        single = SINGLE_CHAR_TOKENS.get(char)
+        if single:
+            return single, pos + 1
+        if char == ' ' or char == '\t':
+            return 'WHITESPACE', WHITESPACE_REGEX.match(code, pos).end()
+        if char in EQUALS_TOKENS:
+            alone, with_equals = EQUALS_TOKENS[char]
+            if code.startswith('=', pos + 1):
+                return with_equals, pos + 2
+            return (alone, pos + 1) if alone else None
+        if char in STRING_REGEXES:
+            match = STRING_REGEXES[char].match(code, pos)
+            return ('STRING', match.end()) if match else None
+        if char == '#':
+            end = code.find('\n', pos)
+            return 'COMMENT', end if end != -1 else len(code)
+        if not is_word_char(char) or (pos and is_word_char(code[pos - 1])):
+            return
+        end = WORD_REGEX.match(code, pos).end()
+        word = code[pos:end]
+        if word in KEYWORD_SET:
+            return 'KEYWORD', end
+        if word in BUILTIN_SET:
+            return 'BUILTIN', end
+        if char.isdecimal():
+            match = NUMBER_REGEX.match(code, pos)
+            return ('NUMBER', match.end()) if match else None
+        if char in IDENTIFIER_START:
+            return 'IDENTIFIER', end
+        return
+
+    def scan_spans(self, code, pos=0):
+        length = len(code)
+        single_tokens = SINGLE_CHAR_TOKENS
+        keywords, builtins = KEYWORD_SET, BUILTIN_SET
+        word_match = WORD_REGEX.match
+        whitespace_match = WHITESPACE_REGEX.match
+        while pos < length:
+            char = code[pos]
+            # sık görülen durumlar: kelimeler, boşluklar ve tek karakterlik tokenlar
+            if char == ' ':
+                pos = whitespace_match(code, pos).end()
+                continue
+            single = single_tokens.get(char)
+            if single:
+                yield single, pos, pos + 1
+                pos += 1
+                continue
+            if char in IDENTIFIER_START and not (pos and is_word_char(code[pos - 1])):
+                end = word_match(code, pos).end()
+                word = code[pos:end]
+                if word in keywords:
+                    yield 'KEYWORD', pos, end
+                elif word in builtins:
+                    yield 'BUILTIN', pos, end
+                else:
+                    yield 'IDENTIFIER', pos, end
+                pos = end
+                continue
+
+            token = self.match_at(code, pos)
+            if token is None:
+                # Lexer ile aynı mesaj için bir sonraki eşleşmeye kadar olan boşluğu bul
+                gap_end = pos + 1
+                while gap_end < length and self.match_at(code, gap_end) is None:
+                    gap_end += 1
+                invalid_char = code[pos:gap_end].strip()
+                if gap_end == length and not invalid_char:
+                    return
+                if not self.recover:
+                    line, col = LineIndex(code).line_column(pos)
+                    raise ValueError(f"Invalid character '{invalid_char}' at line {line}, column {col}")
+                yield 'ERROR', pos, gap_end
+                pos = gap_end
+                continue
+            token_type, end = token
+            if token_type != 'WHITESPACE':
+                yield token_type, pos, end
+            pos = end
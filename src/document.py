@@ -0,0 +1,380 @@
+import threading
+import tkinter as tk
+
+from dispatch_lexer import DispatchLexer
+from edit_proxy import WIDE_CHAR, install_edit_proxy, python_offset
+from block_list import BlockList, BlockLineIndex
+from incremental import IncrementalLexer, IncrementalParser
+from lexer import LineIndex, Token
+
+# sürümler arası satır değişikliklerinin saklanan kayıt sayısı
+HISTORY_LENGTH = 64
+
+
+def merge_changes(previous, current):
+    """Art arda iki (ilk, son, satır farkı) değişikliğini, ilkinden önceki
+    metne göre tek değişiklik olarak birleştir (satırlar 1 tabanlı, dahil)"""
+    if previous is None:
+        return current
+    first, last, delta = previous
+    current_first, current_last, current_delta = current
+    current_old_last = current_last - current_delta
+
+    def moved(line, inside):
+        if line < current_first:
+            return line
+        if line > current_old_last:
+            return line + current_delta
+        return inside
+    return (min(moved(first, current_first), current_first),
+            max(moved(last, current_last), current_last),
+            delta + current_delta)
+
+
+def plain_tokens(tokens, code):
+    """Escape vurgulamalı Token listesinde string parçalarını tek STRING tokenında birleştir"""
+    result = []
+    opening = None
+    for token in tokens:
+        if opening is not None:
+            if token.type == 'STRING_QUOTE':
+                result.append(Token('STRING', code[opening.start:token.end], opening.position,
+                                    opening.start, token.end, opening.start_index, token.end_index))
+                opening = None
+        elif token.type == 'STRING_QUOTE':
+            opening = token
+        else:
+            result.append(token)
+    return result
+
+
+class Snapshot:
+    """Belgenin bir düzenleme sürümündeki değişmez görüntüsü.
+
+    Metin bir kez alınır; satır indeksi, tokenlar ve ayrıştırma ağacı ilk
+    istendiklerinde hesaplanıp saklanır ve tüm tüketiciler aynı sonucu okur.
+    Hesaplamalar arka plan iş parçacıklarından da istenebilir; her saklanan
+    alanın kendi kilidi vardır, böylece arka planda süren O(n) token
+    konumlandırması ana iş parçacığının satır indeksi veya tanımlayıcı
+    isteklerini bekletmez.
+    """
+    def __init__(self, document, version, text, deltas=None):
+        self.document = document
+        self.version = version
+        self.text = text
+        # önceki sürümden bu yana düzenlemeler (EditDelta); None ise bilinmiyor
+        self.deltas = deltas
+        # analiz edilen kod: sondaki boş satırlar token üretmez
+        self.code = text.rstrip('\n')
+        self.line_index_lock = threading.Lock()
+        self.tokens_lock = threading.Lock()
+        self.plain_tokens_lock = threading.Lock()
+        self.identifiers_lock = threading.Lock()
+        self._line_index = None
+        # lex(): satır başına (tür, değer, sütun) tokenları ve kontrol noktaları (BlockList)
+        self.lexed = False
+        self.lines = None
+        self.checkpoints = None
+        # satır başına ERROR tokenı sayıları ve kodun satır indeksi (BlockLineIndex)
+        self.error_counts = None
+        self.lexed_index = None
+        # ayrıştırıcıya giden düz Token görünümü (IncrementalLexer.line_tokens)
+        self.line_tokens = None
+        self.lex_error = None
+        self._tokens = None
+        self._plain_tokens = None
+        self._identifiers = None
+        # parse(): ağaç, hata düğümleri ve ayrıştırma kurtarılamadıysa mesajı
+        self.parsed = False
+        self.tree = None
+        self.errors = None
+        self.parse_error = None
+
+    def line_index(self):
+        with self.line_index_lock:
+            if self._line_index is None:
+                self._line_index = LineIndex(self.code)
+            return self._line_index
+
+    def lex(self):
+        """Satır tokenlarını hesapla; sürüm yerini yenisine bıraktıysa False"""
+        return self.lexed or self.document.lex(self)
+
+    def tokens(self):
+        """tokenize_with_positions biçiminde escape vurgulamalı Token listesi"""
+        line_index = self.line_index()
+        with self.tokens_lock:
+            if self._tokens is None:
+                self._tokens = self.position_tokens(line_index) if self.code.strip() else []
+            return self._tokens
+
+    def position_tokens(self, line_index):
+        # satır ve sütun bilindiğinden ofset ve Tk indeksi satır başından hesaplanır;
+        # satırının dışına taşan tokenların (çok satırlı stringler) indeksleri aranır
+        starts = line_index.starts
+        line_ends = starts[1:] + [len(self.code) + 1]
+        tokens = []
+        append = tokens.append
+        for number, line_tokens in enumerate(self.lines, 1):
+            line_start = starts[number - 1]
+            line_end = line_ends[number - 1]
+            for token_type, value, col in line_tokens:
+                start = line_start + col - 1
+                end = start + len(value)
+                if end < line_end:
+                    start_index = f"{number}.{col - 1}"
+                    end_index = f"{number}.{end - line_start}"
+                else:
+                    start_index, end_index = line_index.tk_index(start), line_index.tk_index(end)
+                append(Token(token_type, value, (number, col), start, end, start_index, end_index))
+        return tokens
+
+    def plain_tokens(self):
+        """Parser'a giden düz Token listesi (stringler tek token)"""
+        tokens = self.tokens()
+        with self.plain_tokens_lock:
+            if self._plain_tokens is None:
+                self._plain_tokens = plain_tokens(tokens, self.code)
+            return self._plain_tokens
+
+    def error_tokens(self):
+        """ERROR tokenları; satır başına sayılardan yalnızca hatalı satırlar okunur"""
+        counts = self.error_counts
+        if not self.code.strip() or not counts.total():
+            return []
+        numbers = sorted({counts.find(index) for index in range(counts.total())})
+        errors = [(token_type, value, (number + 1, col))
+                  for number in numbers
+                  for token_type, value, col in self.lines[number] if token_type == 'ERROR']
+        return self.document.lexer.attach_positions(errors, self.lexed_index)
+
+    def identifiers(self):
+        """Koddaki tanımlayıcı adları"""
+        with self.identifiers_lock:
+            if self._identifiers is None:
+                self._identifiers = {value for line_tokens in self.lines
+                                     for token_type, value, _ in line_tokens if token_type == 'IDENTIFIER'}
+            return self._identifiers
+
+    def parse(self):
+        """Ayrıştırma ağacı; sürüm yerini yenisine bıraktıysa None"""
+        if self.parsed:
+            return self.tree
+        return self.document.parse(self)
+
+
+class Document:
+    """Metin alanının düzenleme sürümü başına tek anlık görüntüsünü sağlar.
+
+    Vurgulayıcı, parantez eşleştirici, otomatik tamamlayıcı ve analiz
+    panelleri metni Tk'dan ayrı ayrı almaz, kendileri tokenize etmez:
+    snapshot() metin son alındığından beri düzenlenmediyse aynı Snapshot'ı
+    döndürür. Tek IncrementalLexer ve IncrementalParser belgeye aittir;
+    sürümler sırayla taranır ve her taramanın yeniden taranan satır aralığı
+    kaydedilir, böylece her tüketici kendi son gördüğü sürümden bu yana
+    değişen satırları changes_since ile alır.
+
+    Düzenlemeler widget komutunun vekilinden (EditProxy) EditDelta olarak
+    gelir; tıklama, kaydırma gibi olaylar görüntüyü geçersiz saymaz.
+    Bir sonraki snapshot() düzenlemeleri son görüntünün metnine uygular;
+    vekil konumu satır ve sütun olarak verir, ofset son görüntünün satır
+    başlangıçlarından (BlockLineIndex) bulunur. Metin Tk'dan yalnızca
+    değişiklik bilinmiyorsa (geri alma, 'end'e uzanan silme) alınır. Düzenlemeler tarayıcıya da doğrudan verilir, metinler
+    karşılaştırılıp değişen bölge aranmaz.
+    """
+    def __init__(self, text_area, lexer=None):
+        self.text_area = text_area
+        self.lexer = lexer or DispatchLexer(recover=True)
+        self.incremental_lexer = IncrementalLexer(self.lexer)
+        # hatalı ifadeler Error düğümü olur; her hata kendi aralığıyla işaretlenir
+        self.parser = IncrementalParser(recover=True)
+        self.version = 0
+        self.current = None   # geçerli görüntü; None ise metin değişmiş olabilir
+        self.latest = None    # son alınan görüntü
+        self.lexed_snapshot = None  # son taranan görüntü
+        # Tk'dan metin alma, tarama ve ayrıştırma sayıları
+        self.fetches = 0
+        self.lexes = 0
+        self.parses = 0
+        self.lex_lock = threading.Lock()
+        self.parse_lock = threading.Lock()
+        self.lexed_version = 0
+        self.parsed_version = 0
+        # IncrementalParser'ın son başarılı güncellemesinin sürümü
+        self.parser_version = None
+        # (önceki sürüm, sürüm, değişiklik); değişiklik None ise bilinmiyor. Demet
+        # tek atamayla yenilenir, changes_since kilitsiz okur
+        self.history = ()
+        # son görüntüden bu yana düzenlemeler; None ise metin Tk'dan alınır
+        self.pending = None
+        # son görüntünün metninde BMP dışı karakter olabilir mi; varsa vekilin
+        # Tcl ofsetleri Python ofsetlerine çevrilir
+        self.wide_text = False
+        # son görüntünün metninin satır başlangıçları; düzenlemelerle birlikte güncellenir
+        self.text_lines = None
+        self.edits = install_edit_proxy(text_area)
+        self.edits.add_listener(self.on_edit)
+
+    def on_edit(self, delta):
+        self.current = None
+        if self.pending is not None:
+            if delta is None:
+                self.pending = None
+            else:
+                self.pending.append(delta)
+
+    def invalidate(self):
+        """Metni vekilin görmediği bir yoldan değiştiğinde bir sonraki görüntü Tk'dan alınır"""
+        self.current = None
+        self.pending = None
+
+    def snapshot(self):
+        """Geçerli görüntü; metin alınamazsa (widget yok edildiyse) None"""
+        if self.current is None:
+            deltas = self.pending
+            text, text_lines = self.replay(deltas)
+            if text is None:
+                deltas = None
+                try:
+                    text = self.text_area.get('1.0', tk.END)[:-1]
+                except tk.TclError:
+                    return None
+                self.fetches += 1
+                self.wide_text = self.edits.wide_offsets and WIDE_CHAR.search(text) is not None
+                text_lines = BlockLineIndex.from_code(text)
+            self.text_lines = text_lines
+            self.pending = []
+            # birbirini götüren düzenlemeler yeni sürüm açmaz
+            if self.latest is not None and self.latest.text == text:
+                self.current = self.latest
+            else:
+                self.version += 1
+                self.current = self.latest = Snapshot(self, self.version, text, deltas)
+        return self.current
+
+    def replay(self, deltas):
+        """Düzenlemeleri son görüntünün metnine uygula; (metin, satır indeksi),
+        uygulanamazsa (None, None). Düzenlemelerin ofsetleri doldurulur"""
+        if not deltas or self.latest is None:
+            return None, None
+        text, lines = self.latest.text, self.text_lines
+        wide = self.wide_text
+        for index, delta in enumerate(deltas):
+            line = int(delta.index.partition('.')[0]) - 1
+            if line >= len(lines):
+                return None, None
+            line_start = lines.line_start(line)
+            offset = line_start + delta.column
+            if wide:
+                # Tcl sütunu satırdaki BMP dışı karakterler kadar ileridedir
+                offset = python_offset(text, offset, line_start)
+            # tarayıcı da ofsetli düzenlemeyi alır
+            delta = deltas[index] = delta._replace(offset=offset)
+            end = offset + len(delta.removed)
+            # silinen metin tutmuyorsa görüntü widget'tan kopmuştur
+            if offset > len(text) or text[offset:end] != delta.removed:
+                return None, None
+            text = text[:offset] + delta.inserted + text[end:]
+            lines = lines.edited(offset, len(delta.removed), delta.inserted)
+            wide = wide or self.edits.wide_offsets and WIDE_CHAR.search(delta.inserted) is not None
+        self.wide_text = wide
+        return text, lines
+
+    def relex(self, snapshot):
+        """Görüntüyü tara; yeniden taranan (ilk, son, satır farkı) değişikliği"""
+        lexer = self.incremental_lexer
+        change = None
+        if snapshot.deltas is not None and self.lexed_version == snapshot.version - 1:
+            for delta in snapshot.deltas:
+                # kodun son karakterine uzanan düzenlemeler sondaki boş satırları da
+                # değiştirebilir; bunlar ve sonrakiler metinler karşılaştırılarak uygulanır
+                if delta.offset + len(delta.removed) >= lexer.length:
+                    break
+                old_count = len(lexer.lines)
+                first, last = lexer.edit(delta.offset, len(delta.removed), delta.inserted)
+                change = merge_changes(change, (first, last, len(lexer.lines) - old_count))
+            else:
+                # tüm düzenlemeler kodun içinde kaldı: tarayıcının metni görüntünün kodudur
+                if change is not None and lexer.length == len(snapshot.code):
+                    return change
+        if change is None or lexer.code != snapshot.code:
+            old_count = len(lexer.lines)
+            first, last = lexer.update(snapshot.code)
+            change = merge_changes(change, (first, last, len(lexer.lines) - old_count))
+        return change
+
+    def lex(self, snapshot):
+        lexer = self.incremental_lexer
+        with self.lex_lock:
+            if snapshot.lexed:
+                return True
+            if snapshot.version < self.lexed_version:
+                return False
+            self.lexes += 1
+            was_valid = lexer.valid
+            try:
+                if was_valid:
+                    change = self.relex(snapshot)
+                else:
+                    lexer.update(snapshot.code)
+                    change = None
+                # BlockList'ler değişmezdir: tarayıcının sonraki düzenlemeleri yeni liste kurar,
+                # görüntü kopyalanmadan paylaşılır
+                snapshot.lines, snapshot.checkpoints = lexer.lines, lexer.checkpoints
+                snapshot.error_counts, snapshot.lexed_index = lexer.error_counts, lexer.line_index
+                snapshot.line_tokens = lexer.line_tokens()
+            except ValueError as error:
+                change = None
+                snapshot.lex_error = str(error)
+                snapshot.lines, snapshot.checkpoints = [[]], [True]
+                snapshot.error_counts = BlockList([0], summed=True)
+            self.history = (self.history + ((self.lexed_version, snapshot.version, change),))[-HISTORY_LENGTH:]
+            self.lexed_version = snapshot.version
+            snapshot.lexed = True
+            self.lexed_snapshot = snapshot
+            return True
+
+    def changes_since(self, base, version):
+        """base sürümünden version'a yeniden taranan (ilk, son, satır farkı); bilinmiyorsa None"""
+        if base is None:
+            return None
+        merged = None
+        current = base
+        # ana iş parçacığından çağrılır: tarama sürerken lex_lock beklenmez
+        for entry_base, entry_version, change in self.history:
+            if entry_base != current or entry_version > version:
+                continue
+            if change is None:
+                return None
+            merged = merge_changes(merged, change)
+            current = entry_version
+        return merged if current == version else None
+
+    def parse(self, snapshot):
+        """Düz tokenları ayrıştır; lex hatası, ERROR tokenı veya ayrıştırma hatası varsa ağaç yoktur"""
+        if not snapshot.lex():
+            return None
+        if snapshot.lex_error is not None or snapshot.error_tokens():
+            snapshot.parsed = True
+            return None
+        # görünüm tokenları istendikçe konumlandırır: yalnızca değişen satırlar okunur
+        tokens = snapshot.line_tokens
+        with self.parse_lock:
+            if snapshot.parsed:
+                return snapshot.tree
+            if snapshot.version < self.parsed_version:
+                return None
+            self.parses += 1
+            try:
+                # ayrıştırıcı son başarılı sürümünden bu yana değişen satırları alır
+                change = self.changes_since(self.parser_version, snapshot.version)
+                # ayrıştırıcı her güncellemede yeni ağaç ve hata listesi kurar, eskilerini
+                # değiştirmez; kopyalanmadan paylaşılır
+                snapshot.tree = self.parser.update(tokens, change)
+                snapshot.errors = self.parser.errors
+                self.parser_version = snapshot.version
+            except SyntaxError as error:
+                snapshot.parse_error = str(error)
+            self.parsed_version = snapshot.version
+            snapshot.parsed = True
+            return snapshot.tree
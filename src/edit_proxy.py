@@ -0,0 +1,171 @@
+import re
+from collections import namedtuple
+
+# Tek düzenleme: index düzenlemeden önceki Tk 'satır.sütun' konumu, column aynı konumun
+# satır başından karakter sayısı; removed silinen, inserted eklenen metindir. offset
+# konumun metindeki ofsetidir: vekil bildirmez, Document satır başlangıçlarından bulur
+EditDelta = namedtuple('EditDelta', ['index', 'column', 'removed', 'inserted', 'offset'], defaults=(None,))
+
+# Tcl 8.6 BMP dışındaki karakterleri (emoji gibi) UTF-16 vekil çifti olarak iki karakter sayar
+WIDE_CHAR = re.compile('[\U00010000-\U0010FFFF]')
+
+
+def python_offset(text, offset, start=0):
+    """BMP dışı karakterleri iki sayan Tcl karakter ofsetini text içindeki ofsete çevir;
+    start'tan önceki ofsetler doğru sayılmıştır"""
+    for match in WIDE_CHAR.finditer(text, start, offset):
+        if match.start() >= offset:
+            break
+        offset -= 1
+    return offset
+
+# Widget komutunun yerine geçen Tcl yordamı. Düzenleme olmayan komutlar (get, index,
+# tag, see, mark...) doğrudan özgün komuta gider, Python'a hiç uğramaz. Düzenlemeler
+# özgün komutla yapılır, başarılı olursa değişiklik callback'e bildirilir; hata
+# verirse Tk hatası çağırana olduğu gibi döner. Konum satır başından sayılır, böylece
+# tuş başına maliyet imlecin belgedeki yerine bağlı değildir. Aralığı 'end'e uzanan silmelerde Tk
+# son satır sonunu korumak için aralığı kaydırır; bunlar, çok aralıklı silmeler ve
+# geri alma/yineleme bilinmeyen değişiklik olarak bildirilir (boş index).
+PROXY_SCRIPT = r'''
+proc ::text_edit_proxy {original callback command args} {
+    switch -exact -- $command {
+        insert {
+            if {[llength $args] < 2 || [$original cget -state] ne "normal"} {
+                return [$original insert {*}$args]
+            }
+            set index [$original index [lindex $args 0]]
+            # metin sonuna eklenen metin son satır sonundan önceye girer
+            if {[$original compare $index == end]} {
+                set index [$original index end-1c]
+            }
+            set column [$original count -chars "$index linestart" $index]
+            $original insert {*}$args
+            set inserted ""
+            foreach {chars tags} [lrange $args 1 end] {
+                append inserted $chars
+            }
+            if {$inserted ne ""} {
+                $callback $index $column "" $inserted
+            }
+            return
+        }
+        delete - replace {
+            set minimum [expr {$command eq "delete" ? 1 : 3}]
+            if {[llength $args] < $minimum || [$original cget -state] ne "normal"} {
+                return [$original $command {*}$args]
+            }
+            if {$command eq "delete" && [llength $args] > 2} {
+                $original delete {*}$args
+                $callback "" "" "" ""
+                return
+            }
+            set first [$original index [lindex $args 0]]
+            if {$command eq "replace" || [llength $args] == 2} {
+                set last [$original index [lindex $args 1]]
+            } else {
+                set last [$original index "$first +1c"]
+            }
+            if {[$original compare $last == end]} {
+                $original $command {*}$args
+                $callback "" "" "" ""
+                return
+            }
+            set removed [$original get $first $last]
+            set column [$original count -chars "$first linestart" $first]
+            $original $command {*}$args
+            set inserted ""
+            if {$command eq "replace"} {
+                foreach {chars tags} [lrange $args 2 end] {
+                    append inserted $chars
+                }
+            }
+            if {$removed ne "" || $inserted ne ""} {
+                $callback $first $column $removed $inserted
+            }
+            return
+        }
+        edit {
+            set result [$original edit {*}$args]
+            if {[lindex $args 0] in {undo redo}} {
+                $callback "" "" "" ""
+            }
+            return $result
+        }
+    }
+    return [$original $command {*}$args]
+}
+'''
+
+
+class EditSource:
+    """Düzenleme değişikliklerini (EditDelta) dinleyicilere iletir.
+
+    Bilinmeyen değişiklikler için dinleyiciye None verilir; dinleyici
+    metni yeniden almalıdır. Tk'sız ölçümlerde metin alanı taklitleri
+    düzenlemelerini doğrudan emit ile bildirir.
+    """
+    # True ise sütunlar BMP dışı karakterleri iki sayar (python_offset ile çevrilir)
+    wide_offsets = False
+
+    def __init__(self):
+        self.listeners = []
+        self.edits = 0
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def emit(self, delta):
+        self.edits += 1
+        for listener in self.listeners:
+            listener(delta)
+
+
+class EditProxy(EditSource):
+    """Text widget'ının Tcl komutunu bir vekille değiştirip insert, delete ve
+    replace düzenlemelerini EditDelta olarak bildirir.
+
+    Klavye, yapıştırma, geri alma ve programla yapılan tüm düzenlemeler widget
+    komutundan geçtiği için olay bağlamaya gerek kalmaz: tıklama, kaydırma
+    ve odak olayları metni hiç alınmasına yol açmaz. Dinleyiciler
+    düzenlemenin içinde çağrılır; yalnızca geçersiz sayma ve zamanlama gibi
+    ucuz işler yapmalıdır.
+    """
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+        tk_app = widget.tk
+        if not tk_app.call('info', 'procs', '::text_edit_proxy'):
+            tk_app.eval(PROXY_SCRIPT)
+        # 'count -chars' Tcl'in karakter sayımını kullanır: 8.6'da emoji iki karakterdir
+        self.wide_offsets = int(tk_app.call('string', 'length', '\U0001F600')) == 2
+        self.original = widget._w + '_original'
+        # register, dinleyici hatalarını Tk'nın hata bildirimine yönlendirir
+        callback = widget.register(self.notify)
+        tk_app.call('rename', widget._w, self.original)
+        tk_app.call('interp', 'alias', '', widget._w, '', '::text_edit_proxy', self.original, callback)
+        widget.bind('<Destroy>', self.close, add='+')
+
+    def notify(self, index, column, removed, inserted):
+        if index:
+            self.emit(EditDelta(index, int(column), removed, inserted))
+        else:
+            self.emit(None)
+
+    def close(self, event=None):
+        """Vekili kaldırıp özgün komutu eski adına döndür"""
+        if self.original is None:
+            return
+        tk_app = self.widget.tk
+        tk_app.call('interp', 'alias', '', self.widget._w, '')
+        # widget yok ediliyorsa özgün komut Tk tarafından zaten silinmiştir
+        if tk_app.call('info', 'commands', self.original):
+            tk_app.call('rename', self.original, self.widget._w)
+        self.original = None
+
+
+def install_edit_proxy(widget):
+    """Widget'ın düzenleme kaynağı; vekil her widget için bir kez kurulur"""
+    source = getattr(widget, 'edit_proxy', None)
+    if source is None:
+        source = widget.edit_proxy = EditProxy(widget)
+    return source
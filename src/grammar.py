@@ -0,0 +1,296 @@
+import os
+import re
+import sys
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'grammer.bnf')
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grammar_tables.py')
+
+# Girdinin sonu için FOLLOW işareti
+END = '$'
+
+# Lexer'ın kendi türüyle ürettiği noktalama terminalleri; diğer tırnaklı terminaller
+# (anahtar kelimeler ve operatörler) token değeriyle eşleşir
+PUNCTUATION_KINDS = {
+    '=': 'ASSIGN', ':': 'COLON', '(': 'LPAREN', ')': 'RPAREN', ',': 'COMMA',
+    '[': 'LBRACKET', ']': 'RBRACKET',
+}
+
+BNF_TOKEN_REGEX = re.compile(
+    r'(?P<SPACE>\s+)|(?P<COMMENT>//[^\n]*)|(?P<LITERAL>"[^"]*")|(?P<NONTERMINAL><[a-z_]+>)'
+    r'|(?P<DEFINE>::=)|(?P<KIND>[A-Z_]+)|(?P<SYMBOL>[|()\[\]?*+])'
+)
+
+
+class GrammarError(Exception):
+    """grammer.bnf okunamadı veya tablolar grameri yansıtmıyor"""
+
+
+def terminal_key(kind, text):
+    """Terminalin ayrıştırıcıdaki anahtarı: noktalama için token türü, diğer
+    tırnaklı terminaller için değer, çıplak büyük harfli adlar için tür"""
+    if kind == 'LITERAL':
+        literal = text[1:-1]
+        return PUNCTUATION_KINDS.get(literal, literal)
+    return text
+
+
+def read_bnf(text):
+    """BNF metnini (tür, metin) tokenlarına ayır; yorumlar ve boşluklar atlanır"""
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = BNF_TOKEN_REGEX.match(text, pos)
+        if not match:
+            line = text.count('\n', 0, pos) + 1
+            raise GrammarError(f"Invalid grammar text at line {line}: {text[pos:pos + 20]!r}")
+        if match.lastgroup not in ('SPACE', 'COMMENT'):
+            tokens.append((match.lastgroup, match.group()))
+        pos = match.end()
+    return tokens
+
+
+class Grammar:
+    """grammer.bnf kuralları ve bunlardan hesaplanan FIRST/FOLLOW kümeleri.
+
+    Kurallar iç içe demetler olarak saklanır: ('t', anahtar), ('nt', ad),
+    ('seq', [...]), ('alt', [...]), ('opt', x), ('star', x), ('plus', x).
+    [x] isteğe bağlıdır; ?, * ve + son ekleri hem gruplara hem tek
+    sembollere uygulanabilir.
+    """
+    def __init__(self, text):
+        self.rules = {}
+        self.order = []
+        self.parse_rules(read_bnf(text))
+        self.nullable = set()
+        self.first = {name: set() for name in self.rules}
+        self.follow = {name: set() for name in self.rules}
+        undefined = sorted(self.referenced() - set(self.rules))
+        if undefined:
+            raise GrammarError(f"Undefined nonterminals: {', '.join(undefined)}")
+        self.compute_first()
+        self.compute_follow()
+
+    @classmethod
+    def load(cls, path=GRAMMAR_PATH):
+        with open(path, encoding='utf-8') as file:
+            return cls(file.read())
+
+    def parse_rules(self, tokens):
+        # her kural "<ad> ::=" ile başlar ve bir sonraki "<ad> ::=" öncesinde biter
+        starts = [index for index in range(len(tokens) - 1)
+                  if tokens[index][0] == 'NONTERMINAL' and tokens[index + 1][0] == 'DEFINE']
+        if not starts or starts[0] != 0:
+            raise GrammarError("Grammar must start with a rule definition")
+        for start, end in zip(starts, starts[1:] + [len(tokens)]):
+            name = tokens[start][1][1:-1]
+            if name in self.rules:
+                raise GrammarError(f"Rule <{name}> is defined twice")
+            self.pos = start + 2
+            self.body = tokens[:end]
+            self.rules[name] = self.parse_alternatives()
+            if self.pos != end:
+                raise GrammarError(f"Unexpected {self.body[self.pos][1]!r} in rule <{name}>")
+            self.order.append(name)
+        del self.pos, self.body
+
+    def parse_alternatives(self):
+        alternatives = [self.parse_sequence()]
+        while self.pos < len(self.body) and self.body[self.pos][1] == '|':
+            self.pos += 1
+            alternatives.append(self.parse_sequence())
+        return alternatives[0] if len(alternatives) == 1 else ('alt', alternatives)
+
+    def parse_sequence(self):
+        items = []
+        while self.pos < len(self.body) and self.body[self.pos][1] not in ('|', ')', ']'):
+            kind, text = self.body[self.pos]
+            self.pos += 1
+            if kind == 'NONTERMINAL':
+                item = ('nt', text[1:-1])
+            elif kind in ('LITERAL', 'KIND'):
+                item = ('t', terminal_key(kind, text))
+            elif text in '([':
+                item = self.parse_alternatives()
+                closing = ')' if text == '(' else ']'
+                if self.pos >= len(self.body) or self.body[self.pos][1] != closing:
+                    raise GrammarError(f"Missing {closing!r} in grammar")
+                self.pos += 1
+                if text == '[':
+                    item = ('opt', item)
+            else:
+                raise GrammarError(f"Unexpected {text!r} in grammar")
+            while self.pos < len(self.body) and self.body[self.pos][1] in ('?', '*', '+'):
+                item = ({'?': 'opt', '*': 'star', '+': 'plus'}[self.body[self.pos][1]], item)
+                self.pos += 1
+            items.append(item)
+        return items[0] if len(items) == 1 else ('seq', items)
+
+    def referenced(self):
+        names = set()
+        stack = list(self.rules.values())
+        while stack:
+            expr = stack.pop()
+            if expr[0] == 'nt':
+                names.add(expr[1])
+            elif expr[0] in ('seq', 'alt'):
+                stack.extend(expr[1])
+            elif expr[0] != 't':
+                stack.append(expr[1])
+        return names
+
+    def first_of(self, expr):
+        """(FIRST kümesi, boş türetilebilir mi) çifti"""
+        tag = expr[0]
+        if tag == 't':
+            return {expr[1]}, False
+        if tag == 'nt':
+            return self.first[expr[1]], expr[1] in self.nullable
+        if tag == 'seq':
+            first = set()
+            for item in expr[1]:
+                item_first, item_nullable = self.first_of(item)
+                first |= item_first
+                if not item_nullable:
+                    return first, False
+            return first, True
+        if tag == 'alt':
+            first, nullable = set(), False
+            for item in expr[1]:
+                item_first, item_nullable = self.first_of(item)
+                first |= item_first
+                nullable = nullable or item_nullable
+            return first, nullable
+        first, nullable = self.first_of(expr[1])
+        return first, nullable or tag in ('opt', 'star')
+
+    def compute_first(self):
+        changed = True
+        while changed:
+            changed = False
+            for name, expr in self.rules.items():
+                first, nullable = self.first_of(expr)
+                if not first <= self.first[name] or (nullable and name not in self.nullable):
+                    self.first[name] |= first
+                    if nullable:
+                        self.nullable.add(name)
+                    changed = True
+
+    def add_follow(self, expr, after):
+        """expr'den sonra 'after' terminalleri gelebilir; alt sembollerin FOLLOW'unu genişlet"""
+        tag = expr[0]
+        changed = False
+        if tag == 'nt':
+            if not after <= self.follow[expr[1]]:
+                self.follow[expr[1]] |= after
+                changed = True
+        elif tag == 'seq':
+            for item in reversed(expr[1]):
+                changed |= self.add_follow(item, after)
+                item_first, item_nullable = self.first_of(item)
+                after = item_first | after if item_nullable else set(item_first)
+        elif tag == 'alt':
+            for item in expr[1]:
+                changed |= self.add_follow(item, after)
+        elif tag == 'opt':
+            changed = self.add_follow(expr[1], after)
+        elif tag in ('star', 'plus'):
+            changed = self.add_follow(expr[1], self.first_of(expr[1])[0] | after)
+        return changed
+
+    def compute_follow(self):
+        self.follow[self.order[0]].add(END)
+        changed = True
+        while changed:
+            changed = False
+            for name, expr in self.rules.items():
+                changed |= self.add_follow(expr, self.follow[name])
+
+    def statement_dispatch(self):
+        """<statement> seçeneklerinin FIRST kümelerinden anahtar -> üretim tablosu.
+
+        Birden fazla üretimle başlayabilen anahtarlar (ör. IDENTIFIER: atama
+        veya ifade) gramer sırasıyla üretim demetine eşlenir.
+        """
+        dispatch = {}
+        statement = self.rules['statement']
+        for alternative in statement[1] if statement[0] == 'alt' else [statement]:
+            if alternative[0] != 'nt':
+                raise GrammarError("<statement> alternatives must be single nonterminals")
+            production = alternative[1]
+            for key in self.first[production]:
+                if key in dispatch:
+                    previous = dispatch[key]
+                    dispatch[key] = (previous if isinstance(previous, tuple) else (previous,)) + (production,)
+                else:
+                    dispatch[key] = production
+        return dispatch
+
+    def tables(self):
+        return {
+            'NULLABLE': frozenset(self.nullable),
+            'FIRST': {name: frozenset(self.first[name]) for name in self.order},
+            'FOLLOW': {name: frozenset(self.follow[name]) for name in self.order},
+            'STATEMENT_DISPATCH': self.statement_dispatch(),
+        }
+
+
+def format_value(value, indent='    '):
+    """Tabloları sıralı ve kararlı biçimde Python kaynağına çevir"""
+    if isinstance(value, frozenset):
+        if not value:
+            return 'frozenset()'
+        return 'frozenset({' + ', '.join(repr(item) for item in sorted(value)) + '})'
+    if isinstance(value, dict):
+        lines = ['{']
+        for key, item in value.items():
+            lines.append(f"{indent}{key!r}: {format_value(item, indent + '    ')},")
+        lines.append(indent[:-4] + '}')
+        return '\n'.join(lines)
+    return repr(value)
+
+
+def generate_tables(grammar):
+    """grammar_tables.py içeriği"""
+    tables = grammar.tables()
+    parts = ["# grammer.bnf'den üretildi; elle düzenlemeyin: python grammar.py\n"]
+    for name, value in tables.items():
+        if name == 'STATEMENT_DISPATCH':
+            value = dict(sorted(value.items()))
+        parts.append(f"\n{name} = {format_value(value)}\n")
+    return ''.join(parts)
+
+
+def check(grammar=None):
+    """Üretilmiş tabloların gramerle ve Parser'ın üretim metotlarıyla tutarlılığı;
+    bulunan sorunların listesi (boşsa tutarlı)"""
+    grammar = grammar or Grammar.load()
+    problems = []
+    import grammar_tables
+    for name, value in grammar.tables().items():
+        if getattr(grammar_tables, name, None) != value:
+            problems.append(f"grammar_tables.{name} is out of date with grammer.bnf (run: python grammar.py)")
+
+    from parser import PRODUCTION_METHODS, LOOKAHEAD_PRODUCTIONS
+    for key, production in grammar.statement_dispatch().items():
+        if isinstance(production, tuple):
+            if production != LOOKAHEAD_PRODUCTIONS:
+                problems.append(f"Statements starting with {key!r} are ambiguous: {', '.join(production)}")
+        elif production not in PRODUCTION_METHODS:
+            problems.append(f"Parser has no method for <{production}> (starts with {key!r})")
+    for production in LOOKAHEAD_PRODUCTIONS:
+        if production not in PRODUCTION_METHODS:
+            problems.append(f"Parser has no method for <{production}>")
+    return problems
+
+
+if __name__ == "__main__":
+    grammar = Grammar.load()
+    if '--check' in sys.argv[1:]:
+        problems = check(grammar)
+        for problem in problems:
+            print(problem)
+        print("Tablolar gramerle tutarlı" if not problems else f"{len(problems)} sorun bulundu")
+        sys.exit(1 if problems else 0)
+    with open(TABLES_PATH, 'w', encoding='utf-8') as file:
+        file.write(generate_tables(grammar))
+    print(f"{TABLES_PATH} yazıldı")
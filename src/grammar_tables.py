@@ -0,0 +1,120 @@
+# grammer.bnf'den üretildi; elle düzenlemeyin: python grammar.py
+
+NULLABLE = frozenset({'program', 'statement_list', 'suite'})
+
+FIRST = {
+    'program': frozenset({'+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'class', 'continue', 'def', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'statement_list': frozenset({'+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'class', 'continue', 'def', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'statement': frozenset({'+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'class', 'continue', 'def', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'simple_statement': frozenset({'break', 'continue', 'pass'}),
+    'comment': frozenset({'COMMENT'}),
+    'assignment_statement': frozenset({'BUILTIN', 'IDENTIFIER'}),
+    'if_statement': frozenset({'if'}),
+    'while_statement': frozenset({'while'}),
+    'for_statement': frozenset({'for'}),
+    'function_def_statement': frozenset({'def'}),
+    'class_def_statement': frozenset({'class'}),
+    'parameter_list': frozenset({'BUILTIN', 'IDENTIFIER'}),
+    'identifier_list': frozenset({'BUILTIN', 'IDENTIFIER'}),
+    'return_statement': frozenset({'return'}),
+    'try_statement': frozenset({'try'}),
+    'except_clause': frozenset({'except'}),
+    'raise_statement': frozenset({'raise'}),
+    'match_statement': frozenset({'match'}),
+    'case_clause': frozenset({'case'}),
+    'pattern': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'suite': frozenset({'+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'class', 'continue', 'def', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'expression_statement': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'expression': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'logical_or_expr': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'logical_and_expr': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'not_expr': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'comparison_expr': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'arith_expr': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'term': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'factor': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'power': frozenset({'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'atom_expr': frozenset({'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'atom': frozenset({'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True'}),
+    'string_literal_group': frozenset({'BUILTIN', 'STRING', 'STRING_QUOTE'}),
+    'string_literal': frozenset({'BUILTIN', 'STRING', 'STRING_QUOTE'}),
+    'number_literal': frozenset({'NUMBER'}),
+    'list_literal': frozenset({'LBRACKET'}),
+    'expression_list': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'trailer': frozenset({'.', 'LBRACKET', 'LPAREN'}),
+    'argument_list': frozenset({'+', '-', 'BUILTIN', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'not'}),
+    'identifier': frozenset({'BUILTIN', 'IDENTIFIER'}),
+}
+
+FOLLOW = {
+    'program': frozenset({'$'}),
+    'statement_list': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'simple_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'comment': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'assignment_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'if_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'while_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'for_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'function_def_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'class_def_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'parameter_list': frozenset({'RPAREN'}),
+    'identifier_list': frozenset({'RPAREN'}),
+    'return_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'try_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'except_clause': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'raise_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'match_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'case_clause': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'pattern': frozenset({'COLON', 'if'}),
+    'suite': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'expression_statement': frozenset({'$', '+', '-', 'BUILTIN', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'STRING', 'STRING_QUOTE', 'True', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'expression': frozenset({'$', '+', '-', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'logical_or_expr': frozenset({'$', '+', '-', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'pass', 'raise', 'return', 'try', 'while'}),
+    'logical_and_expr': frozenset({'$', '+', '-', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'not_expr': frozenset({'$', '+', '-', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'comparison_expr': frozenset({'$', '+', '-', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'arith_expr': frozenset({'!=', '$', '+', '-', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'term': frozenset({'!=', '$', '+', '-', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'factor': frozenset({'!=', '$', '%', '*', '+', '-', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'power': frozenset({'!=', '$', '%', '*', '+', '-', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'atom_expr': frozenset({'!=', '$', '%', '*', '**', '+', '-', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'atom': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'string_literal_group': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'string_literal': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'number_literal': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'list_literal': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'expression_list': frozenset({'RBRACKET'}),
+    'trailer': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+    'argument_list': frozenset({'RPAREN'}),
+    'identifier': frozenset({'!=', '$', '%', '*', '**', '+', '-', '.', '/', '//', '<', '<=', '==', '>', '>=', 'ASSIGN', 'BUILTIN', 'COLON', 'COMMA', 'COMMENT', 'False', 'IDENTIFIER', 'LBRACKET', 'LPAREN', 'NUMBER', 'None', 'RBRACKET', 'RPAREN', 'STRING', 'STRING_QUOTE', 'True', 'and', 'as', 'break', 'case', 'class', 'continue', 'def', 'elif', 'else', 'except', 'finally', 'for', 'if', 'in', 'is', 'match', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while'}),
+}
+
+STATEMENT_DISPATCH = {
+    '+': 'expression_statement',
+    '-': 'expression_statement',
+    'BUILTIN': ('assignment_statement', 'expression_statement'),
+    'COMMENT': 'comment',
+    'False': 'expression_statement',
+    'IDENTIFIER': ('assignment_statement', 'expression_statement'),
+    'LBRACKET': 'expression_statement',
+    'LPAREN': 'expression_statement',
+    'NUMBER': 'expression_statement',
+    'None': 'expression_statement',
+    'STRING': 'expression_statement',
+    'STRING_QUOTE': 'expression_statement',
+    'True': 'expression_statement',
+    'break': 'simple_statement',
+    'class': 'class_def_statement',
+    'continue': 'simple_statement',
+    'def': 'function_def_statement',
+    'for': 'for_statement',
+    'if': 'if_statement',
+    'match': 'match_statement',
+    'not': 'expression_statement',
+    'pass': 'simple_statement',
+    'raise': 'raise_statement',
+    'return': 'return_statement',
+    'try': 'try_statement',
+    'while': 'while_statement',
+}
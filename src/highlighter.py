@@ -1,127 +1,107 @@
 import tkinter as tk
 from tkinter import ttk
-from lexer import Lexer
-from parser import Parser
+from analysis_worker import AnalysisWorker
+from scheduler import PassScheduler
+from document import Document
+from themes import light_theme, dark_theme
 import re
-
-# Tema tanımları
-light_theme = {
-    'name': 'light',
-    'main_frame_bg': '#ffffff',
-    'text_area_bg': '#f8f8f8',
-    'text_area_fg': '#000000',
-    'line_numbers_bg': '#e0e0e0',
-    'line_numbers_fg': '#666666',
-    'select_bg': '#316AC5',
-    'scrollbar_bg': '#e0e0e0',
-    'scrollbar_troughcolor': '#ffffff',
-    'output_area_bg': '#f0f0f0',
-    'output_area_fg': '#000000',
-    'analysis_bg': '#f8f8f8',
-    'analysis_fg': '#000000',
-    'highlighter_colors': {
-        'KEYWORD': '#3a45cb',
-        'BUILTIN': '#FF9900',
-        'IDENTIFIER': '#1E0F0F',
-        'OPERATOR': '#D01F1F',
-        'ASSIGN': '#B5711D',
-        'NUMBER': '#36A016',
-        'STRING': '#063970',
-        'STRING_QUOTE': '#063970',
-        'STRING_CONTENT': '#063970',
-        'ESCAPE_CHAR': '#FF6600',
-        'COLON': '#DAA520',
-        'LPAREN': '#1E0F0F',
-        'RPAREN': '#1E0F0F',
-        'COMMA': '#1E0F0F',
-        'LBRACKET': '#1E0F0F',
-        'RBRACKET': '#1E0F0F',
-        'COMMENT': '#6F5F5F'
-    },
-    'error_tag_bg': '#ffcccc',
-    'error_label_fg_ok': 'green',
-    'error_label_fg_error': 'red',
-    'error_label_fg_default': 'black',
-    'bracket_match_bg': '#90EE90',
-    'bracket_match_fg': 'black',
-    'bracket_mismatch_bg': '#FFB6C1',
-    'bracket_mismatch_fg': 'black',
-    'completer_bg': '#ffffff',
-    'completer_fg': 'black',
-    'completer_select_bg': '#e0e0e0',
-    'completer_select_fg': 'black',
-}
-
-dark_theme = {
-    'name': 'dark',
-    'main_frame_bg': '#1a1a1a',
-    'text_area_bg': '#2d2d2d',
-    'text_area_fg': '#d3d3d3',
-    'line_numbers_bg': '#333333',
-    'line_numbers_fg': '#a9b7c6',
-    'select_bg': '#0078D7',
-    'scrollbar_bg': '#555555',
-    'scrollbar_troughcolor': '#1a1a1a',
-    'output_area_bg': '#333333',
-    'output_area_fg': '#d3d3d3',
-    'analysis_bg': '#2d2d2d',
-    'analysis_fg': '#d3d3d3',
-    'highlighter_colors': {
-        'KEYWORD': '#FF8C00',
-        'BUILTIN': '#DA70D6',
-        'IDENTIFIER': '#A9B7C6',
-        'OPERATOR': '#FF6B68',
-        'ASSIGN': '#A9B7C6',
-        'NUMBER': '#6897BB',
-        'STRING': '#6A8759',
-        'STRING_QUOTE': '#6A8759',
-        'STRING_CONTENT': '#6A8759',
-        'ESCAPE_CHAR': '#E6A23C',
-        'COLON': '#A9B7C6',
-        'LPAREN': '#A9B7C6',
-        'RPAREN': '#A9B7C6',
-        'COMMA': '#A9B7C6',
-        'LBRACKET': '#A9B7C6',
-        'RBRACKET': '#A9B7C6',
-        'COMMENT': '#808080'
-    },
-    'error_tag_bg': '#7f0000',
-    'error_label_fg_ok': '#77dd77',
-    'error_label_fg_error': '#ff6961',
-    'error_label_fg_default': '#d3d3d3',
-    'bracket_match_bg': '#3b873b',
-    'bracket_match_fg': '#d3d3d3',
-    'bracket_mismatch_bg': '#8b0000',
-    'bracket_mismatch_fg': '#d3d3d3',
-    'completer_bg': '#333333',
-    'completer_fg': '#d3d3d3',
-    'completer_select_bg': '#4b6eaf',
-    'completer_select_fg': '#d3d3d3',
-}
+from collections import namedtuple
 
 active_theme = light_theme.copy()
 
+# Görünür alan modunda görünür satırların üstünde ve altında önceden renklendirilen satır sayısı
+VIEWPORT_MARGIN = 50
+
+
+# Arka planda üretilen vurgulama sonucu: belgenin anlık görüntüsü ve hata bilgisi
+HighlightResult = namedtuple('HighlightResult', ['snapshot', 'error', 'error_ranges'])
+
+
+def merge_ranges(ranges):
+    """Başlangıca göre sıralı (başlangıç, bitiş) ofsetlerinden boş olmayan,
+    çakışan ve bitişik olanları birleşmiş aralık listesi"""
+    merged = []
+    for start, end in ranges:
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def complement_ranges(ranges, start, end):
+    """[start, end) içinde birleşmiş aralıkların dışında kalan aralıklar"""
+    result = []
+    pos = start
+    for range_start, range_end in ranges:
+        if range_start > pos:
+            result.append((pos, min(range_start, end)))
+        pos = max(pos, range_end)
+        if pos >= end:
+            break
+    if pos < end:
+        result.append((pos, end))
+    return result
+
 class Highlighter:
-    def __init__(self, text_area, error_label):
+    """Kod alanını token türlerine göre renklendirir ve hataları işaretler.
+
+    viewport=True ise yalnızca görünür satırlar (ve üstünde/altında margin
+    satır) etiketlenir; kaydırıldıkça yeni görünen bölgeler etiketlenir.
+    Diğer satırların tokenları IncrementalLexer'da bellekte kalır, böylece
+    etiketleme maliyeti dosya uzunluğuna değil pencere yüksekliğine bağlıdır.
+
+    Etiketler her geçişte silinip yeniden eklenmez: Tk etiketleri metinle
+    birlikte kaydığından yalnızca IncrementalLexer'ın yeniden taradığı
+    satırlar güncellenir ve her etiket için tek bir çok aralıklı tag remove /
+    tag add çağrısı yapılır.
+
+    background=True ise tokenize ve ayrıştırma AnalysisWorker iş
+    parçacığında yapılır; sonuç after() ile ana iş parçacığında uygulanır,
+    eskimiş nesillerin sonuçları atılır.
+
+    Geçişler PassScheduler ile zamanlanır ('highlight'); verilmezse
+    widget'a ait yeni bir zamanlayıcı kullanılır. Metin, tokenlar ve
+    ayrıştırma ağacı Document'in anlık görüntüsünden okunur; verilmezse
+    widget'a ait yeni bir Document kullanılır.
+    """
+    def __init__(self, text_area, error_label, viewport=False, margin=VIEWPORT_MARGIN, background=False,
+                 scheduler=None, document=None):
         self.text_area = text_area
         self.error_label = error_label
-        self.lexer = Lexer()
+        self.viewport = viewport
+        self.margin = margin
+        # satır başına Tk'ya uygulanmış token listesi (etiketlenmemiş satırlar için None);
+        # None ise Tk'daki etiketler bilinmiyordur ve hepsi silinip yeniden eklenir
+        self.applied_lines = None
+        self.document = document or Document(text_area)
+        # analize gönderilen ve Tk'ya son uygulanan anlık görüntüler
+        self.submitted = None
+        self.shown = None
+        # son uygulanan görüntünün satır tokenları
+        self.lines = [[]]
+        self.checkpoints = [True]
+        self.line_index = None
+        self.visible_scheduled = False
         self.syntax_colors = {}
         self.error_background_color = ''
-        self.last_code = ""
         self.last_error_message = ""
-        self.highlight_scheduled = False
+        self.worker = AnalysisWorker(text_area, self.analyze, self.apply_result, background=background)
+        # arka planda analiz süresi de geçişin maliyetine katılır
+        self.scheduler = scheduler or PassScheduler(text_area)
+        self.scheduler.add('highlight', self.perform_highlight,
+                           background=(lambda: self.worker.duration) if background else None)
         self.update_theme_settings()
         self.bind_events()
         self.text_area.after(50, self.initial_highlight)
 
     def bind_events(self):
-        events = ['<KeyRelease>', '<Button-1>', '<ButtonRelease-1>',
-                  '<Configure>', '<Expose>', '<FocusIn>', '<MouseWheel>',
-                  '<Control-z>', '<Control-y>']
-        for event in events:
-            self.text_area.bind(event, self.schedule_highlight, add='+')
-        self.text_area.bind('<Control-v>', self.on_paste, add='+')
+        # yalnızca düzenlemeler vurgulamayı ister; tıklama, odak ve pencere olayları
+        # hiçbir iş yaptırmaz, kaydırmada yeni görünen satırlar yscrollcommand ile etiketlenir
+        self.document.edits.add_listener(self.schedule_highlight)
 
     def initial_highlight(self):
         if self.text_area.winfo_exists():
@@ -142,67 +122,98 @@ class Highlighter:
         except tk.TclError:
             return
         if self.text_area.winfo_exists():
-            self.last_code = ""
+            self.submitted = None
             self.schedule_highlight()
 
-    def on_paste(self, event=None):
-        self.text_area.after_idle(self.schedule_highlight)
-
-    def schedule_highlight(self, event=None):
-        if not self.highlight_scheduled:
-            if not self.text_area.winfo_exists():
-                return
-            self.highlight_scheduled = True
-            self.text_area.after(100, self.perform_highlight)
+    def schedule_highlight(self, delta=None):
+        self.scheduler.schedule('highlight')
 
     def perform_highlight(self):
         if not self.text_area.winfo_exists():
-            self.highlight_scheduled = False
             return
-        self.highlight_scheduled = False
         self.highlight()
 
     def highlight(self, event=None):
         if not self.text_area.winfo_exists():
             return
-        try:
-            code = self.text_area.get('1.0', tk.END).rstrip('\n')
-        except tk.TclError:
+        snapshot = self.document.snapshot()
+        if snapshot is None:
             return
-        if code == self.last_code:
+        if snapshot is self.submitted:
+            if self.viewport and snapshot is self.shown:
+                self.tag_window()
             return
-        self.clear_syntax_tags()
-        if not code.strip():
-            self.update_error_label_display("", 'default')
-            self.clear_error_tag()
-            self.last_code = code
-            self.last_error_message = ""
+        self.submitted = snapshot
+        self.worker.submit(snapshot)
+
+    def analyze(self, snapshot):
+        """Görüntüyü tokenize edip ayrıştır; Tk'ya dokunmaz (arka plan iş parçacığında çalışabilir).
+        Görüntü yerini yenisine bıraktıysa None"""
+        if not snapshot.lex():
+            return None
+        error, error_ranges = None, []
+        if snapshot.lex_error is None and snapshot.code.strip():
+            # hatalı karakterler ERROR tokenı olur; tek geçişte tüm belge renklenir
+            error_tokens = snapshot.error_tokens()
+            if error_tokens:
+                error = self.document.lexer.error_message(error_tokens[0])
+                error_ranges = [(token.start_index, token.end_index) for token in error_tokens]
+            else:
+                snapshot.parse()
+                if not snapshot.parsed:
+                    return None
+                errors = snapshot.errors or []
+                if snapshot.parse_error is not None:
+                    error = snapshot.parse_error
+                elif errors:
+                    more = f" (+{len(errors) - 1} more)" if len(errors) > 1 else ""
+                    error = errors[0].value + more
+                    line_index = snapshot.line_index()
+                    error_ranges = [(line_index.tk_index(node.start), line_index.tk_index(node.end))
+                                    for node in errors]
+        return HighlightResult(snapshot, error, error_ranges)
+
+    def apply_result(self, result):
+        """Analiz sonucunu kod alanına uygula (ana iş parçacığında)"""
+        if not self.text_area.winfo_exists():
             return
-        try:
-            tokens_with_positions = self.tokenize_code_with_positions(code)
-            tokens_for_parser = [(t[0], t[1], t[2]) for t in tokens_with_positions]
-            parser = Parser(tokens_for_parser)
-            parser.parse()
-            self.apply_syntax_highlighting(tokens_with_positions)
+        if result is None or self.worker.background and self.document.snapshot() is not result.snapshot:
+            # sonuç istendikten sonra metin değişti; bir sonraki geçiş uygular
+            self.schedule_highlight()
+            return
+        snapshot = result.snapshot
+        if snapshot is not self.shown:
+            if snapshot.lex_error is not None:
+                change = None
+            else:
+                # son uygulanan görüntüden bu yana yeniden taranan satırlar
+                change = self.document.changes_since(self.shown and self.shown.version, snapshot.version)
+                if change is None:
+                    self.applied_lines = None
+                    change = (1, len(snapshot.lines), 0)
+            self.shown = snapshot
+            self.lines, self.checkpoints = snapshot.lines, snapshot.checkpoints
+            self.line_index = snapshot.line_index()
+            if not snapshot.code.strip():
+                self.clear_syntax_tags()
+                self.update_error_label_display("", 'default')
+                self.clear_error_tag()
+                self.last_error_message = ""
+                return
+            self.update_syntax_tags(snapshot.code, change)
+        if result.error is not None:
+            self.set_error_ranges(result.error_ranges)
+            if result.error != self.last_error_message:
+                self.update_error_label_display(f"Error: {result.error}", 'error')
+            self.last_error_message = result.error
+        else:
             self.clear_error_tag()
             new_status_message = "✓ Syntax OK"
             if self.last_error_message != new_status_message:
                 self.update_error_label_display(new_status_message, 'ok')
             self.last_error_message = new_status_message
-        except (ValueError, SyntaxError) as e:
-            error_msg_text = str(e)
-            try:
-                if 'tokens_with_positions' not in locals() or not tokens_with_positions:
-                    tokens_with_positions = self.tokenize_code_with_positions(code, suppress_errors=True)
-                self.apply_syntax_highlighting(tokens_with_positions)
-            except:
-                pass
-            if error_msg_text != self.last_error_message:
-                self.update_error_label_display(f"Error: {error_msg_text}", 'error')
-            self.last_error_message = error_msg_text
-            self.apply_error_tag()
-        finally:
-            self.last_code = code
+        if self.viewport:
+            self.tag_window()
 
     def update_error_label_display(self, message, status_key):
         global active_theme
@@ -215,46 +226,133 @@ class Highlighter:
         except tk.TclError:
             pass
 
-    def tokenize_code_with_positions(self, code, suppress_errors=False):
-        tokens_with_pos = []
+    def update_syntax_tags(self, code, change):
+        """Yeniden taranan satırların etiketlerini güncelle; diğer satırlara dokunma.
+
+        Değişmeyen satırların etiketleri metinle birlikte kaydığı için geçerli
+        kalır. Yeniden taranan satırlarda karakter başına etiket durumu
+        bilinemez: bir geçişe birden fazla ekleme/silme düşebilir (otomatik
+        tamamlama, geri alma, seçimin üzerine yapıştırma) ve Tk eklenen metne
+        iki yanındaki ortak etiketleri verir. Bu yüzden orada eski etiketler
+        yeni aralıkların dışında kalan her yerden kaldırılır, yeni aralıklar
+        eklenir. change, son uygulanan görüntüye göre (ilk, son, satır farkı)
+        değişikliğidir; None ise tarama başarısız olmuştur.
+        """
+        if change is None:
+            self.clear_syntax_tags()
+            return
+        lines = self.lines
+        applied = self.applied_lines
+        if applied is None or len(applied) + change[2] != len(lines):
+            self.clear_syntax_tags()
+            applied = [None] * len(lines)
+            first, last = 1, len(lines)
+            old_last = last
+        else:
+            first, last, delta = change
+            old_last = last - delta
+        old_tags = {token_type for line_tokens in applied[first - 1:old_last] if line_tokens
+                    for token_type, _, _ in line_tokens}
+        covered_first, covered_last = (self.visible_lines() or (1, 0)) if self.viewport else (1, len(lines))
+        applied[first - 1:old_last] = [lines[number - 1] if covered_first <= number <= covered_last else None
+                                       for number in range(first, last + 1)]
+        self.applied_lines = applied
+
+        ranges = self.line_ranges(range(first, last + 1))
+        starts = self.line_index.starts
+        zone_start = starts[first - 1]
+        zone_end = starts[last] if last < len(starts) else len(code)
+        removed = {tag: complement_ranges(ranges.get(tag, ()), zone_start, zone_end)
+                   for tag in old_tags if tag in self.syntax_colors}
+        self.apply_tag_changes(removed, ranges)
+
+    def line_ranges(self, numbers):
+        """Verilen satırlarda uygulanmış tokenlardan etiket -> birleşmiş ofset aralıkları"""
+        applied = self.applied_lines
+        starts = self.line_index.starts
+        colors = self.syntax_colors
+        ranges = {}
+        for number in numbers:
+            line_tokens = applied[number - 1]
+            if not line_tokens:
+                continue
+            line_start = starts[number - 1] - 1
+            for token_type, value, col in line_tokens:
+                if token_type in colors:
+                    start = line_start + col
+                    ranges.setdefault(token_type, []).append((start, start + len(value)))
+        return {tag: merge_ranges(tag_ranges) for tag, tag_ranges in ranges.items()}
+
+    def apply_tag_changes(self, removed, added):
+        """Her etiket için en fazla bir tag remove ve bir tag add çağrısı.
+
+        Tk boş bir aralık gördüğünde sonraki aralıkları da atladığı için
+        aralıklar birleşmiş ve boş olmayan ofset aralıkları olmalıdır.
+        """
+        text_area = self.text_area
+        tk_index = self.line_index.tk_index
+        try:
+            for tag, ranges in removed.items():
+                if ranges:
+                    # tkinter'in tag_remove'u tek aralık alır
+                    text_area.tk.call(text_area._w, 'tag', 'remove', tag,
+                                      *[tk_index(pos) for tag_range in ranges for pos in tag_range])
+            for tag, ranges in added.items():
+                if ranges:
+                    text_area.tag_add(tag, *[tk_index(pos) for tag_range in ranges for pos in tag_range])
+        except tk.TclError:
+            pass
+
+    def schedule_visible_highlight(self, *args):
+        """Kaydırmada (yscrollcommand) yeni görünen satırları boşta etiketle"""
+        if self.viewport and not self.visible_scheduled:
+            self.visible_scheduled = True
+            self.text_area.after_idle(self.perform_visible_highlight)
+
+    def perform_visible_highlight(self):
+        self.visible_scheduled = False
+        if self.text_area.winfo_exists():
+            self.tag_visible_lines()
+
+    def visible_lines(self):
+        """Görünür satırlar ve margin kadar çevresi (1 tabanlı, dahil) veya None"""
         try:
-            basic_tokens = self.lexer.tokenize_with_escape_highlighting(code)
-        except ValueError as e:
-            if suppress_errors:
-                return tokens_with_pos
-            raise
-        for token_type, token_value, (line, col) in basic_tokens:
-            char_pos = self.find_char_position(code, line, col)
-            start_tk_pos = self.char_to_tkinter_pos(code, char_pos)
-            end_tk_pos = self.char_to_tkinter_pos(code, char_pos + len(token_value))
-            tokens_with_pos.append((token_type, token_value, (line, col), start_tk_pos, end_tk_pos))
-        return tokens_with_pos
-
-    def find_char_position(self, code, target_line, target_col):
-        lines = code.split('\n')
-        char_pos = 0
-        for i in range(target_line - 1):
-            if i < len(lines):
-                char_pos += len(lines[i]) + 1
-        char_pos += target_col - 1
-        return char_pos
-
-    def char_to_tkinter_pos(self, text, char_index):
-        if char_index > len(text):
-            char_index = len(text)
-        text_until_pos = text[:char_index]
-        lines = text_until_pos.split('\n')
-        return f"{len(lines)}.{len(lines[-1])}"
-
-    def apply_syntax_highlighting(self, tokens_with_positions):
-        for token_type, _, _, start_pos, end_pos in tokens_with_positions:
-            if token_type in self.syntax_colors:
-                try:
-                    self.text_area.tag_add(token_type, start_pos, end_pos)
-                except tk.TclError:
-                    pass
+            first = int(self.text_area.index('@0,0').split('.')[0])
+            last = int(self.text_area.index('@0,%d' % self.text_area.winfo_height()).split('.')[0])
+        except tk.TclError:
+            return None
+        # metin sonundaki boş satırlar analiz edilen koda dahil değildir
+        first = max(1, min(first, len(self.lines)) - self.margin)
+        last = min(len(self.lines), last + self.margin)
+        # çok satırlı bir string'in içinden başlanırsa string'in başladığı satıra dön
+        while first > 1 and not self.checkpoints[first - 1]:
+            first -= 1
+        return first, last
+
+    def tag_visible_lines(self):
+        """Görünür satırları ve margin kadar çevresini, henüz etiketlenmemişse etiketle"""
+        # metin son uygulanan sonuçtan sonra değiştiyse satır tokenları ona ait değildir;
+        # sıradaki geçiş etiketler
+        if self.applied_lines is not None and self.document.snapshot() is self.shown:
+            self.tag_window()
+
+    def tag_window(self):
+        if self.applied_lines is None:
+            return
+        window = self.visible_lines()
+        if window is None:
+            return
+        applied = self.applied_lines
+        missing = [number for number in range(window[0], window[1] + 1) if applied[number - 1] is None]
+        if not missing:
+            return
+        for number in missing:
+            applied[number - 1] = self.lines[number - 1]
+        # etiketlenmemiş satırlarda etiket yoktur; yalnızca eklenir
+        self.apply_tag_changes({}, self.line_ranges(missing))
 
     def clear_syntax_tags(self):
+        self.applied_lines = None
         if not self.text_area.winfo_exists():
             return
         try:
@@ -264,28 +362,38 @@ class Highlighter:
             pass
 
     def clear_error_tag(self):
-        if not self.text_area.winfo_exists():
-            return
-        try:
-            self.text_area.tag_remove('ERROR', '1.0', tk.END)
-        except tk.TclError:
-            pass
+        self.set_error_ranges([])
+
+    def set_error_ranges(self, ranges):
+        """ERROR etiketini yalnızca verilen (başlangıç, bitiş) Tk aralıklarına uygula.
 
-    def apply_error_tag(self):
+        Aralıklar zaten etiketliyse Tk'ya dokunulmaz; değilse yalnızca eski
+        aralıklardan kaldırılıp yenilerine eklenir, belgenin geri kalanı
+        yeniden çizilmez.
+        """
         if not self.text_area.winfo_exists():
             return
         try:
-            self.text_area.tag_add('ERROR', '1.0', tk.END)
+            current = [str(index) for index in self.text_area.tag_ranges('ERROR')]
+            if current == [index for error_range in ranges for index in error_range]:
+                return
+            for start in range(0, len(current), 2):
+                self.text_area.tag_remove('ERROR', current[start], current[start + 1])
+            for start_index, end_index in ranges:
+                self.text_area.tag_add('ERROR', start_index, end_index)
         except tk.TclError:
             pass
 
 class BracketMatcher:
-    def __init__(self, text_area):
+    def __init__(self, text_area, scheduler=None, document=None):
         self.text_area = text_area
+        self.document = document or Document(text_area)
         self.bracket_pairs = {'(': ')', '[': ']', '{': '}', ')': '(', ']': '[', '}': '{'}
         self.open_brackets = {'(', '[', '{'}
         self.close_brackets = {')', ']', '}'}
-        self.check_scheduled = False
+        # ucuz geçiştir; zamanlayıcı ölçtükçe beklemeden çalıştırır
+        self.scheduler = scheduler or PassScheduler(text_area)
+        self.scheduler.add('brackets', self.perform_bracket_check)
         self.update_theme_settings()
         self.bind_events()
 
@@ -310,17 +418,11 @@ class BracketMatcher:
             pass
 
     def schedule_bracket_check(self, event=None):
-        if not self.check_scheduled:
-            if not self.text_area.winfo_exists():
-                return
-            self.check_scheduled = True
-            self.text_area.after(100, self.perform_bracket_check)
+        self.scheduler.schedule('brackets')
 
     def perform_bracket_check(self):
         if not self.text_area.winfo_exists():
-            self.check_scheduled = False
             return
-        self.check_scheduled = False
         self.check_bracket_at_cursor()
 
     def check_bracket_at_cursor(self):
@@ -360,9 +462,13 @@ class BracketMatcher:
             pass
 
     def find_matching_bracket(self, start_pos, bracket_char):
-        text = self.text_area.get('1.0', tk.END)
+        snapshot = self.document.snapshot()
+        if snapshot is None:
+            return
+        text = snapshot.text
+        line_index = snapshot.line_index()
         start_line, start_col = map(int, start_pos.split('.'))
-        start_idx = sum(len(line) + 1 for line in text.split('\n')[:start_line - 1]) + start_col
+        start_idx = line_index.offset(start_line, start_col + 1)
         target_bracket = self.bracket_pairs[bracket_char]
         stack = []
         if bracket_char in self.open_brackets:
@@ -373,7 +479,7 @@ class BracketMatcher:
                     if stack:
                         stack.pop()
                     else:
-                        return self.char_to_tkinter_pos(text, i)
+                        return line_index.tk_index(i)
             return
         else:
             for i in range(start_idx - 1, -1, -1):
@@ -383,19 +489,13 @@ class BracketMatcher:
                     if stack:
                         stack.pop()
                     else:
-                        return self.char_to_tkinter_pos(text, i)
+                        return line_index.tk_index(i)
             return
 
-    def char_to_tkinter_pos(self, text, char_index):
-        if char_index > len(text):
-            char_index = len(text)
-        text_until_pos = text[:char_index]
-        lines = text_until_pos.split('\n')
-        return f"{len(lines)}.{len(lines[-1])}"
-
 class AutoCompleter:
-    def __init__(self, text_area):
+    def __init__(self, text_area, document=None):
         self.text_area = text_area
+        self.document = document or Document(text_area)
         self.completion_window = None
         self.completion_listbox = None
         self.current_word = ""
@@ -413,7 +513,6 @@ class AutoCompleter:
             'hasattr', 'getattr', 'setattr', 'dir', 'help', 'id', 'hex', 'oct', 'bin',
             'format'
         ]
-        self.lexer = Lexer()
         self.update_theme_settings()
         self.bind_events()
 
@@ -507,13 +606,13 @@ class AutoCompleter:
         """Yazılan kelimeye uygun önerileri bul"""
         word_lower = word.lower()
         matches = []
-        # Kod içindeki tanımlayıcıları da ekle
-        try:
-            code = self.text_area.get('1.0', tk.END).rstrip('\n')
-            tokens = self.lexer.tokenize(code)
-            identifiers = [token[1] for token in tokens if token[0] == 'IDENTIFIER']
-            all_completions = sorted(set(self.completions + identifiers))
-        except:
+        # Kod içindeki tanımlayıcıları da ekle; belge vurgulayıcının son taradığı
+        # görüntüden okunur, tuş vuruşu başına ikinci bir tokenize yapılmaz; ana
+        # iş parçacığı taramayı (lex_lock) beklemez
+        snapshot = self.document.lexed_snapshot
+        if snapshot is not None:
+            all_completions = sorted(set(self.completions) | snapshot.identifiers())
+        else:
             all_completions = self.completions
         for completion in all_completions:
             if completion.lower().startswith(word_lower) and completion != word:
@@ -591,7 +690,7 @@ class AutoCompleter:
                 selected_word = self.completion_listbox.get(selection[0])
                 self.text_area.delete(self.word_start_pos, tk.INSERT)
                 self.text_area.insert(self.word_start_pos, selected_word)
-                self.text_area.event_generate('<KeyRelease>')  # Syntax highlighter'ı tetikle
+                self.text_area.event_generate('<KeyRelease>')  # satır numaraları ve parantez eşleştirme
         except tk.TclError:
             pass
         finally:
@@ -0,0 +1,633 @@
+from bisect import bisect_left
+from itertools import chain
+from operator import itemgetter, sub
+
+from block_list import BlockList, BlockLineIndex
+from lexer import Lexer, LineIndex, Token, INTERNED_KINDS, symbol_pool
+from parser import Node, Parser, rebase_statements
+
+# düzenlenen satırlardan sonra ilk taranan satır sayısı; akış pencerede hizalanmazsa pencere büyür
+RELEX_WINDOW = 16
+# ofsetin satırı aranırken satırlar bu büyüklükte bloklarla atlanır
+LOCATE_STEP = 256
+# LineTokens'ın bir seferde konumlandırdığı token sayısı ve istenen tokendan
+# önce kalan pay (Parser bir önceki tokenın bitişine geri bakar)
+WINDOW_TOKENS = 64
+WINDOW_BACK = 8
+
+# düz akışta string'in tırnakları arasındaki parçalar tek STRING tokenıdır
+STRING_PART_KINDS = frozenset(('STRING_CONTENT', 'ESCAPE_CHAR'))
+
+
+def plain_count(line_tokens):
+    """Satırın düz token sayısı: string parçaları tek STRING tokenı sayılır"""
+    count = quotes = 0
+    for token_type, _, _ in line_tokens:
+        if token_type == 'STRING_QUOTE':
+            quotes += 1
+        elif token_type not in STRING_PART_KINDS:
+            count += 1
+    return count + quotes // 2
+
+
+def error_count(line_tokens):
+    """Satırdaki ERROR tokenlarının sayısı"""
+    return sum(1 for token_type, _, _ in line_tokens if token_type == 'ERROR')
+
+
+def tokens_before_line(tokens, line):
+    """line satırından (1 tabanlı) önce başlayan token sayısı; tokenlar satıra göre sıralıdır"""
+    if tokens.__class__ is LineTokens:
+        return tokens.line_offset(line)
+    low, high = 0, len(tokens)
+    while low < high:
+        middle = (low + high) // 2
+        if tokens[middle][2][0] < line:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def compute_edit(old_code, new_code):
+    """İki metin arasındaki tek düzenlemeyi (ofset, silinen uzunluk, eklenen metin) bul"""
+    limit = min(len(old_code), len(new_code))
+    # ortak önek: dilim karşılaştırmalarıyla ikili arama
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old_code[low:mid] == new_code[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    prefix = low
+    # ortak sonek (önekle çakışmadan)
+    low, high = 0, limit - prefix
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old_code[len(old_code) - mid:len(old_code) - low] == new_code[len(new_code) - mid:len(new_code) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    suffix = low
+    removed = len(old_code) - prefix - suffix
+    inserted = new_code[prefix:len(new_code) - suffix]
+    return prefix, removed, inserted
+
+
+class IncrementalLexer:
+    """Önceki token akışını satır satır tutar ve düzenlemelerde yalnızca hasarlı bölgeyi yeniden tokenize eder.
+
+    Her satır için bir kontrol noktası saklanır: satır başı bir token sınırındaysa
+    (çok satırlı bir string'in içinde değilse) tokenize oradan yeniden başlayabilir.
+    Düzenlemenin ardından yeni akış eski akışla bir kontrol noktasında
+    yeniden hizalandığında tarama durur.
+
+    Metin satır satır tutulur; düzenleme tüm metni yeniden kurmaz. Ofsetin
+    satırı son düzenlenen satırdan yürünerek bulunur ve yalnızca düzenlenen
+    satırlarla ardından gelen RELEX_WINDOW satırlık pencere taranır; akış
+    pencerede hizalanmazsa pencere büyütülür. Böylece yerel düzenlemelerin
+    süresi belge uzunluğundan bağımsızdır.
+
+    Satır tokenları, kontrol noktaları, satır başına düz token ve ERROR
+    tokenı sayıları ve satır indeksi değişmez BlockList'lerdir; düzenleme yalnızca değişen
+    blokları yeniden kurar. Bu yüzden bir sürümün satırları kopyalanmadan
+    paylaşılabilir ve line_tokens() O(1)'de bir LineTokens görünümü verir.
+    """
+    def __init__(self, lexer=None):
+        self.lexer = lexer or Lexer()
+        self.texts = ['']          # satır metinleri (satır sonu hariç)
+        self.length = 0            # metnin uzunluğu
+        self._code = ''            # birleştirilmiş metin; düzenlemeden sonra istenince kurulur
+        self.lines = BlockList([[]])          # satır başına (tür, değer, sütun) listeleri
+        self.checkpoints = BlockList([True])  # satır başı token sınırında mı
+        self.counts = BlockList([0], summed=True)  # satır başına düz token sayısı
+        self.error_counts = BlockList([0], summed=True)  # satır başına ERROR tokenı sayısı
+        self.line_index = BlockLineIndex.from_code('')
+        self.unstable = set()      # kapanmamış tırnak içeren satırlar (hata kurtarma modunda)
+        self.cursor = (0, 0)       # son düzenlenen satır ve başlangıç ofseti
+        self.symbols = symbol_pool()  # düzenlemeler boyunca paylaşılan token değerleri
+        self.valid = True
+
+    @property
+    def code(self):
+        if self._code is None:
+            self._code = '\n'.join(self.texts)
+        return self._code
+
+    def reset(self, code):
+        """Tüm metni baştan tokenize et"""
+        self.set_text(code)
+        self.valid = False
+        self.symbols = symbol_pool()
+        lines, checkpoints, unstable, _, _ = self._relex(code, 0, None, 0, True)
+        self.lines = BlockList(lines)
+        self.checkpoints = BlockList(checkpoints)
+        self.counts = BlockList(map(plain_count, lines), summed=True)
+        self.error_counts = BlockList(map(error_count, lines), summed=True)
+        self.unstable = set(unstable)
+        self.valid = True
+
+    def set_text(self, code):
+        self.texts = code.split('\n')
+        self.length = len(code)
+        self._code = code
+        self.cursor = (0, 0)
+        self.line_index = BlockLineIndex.from_code(code)
+
+    def update(self, code):
+        """Yeni metni önceki metinle karşılaştırıp artımlı olarak uygula"""
+        if not self.valid:
+            self.reset(code)
+            return 1, len(self.lines)
+        offset, removed, inserted = compute_edit(self.code, code)
+        return self.edit(offset, removed, inserted)
+
+    def locate(self, offset, line, start):
+        """Ofsetin bulunduğu satır ve satırın başlangıç ofseti; start ofsetinde başlayan satırdan yürünür"""
+        texts = self.texts
+        # uzak ofsetlere LOCATE_STEP satırlık bloklarla gidilir
+        while offset < start:
+            block = texts[max(0, line - LOCATE_STEP):line]
+            line -= len(block)
+            start -= sum(map(len, block)) + len(block)
+        while True:
+            block = texts[line:line + LOCATE_STEP]
+            block_end = start + sum(map(len, block)) + len(block)
+            if offset < block_end or len(block) < LOCATE_STEP:
+                break
+            line += LOCATE_STEP
+            start = block_end
+        while offset > start + len(texts[line]):
+            start += len(texts[line]) + 1
+            line += 1
+        return line, start
+
+    def edit(self, offset, removed_length, inserted_text):
+        """Düzenlemeyi uygula; yeniden tokenize edilen (ilk, son) satır aralığını döndür (1 tabanlı)"""
+        offset = max(0, min(offset, self.length))
+        removed_length = max(0, min(removed_length, self.length - offset))
+        texts = self.texts
+        edit_line, line_start = self.locate(offset, *self.cursor)
+        end_line, end_start = self.locate(offset + removed_length, edit_line, line_start)
+        edited = (texts[edit_line][:offset - line_start] + inserted_text +
+                  texts[end_line][offset + removed_length - end_start:]).split('\n')
+        texts[edit_line:end_line + 1] = edited
+        self.length += len(inserted_text) - removed_length
+        self.line_index = self.line_index.edited(offset, removed_length, inserted_text)
+        self._code = None
+        self.cursor = (edit_line, line_start)
+        if not self.valid:
+            self.reset(self.code)
+            return 1, len(self.lines)
+
+        line_delta = len(edited) - (end_line - edit_line + 1)
+        last_edited_line = edit_line + inserted_text.count('\n')
+
+        # en yakın kontrol noktasına geri dön; kapanmamış bir tırnak sonradan
+        # eklenen metinle string'e dönüşebileceği için o satırdan başlanır
+        restart_line = min((line for line in self.unstable if line < edit_line), default=edit_line)
+        while not self.checkpoints[restart_line]:
+            restart_line -= 1
+
+        # önce düzenlenen satırlar ve ardından RELEX_WINDOW satır taranır
+        count = last_edited_line - restart_line + 1 + RELEX_WINDOW
+        while True:
+            complete = restart_line + count >= len(texts)
+            window = '\n'.join(texts[restart_line:restart_line + count])
+            try:
+                result = self._relex(window if complete else window + '\n', restart_line,
+                                     last_edited_line, line_delta, complete)
+            except ValueError:
+                if complete:
+                    self.valid = False
+                    if restart_line:
+                        # hata mesajındaki satır pencereye değil tüm metne göre olsun
+                        restart_pos = line_start - sum(map(len, texts[restart_line:edit_line])) - (edit_line - restart_line)
+                        for _ in self.lexer.scan_spans(self.code, restart_pos):
+                            pass
+                    raise
+                result = None
+            if result is not None:
+                break
+            # pencere içinde hizalanmadı veya bir string pencerenin dışına taşıyor olabilir
+            count *= 2
+        lines, checkpoints, unstable, stop_line, old_stop_line = result
+        self.lines = self.lines.splice(restart_line, old_stop_line, lines)
+        self.checkpoints = self.checkpoints.splice(restart_line, old_stop_line, checkpoints)
+        self.counts = self.counts.splice(restart_line, old_stop_line, [plain_count(line) for line in lines])
+        self.error_counts = self.error_counts.splice(restart_line, old_stop_line, [error_count(line) for line in lines])
+        shift = len(lines) - (old_stop_line - restart_line)
+        self.unstable = {line if line < restart_line else line + shift
+                         for line in self.unstable if not restart_line <= line < old_stop_line}
+        self.unstable.update(unstable)
+        return restart_line + 1, stop_line
+
+    def _relex(self, code, first_line, last_edited_line, line_delta, complete):
+        """code'u first_line satırından itibaren tara; eski akışla hizalanınca dur.
+
+        code, complete False ise belgenin sonuna kadar gitmeyen satır sonuyla
+        biten bir penceredir; pencerede hizalanmazsa veya pencerede kapanmayan
+        bir tırnak bulunursa None döner.
+        """
+        lexer = self.lexer
+        symbols = self.symbols
+        old_checkpoints = self.checkpoints
+        lines = []
+        checkpoints = []
+        unstable = []
+        current = []
+        at_boundary = True
+        open_quote = False
+        line = first_line
+        line_start = 0
+        for token_type, start, end in lexer.scan_spans(code):
+            value = code[start:end]
+            col = start - line_start + 1
+
+            if token_type == 'NEWLINE':
+                lines.append(current)
+                checkpoints.append(at_boundary)
+                if open_quote:
+                    unstable.append(line)
+                current = []
+                at_boundary = True
+                open_quote = False
+                line += 1
+                line_start = end
+                old_line = line - line_delta
+                if (last_edited_line is not None and line > last_edited_line
+                        and old_line < len(old_checkpoints) and old_checkpoints[old_line]):
+                    return lines, checkpoints, unstable, line, old_line
+            elif token_type == 'STRING':
+                for part_type, part_value, (_, part_col) in lexer.parse_string_with_escapes(value, line + 1, col, symbols):
+                    current.append((part_type, part_value, part_col))
+                newlines = value.count('\n')
+                if newlines:
+                    # string'in kapsadığı satırlar kontrol noktası değildir
+                    lines.append(current)
+                    checkpoints.append(at_boundary)
+                    if open_quote:
+                        unstable.append(line)
+                    for _ in range(newlines - 1):
+                        lines.append([])
+                        checkpoints.append(False)
+                    open_quote = False
+                    current = []
+                    at_boundary = False
+                    line += newlines
+                    line_start = start + value.rfind('\n') + 1
+            else:
+                if token_type in INTERNED_KINDS:
+                    value = symbols.setdefault(value, value)
+                elif token_type == 'ERROR' and ('"' in value or "'" in value):
+                    # pencerede kapanmayan tırnak pencere dışında kapanabilir
+                    if not complete:
+                        return None
+                    open_quote = True
+                current.append((token_type, value, col))
+
+        if not complete:
+            return None
+        lines.append(current)
+        checkpoints.append(at_boundary)
+        if open_quote:
+            unstable.append(line)
+        return lines, checkpoints, unstable, line + 1, len(old_checkpoints)
+
+    def tokens(self):
+        """tokenize_with_escape_highlighting ile aynı biçimde tüm tokenlar"""
+        result = []
+        if not self.code.strip():
+            return result
+        for number, line_tokens in enumerate(self.lines, 1):
+            for token_type, value, col in line_tokens:
+                result.append((token_type, value, (number, col)))
+        return result
+
+    def tokens_with_positions(self):
+        """Lexer.tokenize_with_positions ile aynı biçimde Token listesi"""
+        return self.lexer.attach_positions(self.tokens(), LineIndex(self.code))
+
+    def line_tokens(self):
+        """Geçerli sürümün düz Token görünümü (LineTokens); satırlar kopyalanmaz"""
+        return LineTokens(self.lines, self.counts, self.line_index)
+
+
+class LineTokens:
+    """IncrementalLexer satırlarının düz Token dizisi görünümü.
+
+    Tokenlar Lexer.tokenize_with_positions'taki Token'lardır, string
+    parçaları tek STRING tokenında birleşir. Satır listeleri, satır başına
+    token sayıları ve satır indeksi değişmez olduğundan görünüm O(1)'de
+    kurulur ve sonraki düzenlemelerden etkilenmez; tokenlar yalnızca
+    istendiklerinde satır satır konumlandırılır. Son konumlandırılan pencere
+    saklanır: Parser tokenlara sırayla eriştiği için erişimlerin çoğu
+    pencereden karşılanır. line_offset(satır) o satırdan önceki token
+    sayısıdır; IncrementalParser değişmeyen önek ve soneki bununla bulur.
+    """
+    def __init__(self, lines, counts, line_index):
+        self.lines = lines
+        self.counts = counts
+        self.line_index = line_index
+        self.length = counts.total()
+        # (ilk token indeksi, konumlandırılmış tokenlar); tek atamayla yenilenir
+        self.window = (0, ())
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.positioned(0, len(self.lines)))
+
+    def __getitem__(self, index):
+        if index.__class__ is slice:
+            return [self[position] for position in range(*index.indices(self.length))]
+        first, tokens = self.window
+        if 0 <= index - first < len(tokens):
+            return tokens[index - first]
+        if index < 0:
+            return self[index + self.length]
+        if index >= self.length:
+            raise IndexError("token index out of range")
+        counts = self.counts
+        first_line = counts.find(max(0, index - WINDOW_BACK))
+        last_line = counts.find(min(self.length - 1, index + WINDOW_TOKENS)) + 1
+        first = counts.prefix(first_line)
+        tokens = self.positioned(first_line, last_line)
+        self.window = (first, tokens)
+        return tokens[index - first]
+
+    def line_offset(self, line):
+        """line satırından (1 tabanlı) önceki token sayısı"""
+        return self.counts.prefix(line - 1)
+
+    def positioned(self, first, last):
+        """first ile last arasındaki satırların (0 tabanlı, last hariç) Token'ları"""
+        line_index = self.line_index
+        tokens = []
+        append = tokens.append
+        number = first
+        line_start = line_index.line_start(first)
+        for line_tokens, length in zip(self.lines.items(first, last), line_index.lengths.items(first, last)):
+            number += 1
+            # satırın dışına taşan tokenların (çok satırlı stringler) Tk indeksleri aranır
+            line_end = line_start + length
+            parts = None
+            for token_type, value, col in line_tokens:
+                if parts is not None:
+                    parts.append(value)
+                    if token_type != 'STRING_QUOTE':
+                        continue
+                    token_type, value, col = 'STRING', ''.join(parts), opening_col
+                    parts = None
+                elif token_type == 'STRING_QUOTE':
+                    parts, opening_col = [value], col
+                    continue
+                start = line_start + col - 1
+                end = start + len(value)
+                if end < line_end:
+                    start_index = f"{number}.{col - 1}"
+                    end_index = f"{number}.{end - line_start}"
+                else:
+                    start_index, end_index = line_index.tk_index(start), line_index.tk_index(end)
+                append(Token(token_type, value, (number, col), start, end, start_index, end_index))
+            line_start = line_end
+        return tokens
+
+
+class IncrementalParser(Parser):
+    """Önceki ağacın üst düzey ifadelerini yeniden kullanarak ayrıştırır.
+
+    Her üst düzey ifadenin token sayısı ve önündeki atlanan token sayısı
+    saklanır; token indeksleri göreli olduğundan düzenlemeden sonraki
+    ifadelerin kayıtları değişmez, konumlar son düzenlemedeki imleçten
+    yürünerek bulunur. Document'in verdiği yeniden taranan satır aralığının
+    dışındaki tokenlar değişmemiştir (aralık bilinmiyorsa tür, değer ve
+    tokenlar arası boşluk sütunları karşılaştırılır); tokenları ve ardından
+    gelen bir token (bakış) değişmemiş ifadeler aynen alınır, yalnızca
+    aradaki bölge yeniden ayrıştırılır. Ayrıştırma hata verirse son başarılı
+    durum korunur, bir sonraki düzenleme yine ona göre karşılaştırılır.
+    recover=True ise hatalar Error düğümü olur; düzenlemeden sonraki Error
+    ifadeleri mesajlarındaki konum ve atlanan aralık güncel kalsın diye
+    yeniden ayrıştırılır.
+    """
+    def __init__(self, recover=False):
+        super().__init__([], iterative=True, recover=recover)
+        self.parsed_tokens = []  # son başarılı güncellemenin tokenları
+        self.parsed_errors = []  # ve hataları (error_indexes sırasıyla, mutlak ofsetli)
+        self.sizes = []    # üst düzey ifadelerin token sayısı
+        self.leads = []    # ifadeden önce atlanan (string parçası) token sayısı
+        self.nodes = []    # üst düzey düğümler
+        self.error_indexes = []  # Error düğümü olan üst düzey ifadelerin sırası
+        self.cursor = (0, 0)  # (ifade sırası, ondan önceki ifadenin bitiş token indeksi)
+        self.reused = 0    # son güncellemede yeniden kullanılan ifade sayısı
+
+    def update(self, tokens, change=None):
+        """Tokenları ayrıştır; Parser.parse ile aynı ağacı ve hataları üretir.
+
+        tokens bir liste veya IncrementalLexer.line_tokens() görünümüdür.
+        change: önceki başarılı güncellemenin tokenlarından bu yana yeniden
+        taranan (ilk, son, satır farkı) satır aralığı (1 tabanlı, dahil).
+        Verilirse değişmeyen önek ve sonek satır numaralarından bulunur
+        (görünümde satır başına token sayılarıyla, listede ikili aramayla);
+        verilmezse eski ve yeni tokenların sütunları karşılaştırılır. Görünüm
+        ve aralık verildiğinde güncellemenin süresi belge uzunluğundan
+        bağımsızdır; sütun karşılaştırması tüm tokenları okuyacağı için aralık
+        yoksa görünüm bir kez listeye çevrilir.
+        """
+        old_tokens = self.parsed_tokens
+        if tokens.__class__ is LineTokens and change is None and old_tokens:
+            tokens = list(tokens)
+        self.tokens = tokens
+        self.pos = 0
+        self.tree = []
+        self.errors = []
+        if not tokens:
+            self.parsed_tokens, self.parsed_errors = tokens, []
+            self.sizes, self.leads, self.nodes, self.error_indexes = [], [], [], []
+            self.cursor, self.reused = (0, 0), 0
+            return self.tree
+
+        old_count = len(old_tokens)
+        if change is not None and old_tokens and len(old_tokens[0]) == len(tokens[0]):
+            # yeniden taranan satırların dışındaki tokenlar satır kaymasıyla aynıdır
+            first, last, line_delta = change
+            prefix = min(tokens_before_line(old_tokens, first), tokens_before_line(tokens, first))
+            suffix = min(old_count - tokens_before_line(old_tokens, last - line_delta + 1),
+                         len(tokens) - tokens_before_line(tokens, last + 1))
+        else:
+            prefix, suffix = self.compare_columns(old_tokens, tokens)
+        delta = len(tokens) - old_count
+
+        sizes, leads, old_nodes = self.sizes, self.leads, self.nodes
+        # baştaki ifadeler: bakış tokenı dahil değişmeyen önek içinde kalanlar
+        head, head_end = self.seek(prefix)
+        # sondaki ifadeler: değişmeyen sonekte başlayanlar; ayrıştırma yeni listede
+        # bunlardan birinin başına denk gelirse oradan sonrası aynen alınır
+        tail, tail_start = head, head_end + (leads[head] if head < len(leads) else 0)
+        while tail < len(sizes) and tail_start < old_count - suffix:
+            tail_start += sizes[tail] + (leads[tail + 1] if tail + 1 < len(leads) else 0)
+            tail += 1
+
+        new_sizes, new_leads, nodes, error_indexes = [], [], [], []
+        new_errors = {}  # yeni Error ifadesinin sırası -> self.errors'taki mutlak ofsetli kopyası
+        reuse = len(old_nodes)
+        self.pos = end = head_end
+        while self.peek() is not None:
+            while tail < len(sizes) and tail_start + delta < self.pos:
+                tail_start += sizes[tail] + (leads[tail + 1] if tail + 1 < len(leads) else 0)
+                tail += 1
+            if tail < len(sizes) and tail_start + delta == self.pos:
+                reuse = tail
+                break
+            old_pos = self.pos
+            if self.peek()[0] in ('STRING_QUOTE', 'STRING_CONTENT', 'ESCAPE_CHAR'):
+                self.pos += 1
+                continue
+            error_count = len(self.errors)
+            node = self.parse_top_statement()
+            if len(self.errors) != error_count:
+                error_indexes.append(head + len(nodes))
+                new_errors[head + len(nodes)] = self.errors[-1]
+            new_leads.append(old_pos - end)
+            new_sizes.append(self.pos - old_pos)
+            end = self.pos
+            nodes.append(node)
+
+        # kayıtlar yerinde güncellenir; sondaki ifadelerden yalnızca ilkinin
+        # önündeki atlanan token sayısı değişebilir
+        tail_count = len(old_nodes) - reuse
+        sizes[head:reuse] = new_sizes
+        leads[head:reuse] = new_leads
+        old_nodes[head:reuse] = nodes
+        if tail_count:
+            leads[head + len(nodes)] = self.pos - end
+        self.reused = len(old_nodes) - len(nodes)
+        # Error düğümlerinin sırası: öncekilerden önek ve sonekte kalanlar ile yeniler
+        tail_offset = head + len(nodes) - reuse
+        old_error_indexes = self.error_indexes
+        # satır aralığı biliniyorsa önekteki hataların konumu ve mesajı aynıdır
+        kept = bisect_left(old_error_indexes, head)
+        self.error_indexes = old_error_indexes[:kept] + error_indexes
+        self.error_indexes.extend(
+            index + tail_offset for index in old_error_indexes[bisect_left(old_error_indexes, reuse):])
+        self.cursor = (head, head_end)
+        program_end = None
+        if len(tokens[0]) > 3:
+            program_end = tokens[-1][4]
+            # üst düzey düğümler bir önceki düğümün bitişine görelidir: yeniler
+            # önekteki son düğüme göre yeniden tabanlanır; sonektekilerden
+            # yalnızca ilkinin göreli ofseti değişebilir ve o da kopyalanır
+            base = rebase_statements(nodes, self.statement_end(head, head_end))
+            first = head + len(nodes)
+            while first < len(old_nodes) and old_nodes[first] is None:
+                end += leads[first] + sizes[first]
+                first += 1
+            if first < len(old_nodes):
+                node = old_nodes[first]
+                shift = tokens[end + leads[first] + sizes[first] - 1][4] - base - node.end
+                if shift:
+                    old_nodes[first] = Node(node.type, node.value, node.start + shift, node.end + shift)
+        if change is None:
+            # satır sonları boşluklarla yer değiştirmiş olabilir: tüm hatalar denetlenir
+            kept = 0
+        if not self.recheck_errors(new_errors, self.parsed_errors[:kept], (head, head_end) if kept else (0, 0)):
+            # bir hatanın atlanan aralığı değişti: tümden yeniden ayrıştır
+            self.parsed_tokens, self.sizes, self.leads, self.nodes, self.error_indexes = [], [], [], [], []
+            self.cursor = (0, 0)
+            return self.update(tokens)
+        self.parsed_tokens, self.parsed_errors = tokens, self.errors
+        self.tree = [Node("Program", tuple(self.nodes), 0 if program_end is not None else None, program_end)]
+        return self.tree
+
+    def seek(self, limit):
+        """Bitişi limit token indeksinden küçük olan baştaki ifadelerin sayısı ve
+        sonuncusunun bitişi; imleçten LOCATE_STEP ifadelik bloklarla yürünür"""
+        sizes, leads = self.sizes, self.leads
+        index, end = self.cursor
+        while index and end >= limit:
+            first = max(0, index - LOCATE_STEP)
+            end -= sum(sizes[first:index]) + sum(leads[first:index])
+            index = first
+        while True:
+            last = min(index + LOCATE_STEP, len(sizes))
+            block_end = end + sum(sizes[index:last]) + sum(leads[index:last])
+            if block_end >= limit or last == len(sizes):
+                break
+            index, end = last, block_end
+        while index < len(sizes) and end + leads[index] + sizes[index] < limit:
+            end += leads[index] + sizes[index]
+            index += 1
+        return index, end
+
+    def recheck_errors(self, parsed, kept, start):
+        """Yeniden kullanılan Error ifadelerini yeniden ayrıştır ve self.errors'ı kur.
+
+        Satır sonları boşluklarla yer değiştirdiğinde token sütunları aynı
+        kalır; mesajdaki konum ve panik modunun atladığı aralık ise değişebilir.
+        parsed: bu güncellemede ayrıştırılan Error ifadelerinin sırası -> mutlak
+        ofsetli kopyası; kept: baştaki değişmeyen hataların kopyaları, aynen
+        alınır; start: kalan hatalardan önceki (ifade sırası, bitiş token
+        indeksi). Atlanan aralık değiştiyse False döner.
+        """
+        sizes, leads = self.sizes, self.leads
+        errors = kept
+        index, end = start
+        for error_index in self.error_indexes[len(kept):]:
+            if error_index in parsed:
+                errors.append(parsed[error_index])
+                continue
+            end += sum(sizes[index:error_index]) + sum(leads[index:error_index])
+            index = error_index
+            self.pos = start = end + leads[index]
+            node = self.parse_top_statement()
+            if self.pos != start + sizes[index] or node.type != "Error":
+                return False
+            errors.append(self.errors[-1])
+            if node.start is not None:
+                rebase_statements((node,), self.statement_end(index, end))
+            self.nodes[index] = node
+        self.errors = errors
+        return True
+
+    def statement_end(self, index, end):
+        """index'ten önceki son üst düzey düğümün mutlak bitişi; yoksa 0. end:
+        index'ten önceki ifadenin bitiş token indeksi. Bir ifadenin bitişi son
+        tokenının bitişidir"""
+        while index:
+            index -= 1
+            if self.nodes[index] is not None:
+                return self.tokens[end - 1][4]
+            end -= self.sizes[index] + self.leads[index]
+        return 0
+
+    def compare_columns(self, old_tokens, tokens):
+        """Satır aralığı bilinmediğinde değişmeyen önek ve sonek: tüm sütunlarda
+        ortak olan kısım. İlk ayrıştırmada eski token yoktur: yeni tokenların
+        sütunları hiç kurulmaz, görünüm baştan sona okunmaz"""
+        if not old_tokens:
+            return 0, 0
+        old_columns, columns = self.token_columns(old_tokens), self.token_columns(tokens)
+        if len(old_columns) != len(columns):
+            return 0, 0
+        old_count = len(old_tokens)
+        prefix, suffix = len(tokens), old_count
+        for old_column, column in zip(old_columns, columns):
+            column_prefix, column_removed, _ = compute_edit(old_column, column)
+            if column_prefix == old_count == len(column):
+                # değişmeyen sütun: önek de sonek de tamamıdır
+                continue
+            prefix = min(prefix, column_prefix)
+            suffix = min(suffix, old_count - column_prefix - column_removed)
+        return prefix, suffix
+
+    def token_columns(self, tokens):
+        """Karşılaştırma sütunları: türler, değerler ve ofset varsa önceki tokendan sonraki boşluk uzunlukları"""
+        types = list(map(itemgetter(0), tokens))
+        values = list(map(itemgetter(1), tokens))
+        if not tokens or len(tokens[0]) <= 3:
+            return types, values
+        ends = map(itemgetter(4), tokens)
+        gaps = list(map(sub, map(itemgetter(3), tokens), chain((0,), ends)))
+        return types, values, gaps
@@ -1,111 +1,351 @@
+import codecs
 import re
+from bisect import bisect_right
+from collections import namedtuple
+
+ESCAPE_REGEX = re.compile(r'\\[nrtbfav\\\'\"0]|\\x[0-9a-fA-F]{2}|\\u[0-9a-fA-F]{4}')
+
+# Konumlu token: mutlak ofsetler ve hazır Tk indeksleri ile
+Token = namedtuple('Token', ['type', 'value', 'position', 'start', 'end', 'start_index', 'end_index'])
+
+
+class LineIndex:
+    """Satır başlangıç ofsetleri, tokenize geçişi başına bir kez kurulur"""
+    def __init__(self, code):
+        starts = [0]
+        pos = code.find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = code.find('\n', pos + 1)
+        self.starts = starts
+        self._hint = 0  # tokenlar sırayla geldiği için son bulunan satır
+
+    @classmethod
+    def from_starts(cls, starts):
+        """Önceden hesaplanmış satır başlangıçlarından kur"""
+        index = cls.__new__(cls)
+        index.starts = starts
+        index._hint = 0
+        return index
+
+    def line_of(self, pos):
+        starts = self.starts
+        line = self._hint
+        if starts[line] <= pos and (line + 1 == len(starts) or pos < starts[line + 1]):
+            return line
+        line = bisect_right(starts, pos) - 1
+        self._hint = line
+        return line
+
+    def line_column(self, pos):
+        """Ofsetten 1 tabanlı (satır, sütun)"""
+        line = self.line_of(pos)
+        return line + 1, pos - self.starts[line] + 1
+
+    def tk_index(self, pos):
+        """Ofsetten Tk 'satır.sütun' indeksi"""
+        line = self.line_of(pos)
+        return f"{line + 1}.{pos - self.starts[line]}"
+
+    def offset(self, line, col):
+        """1 tabanlı (satır, sütun) çiftinden mutlak ofset"""
+        return self.starts[line - 1] + col - 1
+
+
+KEYWORDS = (
+    'if', 'else', 'elif', 'while', 'for', 'in', 'def', 'class', 'return', 'break', 'continue',
+    'and', 'or', 'not', 'try', 'except', 'finally', 'raise', 'import', 'from', 'as', 'with',
+    'lambda', 'global', 'nonlocal', 'True', 'False', 'None', 'pass', 'del', 'yield', 'assert',
+    'async', 'await', 'match', 'case',
+)
+BUILTINS = (
+    'print', 'input', 'len', 'str', 'int', 'float', 'list', 'dict', 'tuple', 'set', 'range',
+    'enumerate', 'zip', 'open', 'abs', 'max', 'min', 'sum', 'all', 'any', 'sorted', 'reversed',
+    'map', 'filter', 'type', 'isinstance', 'hasattr', 'getattr', 'setattr', 'dir', 'help', 'id',
+    'hex', 'oct', 'bin', 'format',
+)
+
+TOKEN_SPECS = [
+    ('KEYWORD', r'\b(' + '|'.join(KEYWORDS) + r')\b'),
+    ('BUILTIN', r'\b(' + '|'.join(BUILTINS) + r')\b'),
+    ('NUMBER', r'\b\d+(\.\d+)?\b'),
+    ('IDENTIFIER', r'\b[a-zA-Z_]\w*\b'),
+    ('OPERATOR', r'==|!=|<=|>=|\+|-|\*|/|<|>'),
+    ('ASSIGN', r'='),
+    ('STRING', r'"([^"\\]|\\.)*"|\'([^\'\\]|\\.)*\''),
+    ('COLON', r':'),
+    ('LPAREN', r'\('),
+    ('RPAREN', r'\)'),
+    ('COMMA', r','),
+    ('LBRACKET', r'\['),
+    ('RBRACKET', r'\]'),
+    ('COMMENT', r'#[^\n]*'),
+    ('WHITESPACE', r'[ \t]+'),
+    ('NEWLINE', r'\n')
+]
+
+# Tüm Lexer örnekleri aynı derlenmiş ifadeyi paylaşır
+TOKEN_REGEX = re.compile('|'.join(f'(?P<{name}>{pat})' for name, pat in TOKEN_SPECS))
+
+# Değerleri sembol havuzundan paylaşılan token türleri; STRING, STRING_CONTENT ve
+# COMMENT değerleri çoğunlukla tekil olduğu için havuza alınmaz
+INTERNED_KINDS = frozenset((
+    'KEYWORD', 'BUILTIN', 'NUMBER', 'IDENTIFIER', 'OPERATOR', 'ASSIGN', 'COLON', 'LPAREN',
+    'RPAREN', 'COMMA', 'LBRACKET', 'RBRACKET', 'STRING_QUOTE', 'ESCAPE_CHAR',
+))
+# Her belgenin havuzu bu sabitlerle başlar: anahtar kelime ve operatör değerleri
+# tüm belgelerde aynı nesnelerdir
+SYMBOLS = {symbol: symbol for symbol in KEYWORDS + BUILTINS + (
+    '==', '!=', '<=', '>=', '+', '-', '*', '/', '<', '>', '=', ':', '(', ')', ',', '[', ']',
+    '"', "'", '\\n', '\\t', '\\r', '\\\\', '\\"', "\\'", '\\0',
+)}
+
+
+def symbol_pool():
+    """Belge başına yeni sembol havuzu (değer -> paylaşılan değer)"""
+    return dict(SYMBOLS)
+
+
 class Lexer:
-    def __init__(self):
-        self.token_specs = [
-            ('KEYWORD', r'\b(if|else|elif|while|for|in|def|class|return|break|continue|and|or|not|try|except|finally|raise|import|from|as|with|lambda|global|nonlocal|True|False|None|pass|del|yield|assert|async|await|match|case)\b'),
-            ('BUILTIN', r'\b(print|input|len|str|int|float|list|dict|tuple|set|range|enumerate|zip|open|abs|max|min|sum|all|any|sorted|reversed|map|filter|type|isinstance|hasattr|getattr|setattr|dir|help|id|hex|oct|bin|format)\b'),
-            ('NUMBER', r'\b\d+(\.\d+)?\b'),
-            ('IDENTIFIER', r'\b[a-zA-Z_]\w*\b'),
-            ('OPERATOR', r'==|!=|<=|>=|\+|-|\*|/|<|>'),
-            ('ASSIGN', r'='),
-            ('STRING', r'"([^"\\]|\\.)*"|\'([^\'\\]|\\.)*\''),
-            ('COLON', r':'),
-            ('LPAREN', r'\('),
-            ('RPAREN', r'\)'),
-            ('COMMA', r','),
-            ('LBRACKET', r'\['),
-            ('RBRACKET', r'\]'),
-            ('COMMENT', r'#[^\n]*'),
-            ('WHITESPACE', r'[ \t]+'),
-            ('NEWLINE', r'\n')
-        ]
-        self.regex = re.compile('|'.join(f'(?P<{name}>{pat})' for name, pat in self.token_specs))
+    def __init__(self, recover=False):
+        self.token_specs = TOKEN_SPECS
+        self.regex = TOKEN_REGEX
+        # recover=True: geçersiz karakterler hata yerine ERROR tokenı olarak üretilir
+        self.recover = recover
 
     """Pozisyondan satır hesapla"""
     def get_line_column(self, code, pos):
-        lines = code[:pos].split('\n')
-        line = len(lines)
-        column = len(lines[-1]) + 1
+        line = code.count('\n', 0, pos) + 1
+        column = pos - (code.rfind('\n', 0, pos) + 1) + 1
         return line, column
 
-    def tokenize(self, code):
-        tokens = []
-        pos = 0 # o anki karakterin indexini tutar
-
-        if not code.strip():
-            return tokens
-
-        for match in self.regex.finditer(code):
-            if match.start() != pos:
-                line, col = self.get_line_column(code, pos)
-                invalid_char = code[pos:match.start()]
-                raise ValueError(f"Invalid character '{invalid_char.strip()}' at line {line}, column {col}")
-
+    def scan_spans(self, code, pos=0):
+        """Tarama motoru: WHITESPACE dışındaki tokenları (tür, başlangıç, bitiş) olarak sırayla üretir"""
+        for match in self.regex.finditer(code, pos):
+            start = match.start()
+            if start != pos:
+                if self.recover:
+                    yield 'ERROR', pos, start
+                else:
+                    line, col = LineIndex(code).line_column(pos)
+                    invalid_char = code[pos:start]
+                    raise ValueError(f"Invalid character '{invalid_char.strip()}' at line {line}, column {col}")
             token_type = match.lastgroup
-            value = match.group()
-            line, col = self.get_line_column(code, match.start())
-
-            if token_type == 'STRING':
-                if not self.is_valid_string(value):
-                    raise ValueError(f"Unclosed string literal at line {line}, column {col}")
-
-            # whitespace ve newline tokenlarını filtrele
-            if token_type not in ('WHITESPACE', 'NEWLINE'):
-                tokens.append((token_type, value, (line, col)))
-
             pos = match.end()
+            if token_type == 'WHITESPACE':
+                continue
+            if token_type == 'STRING' and not self.is_valid_string(match.group()):
+                line, col = LineIndex(code).line_column(start)
+                raise ValueError(f"Unclosed string literal at line {line}, column {col}")
+            yield token_type, start, pos
 
         if pos < len(code):
-            line, col = self.get_line_column(code, pos)
             invalid_char = code[pos:].strip()
             if invalid_char:
+                if self.recover:
+                    yield 'ERROR', pos, len(code)
+                    return
+                line, col = LineIndex(code).line_column(pos)
                 raise ValueError(f"Invalid character '{invalid_char}' at line {line}, column {col}")
 
-        return tokens
+    def scan(self, code, escapes=False):
+        """Tek geçişte (tokenlar, escape katmanı) döndürür.
 
-    def tokenize_with_escape_highlighting(self, code):
-        """String içindeki escape karakterlerini de renklendirir"""
+        Escape katmanı, escapes=True ise her STRING tokenının listedeki sırası
+        ile tırnak/içerik/escape alt tokenlarından oluşan (sıra, parçalar)
+        listesidir; aksi halde None.
+        """
         tokens = []
-        pos = 0
-
+        overlay = [] if escapes else None
         if not code.strip():
-            return tokens
-
-        for match in self.regex.finditer(code):
-            if match.start() != pos:
-                line, col = self.get_line_column(code, pos)
-                invalid_char = code[pos:match.start()]
-                raise ValueError(f"Invalid character '{invalid_char.strip()}' at line {line}, column {col}")
+            return tokens, overlay
+
+        lines = LineIndex(code)
+        symbols = symbol_pool()
+        interned = INTERNED_KINDS
+        last_line = None
+        for token_type, start, end in self.scan_spans(code):
+            if token_type == 'NEWLINE':
+                continue
+            value = code[start:end]
+            if token_type in interned:
+                value = symbols.setdefault(value, value)
+            line, col = lines.line_column(start)
+            # aynı satırdaki tokenlar satır numarası nesnesini paylaşır
+            if line == last_line:
+                line = last_line
+            last_line = line
+            tokens.append((token_type, value, (line, col)))
+            if escapes and token_type == 'STRING':
+                overlay.append((len(tokens) - 1, self.parse_string_with_escapes(value, line, col, symbols)))
+        return tokens, overlay
+
+    def merge_escape_overlay(self, tokens, overlay):
+        """STRING tokenlarını escape katmanındaki alt tokenlarla değiştir"""
+        merged = []
+        last = 0
+        for index, parts in overlay:
+            merged.extend(tokens[last:index])
+            merged.extend(parts)
+            last = index + 1
+        merged.extend(tokens[last:])
+        return merged
 
-            token_type = match.lastgroup
-            value = match.group()
-            line, col = self.get_line_column(code, match.start())
-
-            # String literal ise escape karakterleri için özel işlem
-            if token_type == 'STRING':
-                if not self.is_valid_string(value):
-                    raise ValueError(f"Unclosed string literal at line {line}, column {col}")
+    def tokenize(self, code):
+        return self.scan(code)[0]
 
-                # String içindeki escape karakterlerini parse et
-                string_tokens = self.parse_string_with_escapes(value, line, col)
-                tokens.extend(string_tokens)
+    def tokenize_with_escape_highlighting(self, code):
+        """String içindeki escape karakterlerini de renklendirir"""
+        return self.merge_escape_overlay(*self.scan(code, escapes=True))
+
+    def tokenize_views(self, code):
+        """Tek taramadan hem düz hem escape vurgulamalı token listesi"""
+        tokens, overlay = self.scan(code, escapes=True)
+        return tokens, self.merge_escape_overlay(tokens, overlay)
+
+    def tokenize_with_positions(self, code):
+        """Escape vurgulamalı tokenlar; her token mutlak ofset ve Tk indeksi taşır"""
+        return self.attach_positions(self.tokenize_with_escape_highlighting(code), LineIndex(code))
+
+    def attach_positions(self, tokens, lines):
+        """(tür, değer, (satır, sütun)) tokenlarını Token'a çevir"""
+        positioned = []
+        # bitişik tokenlarda bir tokenın bitiş indeksi sonrakinin başlangıcıdır
+        last_end, last_end_index = None, None
+        for token_type, value, position in tokens:
+            start = lines.offset(*position)
+            end = start + len(value)
+            if start == last_end:
+                start, start_index = last_end, last_end_index
             else:
-                if token_type not in ('WHITESPACE', 'NEWLINE'):
-                    tokens.append((token_type, value, (line, col)))
+                start_index = lines.tk_index(start)
+            last_end, last_end_index = end, lines.tk_index(end)
+            positioned.append(Token(token_type, value, position, start, end, start_index, last_end_index))
+        return positioned
+
+    def scan_offsets(self, code, escapes=True):
+        """Tokenları (tür, başlangıç, bitiş) ofsetleri olarak üretir; değer kopyalanmaz"""
+        for token_type, start, end in self.scan_spans(code):
+            if token_type == 'NEWLINE':
+                continue
+            if escapes and token_type == 'STRING':
+                yield from self.string_part_offsets(code, start, end)
+            else:
+                yield token_type, start, end
 
+    def string_part_offsets(self, code, start, end):
+        """String literal'ı tırnak/içerik/escape parçalarına ofsetlerle böl"""
+        yield 'STRING_QUOTE', start, start + 1
+        pos = start + 1
+        for match in ESCAPE_REGEX.finditer(code, start + 1, end - 1):
+            if match.start() > pos:
+                yield 'STRING_CONTENT', pos, match.start()
+            yield 'ESCAPE_CHAR', match.start(), match.end()
             pos = match.end()
-
-        if pos < len(code):
-            line, col = self.get_line_column(code, pos)
-            invalid_char = code[pos:].strip()
-            if invalid_char:
-                raise ValueError(f"Invalid character '{invalid_char}' at line {line}, column {col}")
-
-        return tokens
-
+        if pos < end - 1:
+            yield 'STRING_CONTENT', pos, end - 1
+        yield 'STRING_QUOTE', end - 1, end
+
+    def iter_tokens(self, source, chunk_size=65536, escapes=False):
+        """Dosya nesnesinden veya mmap'ten parça parça okuyup tokenları tembel üretir.
+
+        Bellekte yalnızca okunan parça ve yarım kalan satır tutulur. Parça
+        sınırına denk gelen tokenlar bir sonraki parçayla birleştirilip
+        yeniden taranır; ikili girdi artımlı UTF-8 çözücüyle okunur. Geçersiz
+        karakterlerde (CRLF dosyalardaki \r dahil) tokenize ile aynı hata verilir.
+        """
+        decoder = None
+
+        def read():
+            nonlocal decoder
+            chunk = source.read(chunk_size)
+            if isinstance(chunk, (bytes, bytearray)):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder('utf-8')()
+                return decoder.decode(chunk, final=not chunk), not chunk
+            return chunk, not chunk
+
+        symbols = symbol_pool()
+        interned = INTERNED_KINDS
+        buffer = ''
+        base = 0  # buffer[0]'ın mutlak ofseti
+        line = 1
+        line_start = 0
+        blank = True  # şimdiye kadar okunan her şey boşluk
+        eof = False
+        while not eof:
+            chunk, eof = read()
+            buffer += chunk
+            # son tam satıra kadar tara; kalan kısım sonraki parçayla birleşir
+            limit = len(buffer) if eof else buffer.rfind('\n') + 1
+            if not limit:
+                continue
+
+            pos = 0
+            gap_end = limit
+            for match in self.regex.finditer(buffer, 0, limit):
+                start = match.start()
+                if start != pos:
+                    gap_end = start
+                    break
+                token_type = match.lastgroup
+                value = match.group()
+                col = base + start - line_start + 1
+                pos = match.end()
+
+                if token_type == 'NEWLINE':
+                    line += 1
+                    line_start = base + pos
+                    continue
+                if token_type == 'STRING':
+                    if not self.is_valid_string(value):
+                        raise ValueError(f"Unclosed string literal at line {line}, column {col}")
+                    if escapes:
+                        yield from self.parse_string_with_escapes(value, line, col, symbols)
+                    else:
+                        yield token_type, value, (line, col)
+                    newlines = value.count('\n')
+                    if newlines:
+                        line += newlines
+                        line_start = base + start + value.rfind('\n') + 1
+                elif token_type != 'WHITESPACE':
+                    if token_type in interned:
+                        value = symbols.setdefault(value, value)
+                    yield token_type, value, (line, col)
+
+            if pos < limit:
+                # kapanmamış görünen string sonraki satırlarda kapanabilir
+                if eof or buffer[pos] not in '"\'':
+                    gap = buffer[pos:gap_end]
+                    if not eof and ('"' in gap or "'" in gap):
+                        # boşluktaki tırnak sonraki parçalarda kapanan bir string başlatabilir;
+                        # hata mesajı tokenize ile aynı olsun diye kalan girdi okunur
+                        while not eof:
+                            chunk, eof = read()
+                            buffer += chunk
+                        limit = len(buffer)
+                        match = self.regex.search(buffer, pos + 1)
+                        gap_end = match.start() if match else limit
+                    invalid_char = buffer[pos:gap_end].strip()
+                    if not invalid_char and blank and not buffer[:pos].strip():
+                        # tokenize yalnızca boşluktan oluşan kodu boş sayar
+                        rest_blank = not buffer[pos:].strip()
+                        while rest_blank and not eof:
+                            chunk, eof = read()
+                            rest_blank = not chunk.strip()
+                        if rest_blank:
+                            return
+                    # tokenize gibi: yalnızca dosya sonundaki boşluk benzeri karakterler (\r gibi) hata değildir
+                    if invalid_char or gap_end < limit:
+                        col = base + pos - line_start + 1
+                        raise ValueError(f"Invalid character '{invalid_char}' at line {line}, column {col}")
+            if blank and buffer[:pos].strip():
+                blank = False
+            buffer = buffer[pos:]
+            base += pos
 
     #String içindeki escape karakterlerini ayrı tokenlar olarak parse eder
-    def parse_string_with_escapes(self, string_value, start_line, start_col):
+    def parse_string_with_escapes(self, string_value, start_line, start_col, symbols=None):
         tokens = []
         quote_char = string_value[0]  # " veya '
         inner_content = string_value[1:-1]  # Tırnak işaretlerini çıkar
@@ -113,14 +353,11 @@ class Lexer:
         # String başlangıç tırnağı
         tokens.append(('STRING_QUOTE', quote_char, (start_line, start_col)))
 
-        # Escape patterni
-        escape_pattern = r'\\[nrtbfav\\\'\"0]|\\x[0-9a-fA-F]{2}|\\u[0-9a-fA-F]{4}'
-
         pos = 0
         current_line = start_line
         current_col = start_col + 1  # ilk tırnak sonrası
 
-        for match in re.finditer(escape_pattern, inner_content):
+        for match in ESCAPE_REGEX.finditer(inner_content):
             # escape öncesi normal string kısmı
             if match.start() > pos:
                 normal_part = inner_content[pos:match.start()]
@@ -130,6 +367,8 @@ class Lexer:
 
             # escape karakteri
             escape_seq = match.group()
+            if symbols is not None:
+                escape_seq = symbols.setdefault(escape_seq, escape_seq)
             tokens.append(('ESCAPE_CHAR', escape_seq, (current_line, current_col)))
             current_col += len(escape_seq)
             pos = match.end()
@@ -144,6 +383,11 @@ class Lexer:
 
         return tokens
 
+    def error_message(self, token):
+        """ERROR tokenı için katı modda fırlatılacak mesajın aynısı"""
+        token_type, value, (line, col) = token[:3]
+        return f"Invalid character '{value.strip()}' at line {line}, column {col}"
+
     def is_valid_string(self, string_value):
         """String literal'ın geçerli olup olmadığını kontrol et"""
         if len(string_value) < 2:
@@ -1,8 +1,12 @@
 import tkinter as tk
 from tkinter import ttk
 from highlighter import Highlighter, BracketMatcher, AutoCompleter, apply_theme_globally, toggle_theme, active_theme
-from lexer import Lexer
-from parser import Parser
+from dispatch_lexer import DispatchLexer
+from analysis_cache import AnalysisCache
+from treeview_sync import TreeviewRows, TreeviewNodes
+from analysis_worker import AnalysisWorker
+from scheduler import PassScheduler
+from document import Document
 import sys
 from io import StringIO
 
@@ -51,7 +55,7 @@ text_area.config(xscrollcommand=horizontal_scrollbar.set)
 # dikey çubuğu kaydırma
 vertical_scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL)
 vertical_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-text_area.config(yscrollcommand=vertical_scrollbar.set)
+text_area.config(yscrollcommand=lambda first, last: on_text_scroll(first, last))
 horizontal_scrollbar.config(command=text_area.xview)
 vertical_scrollbar.config(command=lambda *args: on_vertical_scroll(*args))
 
@@ -96,7 +100,8 @@ token_tree.configure(yscrollcommand=token_scroll.set)
 # oarse tree sekmesi
 tree_frame = tk.Frame(notebook)
 notebook.add(tree_frame, text="Ağaç Yapısı")
-tree_tree = ttk.Treeview(tree_frame, columns=("Node", "Detail", "Description"), show="headings")
+tree_tree = ttk.Treeview(tree_frame, columns=("Node", "Detail", "Description"), show="tree headings")
+tree_tree.column("#0", width=40, stretch=False)  # açma/kapama düğmeleri
 tree_tree.heading("Node", text="Düğüm")
 tree_tree.heading("Detail", text="Detay")
 tree_tree.heading("Description", text="Açıklama")
@@ -108,10 +113,20 @@ tree_scroll = tk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree_tree.yvi
 tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 tree_tree.configure(yscrollcommand=tree_scroll.set)
 
+# vurgulama, parantez ve analiz geçişleri ölçülen sürelerine ve yazma hızına göre
+# zamanlanır; süreler scheduler.stats() ile okunur
+scheduler = PassScheduler(text_area)
+# tüm geçişler metni, tokenları ve ağacı aynı anlık görüntüden okur: düzenleme başına
+# bir tarama ve en fazla bir ayrıştırma; metin Tk'dan alınmaz, düzenlemeler uygulanır
+document = Document(text_area)
+
 # highlighter, bracket matcher ve autocompleter örnekleri
-highlighter = Highlighter(text_area, error_label)
-bracket_matcher = BracketMatcher(text_area)
-auto_completer = AutoCompleter(text_area)
+# yalnızca görünür satırlar renklendirilir; kaydırıldıkça yeni satırlar eklenir.
+# tokenize ve ayrıştırma arka planda çalışır, tuş vuruşları analizi beklemez
+highlighter = Highlighter(text_area, error_label, viewport=True, background=True, scheduler=scheduler,
+                          document=document)
+bracket_matcher = BracketMatcher(text_area, scheduler=scheduler, document=document)
+auto_completer = AutoCompleter(text_area, document=document)
 
 # Token türü çevirileri
 TOKEN_TYPE_MAP = {
@@ -130,14 +145,15 @@ TOKEN_TYPE_MAP = {
     "RPAREN": "sağ parantez",
     "LBRACKET": "sol köşeli parantez",
     "RBRACKET": "sağ köşeli parantez",
-    "COMMA": "virgül"
+    "COMMA": "virgül",
+    "ERROR": "hata"
 }
 
 # Token’a tıklayınca kodda vurgulama
 def highlight_token_in_code(event):
     selection = token_tree.selection()
     if selection:
-        values = token_tree.item(selection[0])["values"]
+        values = token_rows.values(selection[0])
         line = values[2]  # Satır
         text_area.tag_remove("sel", "1.0", tk.END)
         text_area.see(f"{line}.0")
@@ -148,16 +164,17 @@ def highlight_token_in_code(event):
 def highlight_node_in_code(event):
     selection = tree_tree.selection()
     if selection:
-        tags = tree_tree.item(selection[0])["tags"]
-        if tags and tags[0].startswith("line_"):
-            line = int(tags[0].split("_")[1])
+        span = tree_view.item_span(selection[0])
+        if span:
+            start, end = span
             text_area.tag_remove("sel", "1.0", tk.END)
-            text_area.see(f"{line}.0")
-            text_area.tag_add("sel", f"{line}.0", f"{line}.end")
+            text_area.see(f"1.0 + {start} chars")
+            text_area.tag_add("sel", f"1.0 + {start} chars", f"1.0 + {end} chars")
             text_area.tag_configure("sel", background=active_theme["select_bg"])
 
 token_tree.bind("<Double-1>", highlight_token_in_code)
 tree_tree.bind("<<TreeviewSelect>>", highlight_node_in_code)
+tree_tree.bind("<<TreeviewOpen>>", lambda event: tree_view.expand(tree_tree.focus()))
 
 # Kod çalıştırma fonksiyonu
 def run_code():
@@ -180,38 +197,100 @@ def run_code():
     finally:
         sys.stdout = old_stdout
         output_area.config(state='disabled')
-    update_analysis()
+    scheduler.schedule('analysis')
 
 # Kaydırma fonksiyonu
+def on_text_scroll(first, last):
+    vertical_scrollbar.set(first, last)
+    highlighter.schedule_visible_highlight()
+
 def on_vertical_scroll(*args):
     text_area.yview(*args)
     line_numbers.yview(*args)
     update_line_numbers()
 
-def update_analysis(event=None):
-    code = text_area.get('1.0', tk.END).rstrip('\n')
-    lexer = Lexer()
+# analizler diske yazılır; aynı içerik yeniden açılınca diskten yüklenir
+analysis_cache = AnalysisCache(lexer=DispatchLexer())
+# token tablosu farkla güncellenir; satır numarası kayan tokenlar sonek olarak eşleşir
+token_rows = TreeviewRows(token_tree, shift_key=lambda row: (row[0][0], row[0][1], row[0][3], row[1]))
 
-    # yoken analizi
-    token_tree.delete(*token_tree.get_children())
-    try:
-        tokens = lexer.tokenize_with_escape_highlighting(code)
-        for token_type, token_value, (line, col) in tokens:
-            token_type_display = TOKEN_TYPE_MAP.get(token_type, token_type)
-            tag = token_type.lower()
-            token_tree.insert("", "end", values=(token_type_display, token_value, line, col), tags=(tag,))
-    except ValueError as e:
-        token_tree.insert("", "end", values=("Hata", str(e), "-", "-"))
-
-    # parse tree
+def on_token_scroll(first, last):
+    # satır numarası kayan tokenlar görünür olduklarında güncellenir
+    token_scroll.set(first, last)
+    token_rows.show_range(first, last)
+
+token_tree.configure(yscrollcommand=on_token_scroll)
+
+def show_tree_error(message):
     tree_tree.delete(*tree_tree.get_children())
-    try:
-        tokens = lexer.tokenize(code)
-        parser = Parser(tokens)
-        parser.parse()
-        parser.populate_treeview(tree_tree)
-    except (ValueError, SyntaxError) as e:
-        tree_tree.insert("", "end", values=("Hata", str(e), ""))
+    tree_tree.insert("", "end", values=("Hata", message, ""))
+
+# analiz (önbellek, belgenin tokenları ve ağacı) arka plan iş parçacığında çalışır;
+# Treeview'lar yalnızca ana iş parçacığında, sonuç geldiğinde güncellenir
+# Treeview durumu: belgenin ağacı ana iş parçacığında buraya alınır
+tree_view = TreeviewNodes(tree_tree)
+analysed_snapshot = None
+
+def analyze_code(snapshot):
+    """İş parçacığında: (tablo satırları, ağaç, hata mesajı); Tk'ya dokunmaz.
+    Görüntü yerini yenisine bıraktıysa None"""
+    cached = analysis_cache.load(snapshot.code)
+    if cached is not None:
+        escaped_tokens, tree = cached
+    else:
+        # tokenlar ve ağaç vurgulayıcıyla paylaşılır; hangisi önce isterse o hesaplar
+        if not snapshot.lex():
+            return None
+        message = snapshot.lex_error
+        error_tokens = snapshot.error_tokens() if message is None else ()
+        if error_tokens:
+            message = document.lexer.error_message(error_tokens[0])
+        if message is not None:
+            return [(("Hata", message, "-", "-"), ())], None, message
+        escaped_tokens = snapshot.tokens()
+        tree = snapshot.parse()
+        if not snapshot.parsed:
+            return None
+    rows = [((TOKEN_TYPE_MAP.get(token[0], token[0]), token[1], token[2][0], token[2][1]), (token[0].lower(),))
+            for token in escaped_tokens]
+    if tree is None:
+        return rows, None, snapshot.parse_error
+    if cached is None:
+        analysis_cache.store(snapshot.code, snapshot.plain_tokens(), escaped_tokens, tree)
+    return rows, tree, None
+
+def show_analysis(result):
+    if result is None:
+        # sıradaki görüntünün analizi gelecek
+        return
+    rows, tree, message = result
+    # token analizi: yalnızca değişen satırlar Tk'ya gider
+    token_rows.update(rows)
+    if tree is None:
+        show_tree_error(message)
+        return
+    # alt düğümler yalnızca açıldıklarında eklenir; değişmeyen ifadelerin öğeleri korunur
+    tree_view.sync(tree)
+
+analysis_worker = AnalysisWorker(root, analyze_code, show_analysis)
+
+def update_analysis(event=None):
+    global analysed_snapshot
+    snapshot = document.snapshot()
+    # tıklama ve kaydırma aynı görüntüyü yeniden analiz ettirmez
+    if snapshot is None or snapshot is analysed_snapshot:
+        return
+    analysed_snapshot = snapshot
+    analysis_worker.submit(snapshot)
+
+# ayrıştırma ağacı pahalı geçiştir: yazarken duraksamaya ertelenir
+scheduler.add('analysis', update_analysis, background=lambda: analysis_worker.duration)
+
+def schedule_analysis(delta=None):
+    scheduler.schedule('analysis')
+
+# paneller yalnızca metin düzenlendiğinde yeniden analiz edilir
+document.edits.add_listener(schedule_analysis)
 
 # Üstte butonlar ve başlık
 button_frame = tk.Frame(top_frame)
@@ -253,7 +332,6 @@ def update_line_numbers(event=None):
     end_line = min(total_lines, bottom_visible_line)
     line_numbers.insert('1.0', '\n'.join(str(i) for i in range(start_line, end_line + 1)))
     line_numbers.config(state='disabled')
-    update_analysis()
 
 # olayları bağla
 text_area.bind('<KeyRelease>', update_line_numbers, add='+')
@@ -261,5 +339,12 @@ text_area.bind('<Button-1>', update_line_numbers, add='+')
 text_area.bind('<MouseWheel>', update_line_numbers, add='+')
 text_area.bind('<Configure>', update_line_numbers, add='+')
 update_line_numbers()
+schedule_analysis()
+
+def on_close():
+    # beklemede kalan son analiz diske yazılır
+    analysis_cache.flush()
+    root.destroy()
 
+root.protocol("WM_DELETE_WINDOW", on_close)
 root.mainloop()
\ No newline at end of file
@@ -1,6 +1,7 @@
-from tkinter import ttk
+from types import GeneratorType
 
-from lexer import Lexer
+from lexer import Lexer, KEYWORDS
+from grammar_tables import FIRST, FOLLOW, STATEMENT_DISPATCH
 
 # Gramer bilgileri
 GRAMMAR_INFO = {
@@ -30,7 +31,8 @@ GRAMMAR_INFO = {
     "FunctionCall": "fonksiyon çağrısı: Bir fonksiyonu çağırır (örneğin, print(x)).",
     "Constant": "sabit: True, False veya None gibi sabit değerler.",
     "NotExpr": "not ifadesi: Mantıksal olumsuzlama yapar (örneğin, not True).",
-    "ParenExpr": "parantezli ifade: Parantez içindeki ifade (örneğin, (x + 1))."
+    "ParenExpr": "parantezli ifade: Parantez içindeki ifade (örneğin, (x + 1)).",
+    "Error": "hata: Ayrıştırılamayan bölüm; ayrıştırma bir sonraki ifadeden devam eder."
 }
 
 # Düğüm türü çevirileri
@@ -61,14 +63,143 @@ NODE_TYPE_MAP = {
     "FunctionCall": "fonksiyon çağrısı",
     "Constant": "sabit",
     "NotExpr": "not ifadesi",
-    "ParenExpr": "parantezli ifade"
+    "ParenExpr": "parantezli ifade",
+    "Error": "hata"
 }
 
+class Node:
+    """Parse ağacı düğümü.
+
+    start/end kaynak ofsetleridir ve ebeveyn düğümün başlangıcına görelidir;
+    Program'ınki mutlaktır, üst düzey ifadelerinki bir önceki üst düzey
+    düğümün bitişine (ilki için Program'ın başlangıcına) görelidir. Böylece
+    düğümler konumdan bağımsızdır: bir düzenlemeden sonra artımlı
+    ayrıştırmada yeniden kullanılan düğümler değiştirilmez. Tokenlar ofset
+    taşımıyorsa None olur. Birden fazla alt öğesi olan düğümlerde value bir demettir.
+    Eski ("Tür", değer) demeti gibi de kullanılabilir: açılabilir,
+    indekslenebilir ve demetlerle karşılaştırılabilir.
+    """
+    __slots__ = ('type', 'value', 'start', 'end')
+
+    def __init__(self, node_type, value, start=None, end=None):
+        self.type = node_type
+        self.value = value
+        self.start = start
+        self.end = end
+
+    def children(self):
+        """Alt düğümler (parametre ve argüman listelerinin içindekiler dahil)"""
+        if not isinstance(self.value, tuple):
+            return []
+        children = []
+        for item in self.value:
+            if isinstance(item, Node):
+                children.append(item)
+            elif isinstance(item, list):
+                children.extend(child for child in item if isinstance(child, Node))
+        return children
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        value = list(self.value) if isinstance(self.value, tuple) else self.value
+        return (self.type, value)[index]
+
+    def __iter__(self):
+        yield self.type
+        yield self[1]
+
+    def __eq__(self, other):
+        if isinstance(other, (Node, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+def rebase_statements(statements, base=0):
+    """Yeni üst düzey düğümlerin mutlak ofsetlerini bir önceki düğümün bitişine
+    göreli yap; base ilk düğümden önceki düğümün mutlak bitişidir. Son düğümün
+    mutlak bitişini döndürür"""
+    for node in statements:
+        if node.__class__ is Node and node.start is not None:
+            end = node.end
+            node.start -= base
+            node.end -= base
+            base = end
+    return base
+
+
+def statement_bases(program):
+    """Üst düzey düğüm kimliği -> göreli ofsetlerine eklenecek mutlak ofset"""
+    bases = {}
+    base = program.start or 0
+    for node in program.value:
+        if node.__class__ is Node and node.start is not None:
+            bases[id(node)] = base
+            base += node.end
+    return bases
+
+
+def tree_children(node):
+    """Treeview'da gösterilen alt düğümler (parametre/argüman listeleri hariç)"""
+    if not isinstance(node.value, tuple):
+        return []
+    return [child for child in node.value if isinstance(child, Node)]
+
+
+def tree_item_values(node):
+    """Treeview satırı: (tür adı, yaprak değeri, gramer bilgisi)"""
+    value = node.value
+    detail = str(value) if not isinstance(value, tuple) else ""
+    return NODE_TYPE_MAP.get(node.type, node.type), detail, GRAMMAR_INFO.get(node.type, "")
+
+
+# İkili operatör tablosu: değer -> (token türü, öncelik, düğüm türü)
+# Aynı öncelikteki operatörler soldan birleşir
+BINARY_OPERATORS = {
+    'and': ('KEYWORD', 1, 'LogicalExpr'),
+    'or': ('KEYWORD', 1, 'LogicalExpr'),
+    '==': ('OPERATOR', 2, 'ComparisonExpr'),
+    '!=': ('OPERATOR', 2, 'ComparisonExpr'),
+    '<': ('OPERATOR', 2, 'ComparisonExpr'),
+    '>': ('OPERATOR', 2, 'ComparisonExpr'),
+    '<=': ('OPERATOR', 2, 'ComparisonExpr'),
+    '>=': ('OPERATOR', 2, 'ComparisonExpr'),
+    '+': ('OPERATOR', 3, 'AddExpr'),
+    '-': ('OPERATOR', 3, 'AddExpr'),
+    '*': ('OPERATOR', 4, 'MulExpr'),
+    '/': ('OPERATOR', 4, 'MulExpr'),
+}
+
+# Gramer tablolarının anahtarları: bu türlerdeki tokenlar değerleriyle, diğerleri türleriyle eşleşir
+VALUE_KINDS = frozenset(('KEYWORD', 'OPERATOR'))
+STATEMENT_START = FIRST['statement']
+EXPRESSION_START = FIRST['expression']
+KEYWORD_SET = frozenset(KEYWORDS)
+# Panik modunda ayrıştırmanın yeniden başlayabileceği anahtar kelimeler: yalnızca ifade başlatanlar
+STATEMENT_KEYWORDS = frozenset(key for key in STATEMENT_START - EXPRESSION_START if key in KEYWORD_SET)
+# Yeni satırda olsalar da önceki ifadenin devamı olan anahtar kelimeler (elif, else, except...)
+CONTINUATION_KEYWORDS = frozenset(key for key in FOLLOW['suite'] - STATEMENT_START if key in KEYWORD_SET)
+# Aynı tokenla başlayabilen üretimler: ikinci token '=' ise atama, değilse ifade
+LOOKAHEAD_PRODUCTIONS = ('assignment_statement', 'expression_statement')
+
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, iterative=False, recover=False):
         self.tokens = tokens
         self.pos = 0
         self.tree = []
+        # iterative=True: ifadeler açık yığınla ayrıştırılır ve ifade sayısı sınırı yoktur;
+        # iç içe not/parantez/liste/çağrılar Python özyineleme sınırına takılmaz
+        self.iterative = iterative
+        # recover=True: hatalı üst düzey ifadeler Error düğümü olur ve ayrıştırma
+        # bir sonraki ifade başından sürer; tüm hatalar self.errors içinde toplanır
+        self.recover = recover
+        self.errors = []
 
     def peek(self):
         if self.pos < len(self.tokens):
@@ -80,6 +211,16 @@ class Parser:
             return self.tokens[self.pos][2]
         return (0, 0)
 
+    def starts_statement(self):
+        """Sıradaki token FIRST(statement) içinde mi"""
+        token = self.peek()
+        return token is not None and (token[1] if token[0] in VALUE_KINDS else token[0]) in STATEMENT_START
+
+    def starts_expression(self):
+        """Sıradaki token FIRST(expression) içinde mi"""
+        token = self.peek()
+        return token is not None and (token[1] if token[0] in VALUE_KINDS else token[0]) in EXPRESSION_START
+
     def consume(self, expected_kind):
         current = self.peek()
         if current and current[0] == expected_kind:
@@ -100,8 +241,34 @@ class Parser:
             current_desc = f"'{current[1]}'" if current else "end of input"
             raise SyntaxError(f"'{expected_keyword}' expected at line {line}, column {col}, found: {current_desc}")
 
+    def node(self, node_type, value, first):
+        """tokens[first] ile son tüketilen token arasını kapsayan düğüm.
+
+        Alt düğümlerin mutlak ofsetleri bu düğümün başlangıcına göre yeniden yazılır.
+        """
+        token = self.tokens[first]
+        if value.__class__ is not list:
+            if len(token) > 3:
+                return Node(node_type, value, token[3], self.tokens[self.pos - 1][4])
+            return Node(node_type, value)
+        if len(token) <= 3:
+            return Node(node_type, tuple(value))
+        start = token[3]
+        for item in value:
+            cls = item.__class__
+            if cls is Node:
+                item.start -= start
+                item.end -= start
+            elif cls is list:
+                for child in item:
+                    if child.__class__ is Node:
+                        child.start -= start
+                        child.end -= start
+        return Node(node_type, tuple(value), start, self.tokens[self.pos - 1][4])
+
     def parse(self):
         self.tree = []
+        self.errors = []
         if not self.tokens:
             return
         self.parse_program()
@@ -110,163 +277,206 @@ class Parser:
             current = self.peek()
             raise SyntaxError(f"Unexpected token '{current[1]}' ({current[0]}) at line {line}, column {col}")
 
-    def populate_treeview(self, treeview):
-        treeview.delete(*treeview.get_children())
-        self._populate_treeview_recursive(self.tree, treeview, "")
-
-    def _populate_treeview_recursive(self, nodes, treeview, parent, line=1):
-        for node in nodes:
-            if isinstance(node, tuple):
-                node_type, value = node
-                node_type_display = NODE_TYPE_MAP.get(node_type, node_type)
-                detail = str(value) if not isinstance(value, list) else ""
-                grammar = GRAMMAR_INFO.get(node_type, "")
-                tag = f"line_{line}" if isinstance(value, list) else node_type.lower()
-                treeview.insert(parent, "end", values=(node_type_display, detail, grammar), tags=(tag,))
-                if isinstance(value, list):
-                    self._populate_treeview_recursive(value, treeview, treeview.get_children()[-1], line)
-            line += 1
-
     def parse_program(self):
-        self.tree.append(("Program", []))
-        self.parse_statement_list(self.tree[-1][1])
+        statements = []
+        self.parse_statement_list(statements)
+        end = self.tokens[-1][4] if len(self.tokens[-1]) > 3 else None
+        rebase_statements(statements)
+        self.tree.append(Node("Program", tuple(statements), 0 if end is not None else None, end))
 
     def parse_statement_list(self, parent):
         parsed_statements = 0
-        max_statements = 1000
-        while self.peek() is not None and parsed_statements < max_statements:
-            old_pos = self.pos
+        max_statements = None if self.iterative else 1000
+        while self.peek() is not None and (max_statements is None or parsed_statements < max_statements):
             current = self.peek()
             if current and current[0] in ('STRING_QUOTE', 'STRING_CONTENT', 'ESCAPE_CHAR'):
                 self.pos += 1
                 continue
-            parent.append(self.parse_statement())
-            if self.pos == old_pos:
+            parent.append(self.parse_top_statement())
+            parsed_statements += 1
+        if max_statements is not None and parsed_statements >= max_statements:
+            raise SyntaxError("Too many statements - possible infinite loop in parser")
+
+    def parse_top_statement(self):
+        """Bir üst düzey ifade; ilerleme olmazsa SyntaxError.
+
+        recover=True ise hata fırlatılmaz: ifade Error düğümü olarak döner ve
+        self.errors listesine eklenir.
+        """
+        first = self.pos
+        try:
+            node = self.parse_statement()
+            if self.pos == first:
                 line, col = self.get_line_column()
                 current = self.peek()
                 raise SyntaxError(
                     f"Unable to parse statement at line {line}, column {col}: '{current[1]}' ({current[0]})")
-            parsed_statements += 1
-        if parsed_statements >= max_statements:
-            raise SyntaxError("Too many statements - possible infinite loop in parser")
+        except SyntaxError as error:
+            if not self.recover:
+                raise
+            node = self.synchronize(first, error)
+            # ağaçtaki düğüm göreli ofsetlere çevrilir; hata listesi mutlak ofsetli kopyayı tutar
+            self.errors.append(Node(node.type, node.value, node.start, node.end))
+        return node
+
+    def synchronize(self, first, error):
+        """Panik modu: hatalı ifadenin kalanını atla ve hatayı Error düğümü olarak döndür.
+
+        Ayrıştırma yeni bir satırın ilk tokenında (else/except gibi devam
+        anahtar kelimeleri hariç) veya bir ifade anahtar kelimesinde yeniden
+        başlar. Düğümün aralığı hatanın bulunduğu tokendan atlanan son tokena
+        kadardır; hata tokenı zaten bir ifade başıysa ifadenin okunan kısmıdır.
+        """
+        tokens = self.tokens
+        error_pos = self.pos
+        pos = max(error_pos, first + 1)
+        while pos < len(tokens):
+            token = tokens[pos]
+            if token[0] == 'KEYWORD' and token[1] in STATEMENT_KEYWORDS:
+                break
+            if token[2][0] > tokens[pos - 1][2][0] and not (
+                    token[0] == 'KEYWORD' and token[1] in CONTINUATION_KEYWORDS):
+                break
+            pos += 1
+        self.pos = pos
+        if len(tokens[first]) <= 3:
+            return Node("Error", str(error))
+        span_first = error_pos if error_pos < pos else first
+        return Node("Error", str(error), tokens[span_first][3], tokens[pos - 1][4])
 
     def parse_statement(self):
+        """Bir ifade.
+
+        Gövdesi olan ifadelerin metotları üreteçtir: gövde ifadesi için yield
+        eder ve ayrıştırılan ifadeyi geri alır. İç içe gövdeler özyineleme
+        yerine buradaki açık yığınla ayrıştırılır; 'if x: ' * 10000 gibi
+        derin yapılar Python özyineleme sınırına takılmaz.
+        """
+        production = self.statement_production()
+        if production.__class__ is not GeneratorType:
+            return production
+        stack = [production]
+        result = None
+        while stack:
+            try:
+                stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = stop.value
+                continue
+            result = self.statement_production()
+            if result.__class__ is GeneratorType:
+                stack.append(result)
+                result = None
+        return result
+
+    def statement_production(self):
+        """Sıradaki ifadenin üretimi: düğüm, gövdeli ifadelerde üreteç"""
         current = self.peek()
         if not current:
             return
         if current[0] in ('STRING_QUOTE', 'STRING_CONTENT', 'ESCAPE_CHAR'):
             self.pos += 1
             return
-        if current[0] == 'KEYWORD':
-            keyword = current[1]
-            if keyword == 'if':
-                return self.parse_if_statement()
-            elif keyword == 'while':
-                return self.parse_while_statement()
-            elif keyword == 'for':
-                return self.parse_for_statement()
-            elif keyword == 'def':
-                return self.parse_function_def()
-            elif keyword == 'class':
-                return self.parse_class_def()
-            elif keyword == 'return':
-                return self.parse_return_statement()
-            elif keyword == 'try':
-                return self.parse_try_statement()
-            elif keyword == 'raise':
-                return self.parse_raise_statement()
-            elif keyword == 'match':
-                return self.parse_match_statement()
-            elif keyword in ('break', 'continue', 'pass'):
-                self.consume('KEYWORD')
-                return ("Statement", keyword)
-        elif current[0] == 'COMMENT':
-            self.consume('COMMENT')
-            return
-        elif current[0] in ('IDENTIFIER', 'BUILTIN'):
-            next_token = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
-            if next_token and next_token[0] == 'ASSIGN':
-                return self.parse_assignment_statement()
-            else:
-                return self.parse_expression_statement()
-        else:
+        # üretim, ilk tokenın FIRST kümelerinden üretilen tabloda aranır
+        method = STATEMENT_METHODS.get(current[1] if current[0] in VALUE_KINDS else current[0])
+        if method is None:
+            if current[0] == 'KEYWORD':
+                return
             line, col = self.get_line_column()
             raise SyntaxError(f"Unexpected token: '{current[1]}' ({current[0]}) at line {line}, column {col}")
+        if method.__class__ is tuple:
+            next_token = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
+            method = method[0] if next_token and next_token[0] == 'ASSIGN' else method[1]
+        return method(self)
+
+    def parse_simple_statement(self):
+        first = self.pos
+        keyword = self.consume('KEYWORD')[1]
+        return self.node("Statement", keyword, first)
+
+    def parse_comment(self):
+        self.consume('COMMENT')
+        return
 
     def parse_match_statement(self):
+        first = self.pos
         self.consume_keyword('match')
         expr = self.parse_expression()
         self.consume('COLON')
         cases = []
         while self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'case':
-            cases.append(self.parse_case_clause())
+            cases.append((yield from self.parse_case_clause()))
         if not cases:
             line, col = self.get_line_column()
             raise SyntaxError(f"match sonrası en az bir case lazım, hata: satır {line}, sütun {col}")
         result = [expr]
         for case in cases:
             result.append(case)
-        return ("MatchStatement", result)
+        return self.node("MatchStatement", result, first)
 
     def parse_case_clause(self):
+        first = self.pos
         self.consume_keyword('case')
         expr = self.parse_expression()
         self.consume('COLON')
         stmt = None
-        if self.peek() and self.peek()[0] != 'KEYWORD':
-            stmt = self.parse_statement()
+        if self.starts_statement():
+            stmt = yield
         result = [expr]
         if stmt:
             result.append(stmt)
-        return ("CaseClause", result)
+        return self.node("CaseClause", result, first)
 
     def parse_assignment_statement(self):
+        first = self.pos
         current = self.peek()
         identifier = self.consume(current[0])[1]
         self.consume('ASSIGN')
         expr = self.parse_expression()
-        return ("Assignment", [identifier, expr])
+        return self.node("Assignment", [identifier, expr], first)
 
     def parse_return_statement(self):
+        first = self.pos
         self.consume_keyword('return')
         expr = None
-        if self.peek() and self.peek()[0] in ('IDENTIFIER', 'BUILTIN', 'NUMBER', 'STRING', 'LBRACKET', 'LPAREN'):
+        if self.starts_expression():
             expr = self.parse_expression()
         result = []
         if expr:
             result.append(expr)
-        return ("Return", result)
+        return self.node("Return", result, first)
 
     def parse_if_statement(self):
+        first = self.pos
         self.consume_keyword('if')
         condition = self.parse_expression()
         self.consume('COLON')
         then_stmt = None
-        if self.peek() and self.peek()[0] != 'KEYWORD':
-            then_stmt = self.parse_statement()
+        if self.starts_statement():
+            then_stmt = yield
         elif_clauses = []
         while self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'elif':
+            elif_first = self.pos
             self.consume_keyword('elif')
             elif_condition = self.parse_expression()
             self.consume('COLON')
             elif_stmt = None
-            if self.peek() and self.peek()[0] != 'KEYWORD':
-                elif_stmt = self.parse_statement()
+            if self.starts_statement():
+                elif_stmt = yield
             result = [elif_condition]
             if elif_stmt:
                 result.append(elif_stmt)
-            elif_clauses.append(("Elif", result))
+            elif_clauses.append(self.node("Elif", result, elif_first))
         else_clause = None
         if self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'else':
+            else_first = self.pos
             self.consume_keyword('else')
             self.consume('COLON')
             else_stmt = None
-            if self.peek() and self.peek()[0] != 'KEYWORD':
-                else_stmt = self.parse_statement()
-            if else_stmt:
-                else_clause = ("Else", [else_stmt])
-            else:
-                else_clause = ("Else", [])
+            if self.starts_statement():
+                else_stmt = yield
+            else_clause = self.node("Else", [else_stmt] if else_stmt else [], else_first)
         result = [condition]
         if then_stmt:
             result.append(then_stmt)
@@ -274,21 +484,23 @@ class Parser:
             result.append(clause)
         if else_clause:
             result.append(else_clause)
-        return ("IfStatement", result)
+        return self.node("IfStatement", result, first)
 
     def parse_while_statement(self):
+        first = self.pos
         self.consume_keyword('while')
         condition = self.parse_expression()
         self.consume('COLON')
         stmt = None
-        if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-            stmt = self.parse_statement()
+        if self.starts_statement():
+            stmt = yield
         result = [condition]
         if stmt:
             result.append(stmt)
-        return ("WhileStatement", result)
+        return self.node("WhileStatement", result, first)
 
     def parse_function_def(self):
+        first = self.pos
         self.consume_keyword('def')
         name = self.consume('IDENTIFIER')[1]
         self.consume('LPAREN')
@@ -298,14 +510,15 @@ class Parser:
         self.consume('RPAREN')
         self.consume('COLON')
         stmt = None
-        if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-            stmt = self.parse_statement()
+        if self.starts_statement():
+            stmt = yield
         result = [name, params]
         if stmt:
             result.append(stmt)
-        return ("FunctionDef", result)
+        return self.node("FunctionDef", result, first)
 
     def parse_class_def(self):
+        first = self.pos
         self.consume_keyword('class')
         name = self.consume('IDENTIFIER')[1]
         parents = []
@@ -316,35 +529,34 @@ class Parser:
             self.consume('RPAREN')
         self.consume('COLON')
         stmt = None
-        if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-            stmt = self.parse_statement()
+        if self.starts_statement():
+            stmt = yield
         result = [name, parents]
         if stmt:
             result.append(stmt)
-        return ("ClassDef", result)
+        return self.node("ClassDef", result, first)
 
     def parse_try_statement(self):
+        first = self.pos
         self.consume_keyword('try')
         self.consume('COLON')
         try_stmt = None
-        if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-            try_stmt = self.parse_statement()
+        if self.starts_statement():
+            try_stmt = yield
         if not (self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'except'):
             line, col = self.get_line_column()
             raise SyntaxError(f"try sonrası except lazım, hata: satır {line}, sütun {col}")
         except_clauses = []
-        except_clauses.append(self.parse_except_clause())
+        except_clauses.append((yield from self.parse_except_clause()))
         finally_clause = None
         if self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'finally':
+            finally_first = self.pos
             self.consume_keyword('finally')
             self.consume('COLON')
             finally_stmt = None
-            if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-                finally_stmt = self.parse_statement()
-            if finally_stmt:
-                finally_clause = ("Finally", [finally_stmt])
-            else:
-                finally_clause = ("Finally", [])
+            if self.starts_statement():
+                finally_stmt = yield
+            finally_clause = self.node("Finally", [finally_stmt] if finally_stmt else [], finally_first)
         result = []
         if try_stmt:
             result.append(try_stmt)
@@ -352,50 +564,63 @@ class Parser:
             result.append(clause)
         if finally_clause:
             result.append(finally_clause)
-        return ("TryStatement", result)
+        return self.node("TryStatement", result, first)
 
     def parse_for_statement(self):
+        first = self.pos
         self.consume_keyword('for')
         identifier = self.consume('IDENTIFIER')[1]
         self.consume_keyword('in')
         expr = self.parse_expression()
         self.consume('COLON')
         stmt = None
-        if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-            stmt = self.parse_statement()
+        if self.starts_statement():
+            stmt = yield
         result = [identifier, expr]
         if stmt:
             result.append(stmt)
-        return ("ForStatement", result)
+        return self.node("ForStatement", result, first)
 
     def parse_except_clause(self):
-        self.consume_keyword('except')
-        exception = None
-        if self.peek() and self.peek()[0] == 'IDENTIFIER':
-            exception = self.consume('IDENTIFIER')[1]
-        self.consume('COLON')
-        stmt = None
-        if self.peek() and self.peek()[0] not in ('KEYWORD', 'COMMENT'):
-            stmt = self.parse_statement()
-        result = []
-        if exception:
-            result.append(exception)
-        if stmt:
-            result.append(stmt)
-        if self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'except':
-            next_except = self.parse_except_clause()
-            result.append(next_except)
-        return ("ExceptClause", result)
+        # ardışık except blokları döngüyle okunur, sonra sondan başa iç içe bağlanır
+        clauses = []
+        firsts = []
+        while True:
+            firsts.append(self.pos)
+            self.consume_keyword('except')
+            exception = None
+            if self.peek() and self.peek()[0] == 'IDENTIFIER':
+                exception = self.consume('IDENTIFIER')[1]
+            self.consume('COLON')
+            stmt = None
+            if self.starts_statement():
+                stmt = yield
+            result = []
+            if exception:
+                result.append(exception)
+            if stmt:
+                result.append(stmt)
+            clauses.append(result)
+            if not (self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] == 'except'):
+                break
+        # her blok zincirin sonuna kadar uzanır: içteki blok önce kurulur
+        clause = None
+        for first, result in zip(reversed(firsts), reversed(clauses)):
+            if clause:
+                result.append(clause)
+            clause = self.node("ExceptClause", result, first)
+        return clause
 
     def parse_raise_statement(self):
+        first = self.pos
         self.consume_keyword('raise')
         expr = None
-        if self.peek() and self.peek()[0] in ('IDENTIFIER', 'BUILTIN', 'NUMBER', 'STRING', 'LBRACKET', 'LPAREN'):
+        if self.starts_expression():
             expr = self.parse_expression()
         result = []
         if expr:
             result.append(expr)
-        return ("Raise", result)
+        return self.node("Raise", result, first)
 
     def parse_parameter_list(self):
         params = []
@@ -405,57 +630,149 @@ class Parser:
             params.append(self.consume('IDENTIFIER')[1])
         return params
 
-    def parse_expression(self):
-        return self.parse_logical_expr()
-
-    def parse_logical_expr(self):
-        expr = self.parse_comparison_expr()
-        while self.peek() and self.peek()[0] == 'KEYWORD' and self.peek()[1] in ('and', 'or'):
-            op = self.consume('KEYWORD')[1]
-            right = self.parse_comparison_expr()
-            expr = ("LogicalExpr", [op, expr, right])
-        return expr
-
-    def parse_comparison_expr(self):
-        expr = self.parse_add_expr()
-        while self.peek() and self.peek()[0] == 'OPERATOR' and self.peek()[1] in ('==', '!=', '<', '>', '<=', '>='):
-            op = self.consume('OPERATOR')[1]
-            right = self.parse_add_expr()
-            expr = ("ComparisonExpr", [op, expr, right])
-        return expr
-
-    def parse_add_expr(self):
-        expr = self.parse_mul_expr()
-        while self.peek() and self.peek()[0] == 'OPERATOR' and self.peek()[1] in ('+', '-'):
-            op = self.consume('OPERATOR')[1]
-            right = self.parse_mul_expr()
-            expr = ("AddExpr", [op, expr, right])
-        return expr
-
-    def parse_mul_expr(self):
+    def parse_expression(self, min_precedence=1):
+        """Öncelik tırmanması: önce bir terim, ardından önceliği yeterli ikili operatörler"""
+        if self.iterative:
+            return self.parse_expression_iterative()
+        first = self.pos
         expr = self.parse_term()
-        while self.peek() and self.peek()[0] == 'OPERATOR' and self.peek()[1] in ('*', '/'):
-            op = self.consume('OPERATOR')[1]
-            right = self.parse_term()
-            expr = ("MulExpr", [op, expr, right])
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            token = tokens[self.pos]
+            operator = BINARY_OPERATORS.get(token[1])
+            if operator is None or operator[0] != token[0] or operator[1] < min_precedence:
+                break
+            _, precedence, node_type = operator
+            self.pos += 1
+            # sağ taraf yalnızca daha sıkı bağlanan operatörleri alır: sola birleşme
+            right = self.parse_expression(precedence + 1)
+            expr = self.node(node_type, [token[1], expr, right], first)
         return expr
 
+    def parse_expression_iterative(self):
+        """parse_expression ile aynı ağacı özyineleme yerine açık bir yığınla kurar.
+
+        Yığındaki çerçeveler yarım kalmış yapılardır: ('not', ilk), ('paren', öncelik, ilk),
+        ('list', öncelik, ilk, elemanlar), ('call', öncelik, ilk, ad, argümanlar) ve
+        ('binary', öncelik, sol, solun ilk tokenı, operatör, düğüm türü). Bir terim
+        tamamlanınca önce operatörler, sonra yığındaki çerçeveler indirgenir.
+        """
+        stack = []
+        min_precedence = 1
+        tokens = self.tokens
+        while True:
+            # önek kısmı: açılan yapılar yığına itilir, yaprak bir terim bulunana dek
+            expr = None
+            while expr is None:
+                current = self.peek()
+                if not current:
+                    line, col = self.get_line_column()
+                    raise SyntaxError(f"Expression expected at line {line}, column {col}")
+                first = self.pos
+                kind = current[0]
+                if kind in ('IDENTIFIER', 'BUILTIN'):
+                    token = self.consume(kind)
+                    value = token[1]
+                    if not (self.peek() and self.peek()[0] == 'LPAREN'):
+                        expr = Node("Term", value, *token[3:5])
+                        break
+                    self.consume('LPAREN')
+                    if self.peek() and self.peek()[0] != 'RPAREN':
+                        stack.append(('call', min_precedence, first, value, []))
+                        min_precedence = 1
+                        continue
+                    self.consume('RPAREN')
+                    expr = self.node("FunctionCall", [value, []], first)
+                elif kind == 'NUMBER':
+                    token = self.consume('NUMBER')
+                    expr = Node("Number", token[1], *token[3:5])
+                elif kind == 'STRING':
+                    token = self.consume('STRING')
+                    expr = Node("String", token[1], *token[3:5])
+                elif kind == 'STRING_QUOTE':
+                    expr = self.parse_string_literal()
+                elif kind == 'LBRACKET':
+                    self.consume('LBRACKET')
+                    if self.peek() and self.peek()[0] != 'RBRACKET':
+                        stack.append(('list', min_precedence, first, []))
+                        min_precedence = 1
+                        continue
+                    self.consume('RBRACKET')
+                    expr = self.node("ListLiteral", [], first)
+                elif kind == 'LPAREN':
+                    self.consume('LPAREN')
+                    stack.append(('paren', min_precedence, first))
+                    min_precedence = 1
+                elif kind == 'KEYWORD' and current[1] == 'not':
+                    self.consume('KEYWORD')
+                    stack.append(('not', first))
+                elif kind == 'KEYWORD' and current[1] in ('True', 'False', 'None'):
+                    token = self.consume('KEYWORD')
+                    expr = Node("Constant", token[1], *token[3:5])
+                else:
+                    line, col = self.get_line_column()
+                    raise SyntaxError(f"Unexpected term: '{current[1]}' ({kind}) at line {line}, column {col}")
+
+            # indirgeme: terim tamamlandı; operatör varsa sağ tarafı için öneke dön
+            while True:
+                # not yalnızca kendisinden sonraki terimi kapsar
+                while stack and stack[-1][0] == 'not':
+                    first = stack.pop()[1]
+                    expr = self.node("NotExpr", [expr], first)
+                if self.pos < len(tokens):
+                    token = tokens[self.pos]
+                    operator = BINARY_OPERATORS.get(token[1])
+                    if operator is not None and operator[0] == token[0] and operator[1] >= min_precedence:
+                        _, precedence, node_type = operator
+                        self.pos += 1
+                        stack.append(('binary', min_precedence, expr, first, token[1], node_type))
+                        min_precedence = precedence + 1
+                        break
+                if not stack:
+                    return expr
+                frame = stack.pop()
+                kind = frame[0]
+                if kind == 'binary':
+                    _, min_precedence, left, first, op, node_type = frame
+                    expr = self.node(node_type, [op, left, expr], first)
+                elif kind == 'paren':
+                    _, min_precedence, first = frame
+                    self.consume('RPAREN')
+                    expr = self.node("ParenExpr", [expr], first)
+                else:
+                    items = frame[-1]
+                    items.append(expr)
+                    if self.peek() and self.peek()[0] == 'COMMA':
+                        self.consume('COMMA')
+                        stack.append(frame)
+                        min_precedence = 1
+                        break
+                    min_precedence, first = frame[1], frame[2]
+                    if kind == 'list':
+                        self.consume('RBRACKET')
+                        expr = self.node("ListLiteral", items, first)
+                    else:
+                        self.consume('RPAREN')
+                        expr = self.node("FunctionCall", [frame[3], items], first)
+
     def parse_term(self):
+        first = self.pos
         current = self.peek()
         if not current:
             line, col = self.get_line_column()
             raise SyntaxError(f"Expression expected at line {line}, column {col}")
         if current[0] in ('IDENTIFIER', 'BUILTIN'):
-            value = self.consume(current[0])[1]
+            token = self.consume(current[0])
             if self.peek() and self.peek()[0] == 'LPAREN':
-                return self.parse_function_call(value)
-            return ("Term", value)
+                return self.parse_function_call(token[1])
+            # tek tokenlık yapraklar: aralık doğrudan tokendan (ofset yoksa boş dilim)
+            return Node("Term", token[1], *token[3:5])
         elif current[0] == 'NUMBER':
-            value = self.consume('NUMBER')[1]
-            return ("Number", value)
+            token = self.consume('NUMBER')
+            return Node("Number", token[1], *token[3:5])
         elif current[0] == 'STRING':
-            value = self.consume('STRING')[1]
-            return ("String", value)
+            token = self.consume('STRING')
+            return Node("String", token[1], *token[3:5])
         elif current[0] == 'STRING_QUOTE':
             return self.parse_string_literal()
         elif current[0] == 'LBRACKET':
@@ -464,36 +781,38 @@ class Parser:
             self.consume('LPAREN')
             expr = self.parse_expression()
             self.consume('RPAREN')
-            return ("ParenExpr", [expr])
+            return self.node("ParenExpr", [expr], first)
         elif current[0] == 'KEYWORD' and current[1] == 'not':
             self.consume('KEYWORD')
             term = self.parse_term()
-            return ("NotExpr", [term])
+            return self.node("NotExpr", [term], first)
         elif current[0] == 'KEYWORD' and current[1] in ('True', 'False', 'None'):
-            value = self.consume('KEYWORD')[1]
-            return ("Constant", value)
+            token = self.consume('KEYWORD')
+            return Node("Constant", token[1], *token[3:5])
         else:
             line, col = self.get_line_column()
             raise SyntaxError(f"Unexpected term: '{current[1]}' ({current[0]}) at line {line}, column {col}")
 
     def parse_string_literal(self):
+        first = self.pos
         self.consume('STRING_QUOTE')
         content = []
         while self.peek() and self.peek()[0] in ('STRING_CONTENT', 'ESCAPE_CHAR'):
             content.append(self.consume(self.peek()[0])[1])
         if self.peek() and self.peek()[0] == 'STRING_QUOTE':
             self.consume('STRING_QUOTE')
-            return ("StringLiteral", content)
+            return self.node("StringLiteral", content, first)
         line, col = self.get_line_column()
         raise SyntaxError(f"Kapanış tırnağı eksik, hata: satır {line}, sütun {col}")
 
     def parse_list_literal(self):
+        first = self.pos
         self.consume('LBRACKET')
         elements = []
         if self.peek() and self.peek()[0] != 'RBRACKET':
             elements = self.parse_expression_list()
         self.consume('RBRACKET')
-        return ("ListLiteral", elements)
+        return self.node("ListLiteral", elements, first)
 
     def parse_expression_list(self):
         elements = []
@@ -504,12 +823,14 @@ class Parser:
         return elements
 
     def parse_expression_statement(self):
+        first = self.pos
         expr = self.parse_expression()
         result = []
         result.append(expr)
-        return ("ExpressionStmt", result)
+        return self.node("ExpressionStmt", result, first)
 
     def parse_function_call(self, name):
+        first = self.pos - 1  # ad tokenı çağıran tarafından tüketildi
         self.consume('LPAREN')
         args = []
         if self.peek() and self.peek()[0] != 'RPAREN':
@@ -517,7 +838,30 @@ class Parser:
         self.consume('RPAREN')
         result = [name]
         result.append(args)
-        return ("FunctionCall", result)
+        return self.node("FunctionCall", result, first)
+
+# grammer.bnf üretimlerini gerçekleyen metotlar (python grammar.py --check ile denetlenir)
+PRODUCTION_METHODS = {
+    'assignment_statement': Parser.parse_assignment_statement,
+    'if_statement': Parser.parse_if_statement,
+    'while_statement': Parser.parse_while_statement,
+    'for_statement': Parser.parse_for_statement,
+    'function_def_statement': Parser.parse_function_def,
+    'class_def_statement': Parser.parse_class_def,
+    'return_statement': Parser.parse_return_statement,
+    'try_statement': Parser.parse_try_statement,
+    'raise_statement': Parser.parse_raise_statement,
+    'match_statement': Parser.parse_match_statement,
+    'expression_statement': Parser.parse_expression_statement,
+    'simple_statement': Parser.parse_simple_statement,
+    'comment': Parser.parse_comment,
+}
+# ilk token anahtarı -> metot; birden fazla üretim mümkünse LOOKAHEAD_PRODUCTIONS sırasıyla metot demeti
+STATEMENT_METHODS = {
+    key: tuple(PRODUCTION_METHODS[name] for name in production) if isinstance(production, tuple)
+    else PRODUCTION_METHODS[production]
+    for key, production in STATEMENT_DISPATCH.items()
+}
 
 if __name__ == "__main__":
     lexer = Lexer()
@@ -543,8 +887,15 @@ if __name__ == "__main__":
             parser.parse()
             print("✓ Parse successful")
             print("Parse Tree:")
-            treeview = ttk.Treeview()
-            parser.populate_treeview(treeview)
+            stack = [(0, node) for node in reversed(parser.tree)]
+            while stack:
+                depth, node = stack.pop()
+                if not isinstance(node, Node):
+                    continue
+                node_type, detail, _ = tree_item_values(node)
+                print(f"{'  ' * depth}{node_type} {detail}".rstrip())
+                if isinstance(node.value, tuple):
+                    stack.extend((depth + 1, child) for child in reversed(node.value))
             print("-" * 60)
         except (ValueError, SyntaxError) as e:
             print(f"✗ Error: {e}")
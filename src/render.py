@@ -0,0 +1,202 @@
+import html
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from dispatch_lexer import DispatchLexer
+from themes import light_theme
+
+# aynı stildeki iki token arasında yalnızca bu karakterler varsa tek aralıkta birleşir
+SPAN_GAP = ' \t'
+# bu kadar çıktı parçası biriktiğinde dosyaya yazılır; tüm çıktı bellekte kurulmaz
+FLUSH_PARTS = 1024
+ANSI_RESET = '\x1b[0m'
+
+# Ön plan ve arka plan rengi ('#rrggbb' veya None)
+Style = namedtuple('Style', ['foreground', 'background'])
+# Kaynak metindeki [start, end) aralığı ve stili
+StyledSpan = namedtuple('StyledSpan', ['start', 'end', 'style'])
+
+
+def parse_color(color):
+    """'#rrggbb' veya '#rgb' rengini (kırmızı, yeşil, mavi) üçlüsüne çevir"""
+    digits = color[1:] if isinstance(color, str) and color.startswith('#') else ''
+    if len(digits) == 3:
+        digits = ''.join(digit * 2 for digit in digits)
+    try:
+        if len(digits) != 6:
+            raise ValueError
+        return int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16)
+    except ValueError:
+        raise ValueError(f"Unsupported color {color!r}, expected '#rrggbb'") from None
+
+
+def theme_styles(theme):
+    """Token türü -> Style tablosu; aynı renkteki türler aynı Style nesnesini paylaşır.
+    Metnin varsayılan renginde olan türler tabloda yoktur (stilsiz)"""
+    default = theme.get('text_area_fg', '').lower()
+    shared = {}
+    styles = {}
+    for token_type, color in theme['highlighter_colors'].items():
+        if color.lower() != default:
+            styles[token_type] = shared.setdefault((color, None), Style(color, None))
+    # editördeki ERROR etiketi gibi yalnızca arka plan
+    if theme.get('error_tag_bg'):
+        styles['ERROR'] = Style(None, theme['error_tag_bg'])
+    return styles
+
+
+class SpanStyler:
+    """Tk'sız vurgulama çekirdeği: kaynak metni temaya göre stilli aralıklara çevirir.
+
+    Tema, editördeki light_theme/dark_theme sözlükleridir; token renkleri
+    highlighter_colors'tan, hatalı karakterlerin arka planı error_tag_bg'den
+    alınır. Tokenlar değer kopyalanmadan ofsetleriyle taranır; aynı stildeki
+    ardışık tokenlar aralarında yalnızca boşluk varsa tek aralıkta
+    birleşir, böylece çıktıdaki etiket sayısı azalır.
+    """
+    def __init__(self, theme=light_theme, lexer=None, escapes=True):
+        self.theme = theme
+        # hatalı karakterler ERROR tokenı olur; tarama hiçbir girdide durmaz
+        self.lexer = lexer or DispatchLexer(recover=True)
+        self.escapes = escapes
+        self.styles = theme_styles(theme)
+
+    def scan(self, code):
+        """(başlangıç, bitiş, Style) üçlülerini sırayla üretir; stilsiz metin aralıklara girmez"""
+        styles = self.styles
+        current = None
+        span_start = span_end = 0
+        for token_type, start, end in self.lexer.scan_offsets(code, self.escapes):
+            style = styles.get(token_type)
+            if style is current and style is not None and \
+                    (start == span_end or not code[span_end:start].strip(SPAN_GAP)):
+                span_end = end
+                continue
+            if current is not None:
+                yield span_start, span_end, current
+            current, span_start, span_end = style, start, end
+        if current is not None:
+            yield span_start, span_end, current
+
+    def spans(self, code):
+        """StyledSpan'ları sırayla üretir"""
+        return map(StyledSpan._make, self.scan(code))
+
+    def styled_spans(self, code):
+        return list(self.spans(code))
+
+
+def highlight_spans(code, theme=light_theme):
+    """Kaynak metnin temaya göre StyledSpan listesi"""
+    return SpanStyler(theme).styled_spans(code)
+
+
+class StreamRenderer(ABC):
+    """Stilli aralıkları dosya nesnesine parça parça yazan işleyicilerin ortak döngüsü.
+
+    Çıktı FLUSH_PARTS parçada bir write ile yazılır; büyük belgelerde bile
+    bellekte yalnızca bir parti tutulur. Her stilin açılış dizisi kurulumda
+    bir kez hazırlanır; aynı işleyici binlerce parça kod için yeniden
+    kullanılmalıdır.
+    """
+    close = ''
+
+    def __init__(self, theme=light_theme, lexer=None, escapes=True):
+        self.styler = SpanStyler(theme, lexer, escapes)
+        self.openers = {style: self.open_style(style) for style in set(self.styler.styles.values())}
+
+    @abstractmethod
+    def open_style(self, style):
+        """Stilin açılış dizisi; aralık close ile kapanır"""
+
+    def escape(self, text):
+        return text
+
+    def header(self):
+        return ''
+
+    def footer(self):
+        return ''
+
+    def render(self, code, out):
+        """code'u vurgulayıp out'a (metin dosyası gibi write'ı olan nesne) yaz"""
+        escape = self.escape
+        openers = self.openers
+        close = self.close
+        parts = [self.header()]
+        append = parts.append
+        pos = 0
+        for start, end, style in self.styler.scan(code):
+            if start != pos:
+                append(escape(code[pos:start]))
+            append(openers[style] + escape(code[start:end]) + close)
+            pos = end
+            if len(parts) >= FLUSH_PARTS:
+                out.write(''.join(parts))
+                parts.clear()
+        if pos < len(code):
+            append(escape(code[pos:]))
+        append(self.footer())
+        out.write(''.join(parts))
+
+
+class HtmlRenderer(StreamRenderer):
+    """Satır içi stillerle <span> etiketli HTML; wrap=True ise tema renkli <pre> içinde"""
+    close = '</span>'
+
+    def __init__(self, theme=light_theme, lexer=None, escapes=True, wrap=True):
+        super().__init__(theme, lexer, escapes)
+        self.wrap = wrap
+        self.background = theme.get('text_area_bg')
+        self.foreground = theme.get('text_area_fg')
+
+    def open_style(self, style):
+        rules = []
+        if style.foreground:
+            rules.append(f"color:{style.foreground}")
+        if style.background:
+            rules.append(f"background-color:{style.background}")
+        return f'<span style="{";".join(rules)}">'
+
+    def escape(self, text):
+        return html.escape(text, False)
+
+    def header(self):
+        if not self.wrap:
+            return ''
+        return f'<pre style="background-color:{self.background};color:{self.foreground}">'
+
+    def footer(self):
+        return '</pre>\n' if self.wrap else ''
+
+
+def ansi_color(color, layer, true_color=True):
+    """Rengin SGR parametreleri; layer 38 ön plan, 48 arka plan"""
+    red, green, blue = parse_color(color)
+    if true_color:
+        return f"{layer};2;{red};{green};{blue}"
+    # 256 renkli terminaller için 6x6x6 renk küpündeki en yakın renk
+    index = 16 + 36 * round(red / 51) + 6 * round(green / 51) + round(blue / 51)
+    return f"{layer};5;{index}"
+
+
+class AnsiRenderer(StreamRenderer):
+    """Terminal çıktısı: her aralık SGR renk dizisiyle açılır ve sıfırlanır.
+    true_color=False ise 256 renkli terminaller için en yakın renkler kullanılır"""
+    close = ANSI_RESET
+
+    def __init__(self, theme=light_theme, lexer=None, escapes=True, true_color=True):
+        self.true_color = true_color
+        super().__init__(theme, lexer, escapes)
+
+    def open_style(self, style):
+        codes = []
+        if style.foreground:
+            codes.append(ansi_color(style.foreground, 38, self.true_color))
+        if style.background:
+            codes.append(ansi_color(style.background, 48, self.true_color))
+        return f"\x1b[{';'.join(codes)}m"
+
+    def escape(self, text):
+        # koddaki ESC karakterleri terminale komut olarak gitmesin
+        return text.replace('\x1b', '^[') if '\x1b' in text else text
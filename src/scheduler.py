@@ -0,0 +1,141 @@
+import time
+from collections import namedtuple
+
+# bu süreden (sn) ucuz geçişler beklemeden, olay kuyruğu boşalınca çalışır
+IMMEDIATE_COST = 0.004
+# pahalı geçişlerin bekleme sınırları (ms)
+MIN_DELAY = 30
+MAX_DELAY = 1000
+# sürekli yazarken geçiş ilk istekten en geç beklemesinin bu katı (ve MAX_DELAY) sonra çalışır
+MAX_WAIT_FACTOR = 2
+# pahalı geçiş en fazla zamanın 1 / (1 + COST_FACTOR) kadarını alır
+COST_FACTOR = 2.0
+# yazarken geçiş tuş aralığının bu katı kadar duraksamayı bekler
+TYPING_FACTOR = 1.5
+# bundan uzun (sn) tuş aralıkları yazma hızına katılmaz; yazma durmuş sayılır
+TYPING_GAP = 1.0
+# ortalamalar üstel hareketli ortalamadır
+SMOOTHING = 0.3
+
+PassStats = namedtuple('PassStats', ['runs', 'last', 'average', 'maximum', 'background', 'delay'])
+
+
+def moving_average(average, value):
+    return value if average is None else average + SMOOTHING * (value - average)
+
+
+class Pass:
+    def __init__(self, func, background):
+        self.func = func
+        # geçişin arka planda süren kısmının son süresini (sn) döndürür
+        self.background = background
+        self.runs = 0
+        self.last = 0.0
+        self.average = None
+        self.maximum = 0.0
+        self.background_average = None
+        self.scheduled = False
+        self.first_request = None
+        self.last_request = None
+
+    def cost(self):
+        return (self.average or 0.0) + (self.background_average or 0.0)
+
+    def record(self, seconds):
+        self.runs += 1
+        self.last = seconds
+        self.average = moving_average(self.average, seconds)
+        self.maximum = max(self.maximum, seconds)
+        if self.background is not None:
+            background = self.background()
+            if background:
+                self.background_average = moving_average(self.background_average, background)
+
+
+class PassScheduler:
+    """Düzenleyici geçişlerini (vurgulama, parantez, analiz) süresine ve
+    yazma hızına göre erteleyen ortak zamanlayıcı.
+
+    Her geçişin ana iş parçacığındaki süresi ve varsa arka plandaki süresi
+    ölçülür. Ucuz geçişler after_idle ile hemen çalışır. Pahalı geçişler
+    son istekten sonra bir duraksama bekler (debounce): bekleme, geçişin
+    maliyetinin COST_FACTOR katı ile yazarken tuş aralığının TYPING_FACTOR
+    katının büyüğüdür, [MIN_DELAY, MAX_DELAY] ile sınırlanır. Sürekli
+    yazarken de geçiş ilk istekten en geç beklemesinin MAX_WAIT_FACTOR katı
+    sonra çalışır.
+
+    Tuş aralığı widget'ın <KeyPress> olayından ölçülür. Ölçümler stats()
+    ile okunur.
+    """
+    def __init__(self, widget, clock=time.perf_counter):
+        self.widget = widget
+        self.clock = clock
+        self.passes = {}
+        self.last_keystroke = None
+        self.keystroke_interval = None
+        widget.bind('<KeyPress>', self.note_keystroke, add='+')
+
+    def add(self, name, func, background=None):
+        """Geçiş ekle; background: arka planda süren kısmın son süresi (sn)"""
+        self.passes[name] = Pass(func, background)
+
+    def note_keystroke(self, event=None):
+        now = self.clock()
+        if self.last_keystroke is not None and now - self.last_keystroke < TYPING_GAP:
+            self.keystroke_interval = moving_average(self.keystroke_interval, now - self.last_keystroke)
+        self.last_keystroke = now
+
+    def typing(self):
+        return self.last_keystroke is not None and self.clock() - self.last_keystroke < TYPING_GAP
+
+    def delay(self, name):
+        """Geçişin şu anki bekleme süresi (ms); 0 ise after_idle ile çalışır"""
+        cost = self.passes[name].cost()
+        if cost <= IMMEDIATE_COST:
+            return 0
+        delay = cost * COST_FACTOR
+        if self.keystroke_interval is not None and self.typing():
+            delay = max(delay, self.keystroke_interval * TYPING_FACTOR)
+        return int(min(max(delay * 1000, MIN_DELAY), MAX_DELAY))
+
+    def schedule(self, name, event=None):
+        """Geçişi iste; zaten bekleyen istek varsa yalnızca son istek zamanı güncellenir"""
+        state = self.passes[name]
+        now = self.clock()
+        state.last_request = now
+        if state.scheduled:
+            return
+        if not self.widget.winfo_exists():
+            return
+        state.scheduled = True
+        state.first_request = now
+        delay = self.delay(name)
+        if delay:
+            self.widget.after(delay, lambda: self.fire(name))
+        else:
+            self.widget.after_idle(lambda: self.fire(name))
+
+    def fire(self, name):
+        state = self.passes[name]
+        now = self.clock()
+        # son istekten beri duraksama dolmadıysa (ve azami bekleme aşılmayacaksa) ertele
+        delay = self.delay(name) / 1000
+        remaining = state.last_request + delay - now
+        longest = min(delay * MAX_WAIT_FACTOR, MAX_DELAY / 1000)
+        if remaining > 0.001 and now + remaining - state.first_request <= longest:
+            self.widget.after(int(remaining * 1000) + 1, lambda: self.fire(name))
+            return
+        state.scheduled = False
+        if not self.widget.winfo_exists():
+            return
+        start = self.clock()
+        try:
+            state.func()
+        finally:
+            state.record(self.clock() - start)
+
+    def stats(self):
+        """Geçiş adı -> PassStats (süreler sn, delay ms)"""
+        return {name: PassStats(state.runs, state.last, state.average or 0.0, state.maximum,
+                                state.background_average or 0.0, self.delay(name))
+                for name, state in self.passes.items()}
@@ -0,0 +1,141 @@
+import io
+import re
+import sys
+import warnings
+
+from lexer import Lexer, LineIndex, KEYWORDS, BUILTINS
+
+try:
+    from _tokenize import TokenizerIter
+except ImportError:
+    TokenizerIter = None
+
+KEYWORD_SET = frozenset(KEYWORDS)
+BUILTIN_SET = frozenset(BUILTINS)
+
+# Standart kütüphane operatörlerinin bu projedeki karşılıkları; tabloda
+# olmayan operatörler (., **, += ...) Lexer'da farklı tokenlaştığı için geri dönülür
+OPERATOR_KINDS = {
+    '==': 'OPERATOR', '!=': 'OPERATOR', '<=': 'OPERATOR', '>=': 'OPERATOR',
+    '+': 'OPERATOR', '-': 'OPERATOR', '*': 'OPERATOR', '/': 'OPERATOR',
+    '<': 'OPERATOR', '>': 'OPERATOR', '=': 'ASSIGN', ':': 'COLON',
+    '(': 'LPAREN', ')': 'RPAREN', ',': 'COMMA', '[': 'LBRACKET', ']': 'RBRACKET',
+}
+NUMBER_REGEX = re.compile(r'\d+(\.\d+)?')
+STRING_REGEX = re.compile(r'"([^"\\]|\\.)*"|\'([^\'\\]|\\.)*\'')
+# Tokenlar arasında kalabilecek metin: boşluk, yorum ve satır sonları
+GAP_REGEX = re.compile(r'(?P<WHITESPACE>[ \t]+)|(?P<COMMENT>#[^\n]*)|(?P<NEWLINE>\n)')
+
+
+class StdlibFallback(Exception):
+    """Standart tokenizer çıktısı Lexer ile aynı akışı vermiyor"""
+
+
+def c_tokens(code):
+    """C tokenizer'dan (metin, başlangıç satırı, başlangıç sütunu, bitiş satırı, bitiş sütunu)"""
+    if sys.version_info >= (3, 12):
+        for _, string, (start_line, start_col), (end_line, end_col), _ in TokenizerIter(
+                io.StringIO(code).readline, extra_tokens=True):
+            yield string, start_line, start_col, end_line, end_col
+    else:
+        for string, _, start_line, end_line, start_col, end_col, _ in TokenizerIter(code):
+            yield string, start_line, start_col, end_line, end_col
+
+
+def is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class StdlibLexer(Lexer):
+    """Geçerli Python kodu için standart kütüphanenin C tokenizer'ını kullanan arka uç.
+
+    C tokenizer'ın tokenları bu projenin token türlerine çevrilir. Çıktı
+    Lexer'ın üreteceği akıştan farklı olabilecekse (geçersiz karakter,
+    desteklenmeyen operatör veya string biçimi, girinti hatası...) aynı
+    kod Lexer ile yeniden taranır. Editörde kullanılmaz (Document ve analiz
+    önbelleği DispatchLexer kullanır); yalnızca ölçümler içindir.
+    """
+    def __init__(self, recover=False):
+        super().__init__(recover)
+        self.fallback_count = 0
+
+    def scan_spans(self, code, pos=0):
+        spans = None
+        if pos == 0 and TokenizerIter is not None:
+            try:
+                # C tokenizer geçersiz sayı biçimleri için SyntaxWarning basar
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', SyntaxWarning)
+                    spans = self.stdlib_spans(code)
+            except (StdlibFallback, SyntaxError, ValueError):
+                spans = None
+        if spans is None:
+            self.fallback_count += 1
+            yield from super().scan_spans(code, pos)
+            return
+        yield from spans
+
+    def stdlib_spans(self, code):
+        # C tokenizer bayt sütunları verir; ASCII dışı metin ve \r Lexer'da farklı işlenir
+        if not code.isascii() or '\r' in code:
+            raise StdlibFallback()
+        starts = LineIndex(code).starts
+        spans = []
+        append = spans.append
+        # aynı metin her zaman aynı türe çevrildiği için tür kararları önbelleğe alınır
+        kinds = {}
+        pos = 0
+        for string, start_line, start_col, end_line, end_col in c_tokens(code):
+            kind = kinds.get(string)
+            if kind is None:
+                if not string or string.isspace():
+                    continue
+                kind = kinds[string] = self.classify(string)
+            start = starts[start_line - 1] + start_col
+            end = starts[end_line - 1] + end_col
+            if start > pos:
+                if start - pos != 1 or code[pos] != ' ':
+                    self.append_gap(code, pos, start, spans)
+            elif start < pos:
+                raise StdlibFallback()
+            elif start and is_word_char(code[start]) and is_word_char(code[start - 1]):
+                # Lexer'daki \b sınırı: bitişik kelime/sayı tokenları hata verir
+                raise StdlibFallback()
+            append((kind, start, end))
+            pos = end
+        if pos < len(code):
+            self.append_gap(code, pos, len(code), spans)
+        return spans
+
+    def append_gap(self, code, start, end, spans):
+        """Tokenlar arasındaki boşluk, yorum ve satır sonlarını ekle"""
+        if code[start] == ' ' and code.count(' ', start, end) == end - start:
+            return
+        pos = start
+        while pos < end:
+            match = GAP_REGEX.match(code, pos, end)
+            if not match:
+                raise StdlibFallback()
+            if match.lastgroup != 'WHITESPACE':
+                spans.append((match.lastgroup, pos, match.end()))
+            pos = match.end()
+
+    def classify(self, string):
+        char = string[0]
+        if char == '#':
+            return 'COMMENT'
+        if char in '"\'':
+            if STRING_REGEX.fullmatch(string):
+                return 'STRING'
+        elif string.isidentifier():
+            if string in KEYWORD_SET:
+                return 'KEYWORD'
+            if string in BUILTIN_SET:
+                return 'BUILTIN'
+            return 'IDENTIFIER'
+        elif char.isdigit():
+            if NUMBER_REGEX.fullmatch(string):
+                return 'NUMBER'
+        elif string in OPERATOR_KINDS:
+            return OPERATOR_KINDS[string]
+        raise StdlibFallback()
@@ -0,0 +1,94 @@
+# Tema tanımları; Tk içermez, editör ve başsız vurgulama (render.py) ortak kullanır
+light_theme = {
+    'name': 'light',
+    'main_frame_bg': '#ffffff',
+    'text_area_bg': '#f8f8f8',
+    'text_area_fg': '#000000',
+    'line_numbers_bg': '#e0e0e0',
+    'line_numbers_fg': '#666666',
+    'select_bg': '#316AC5',
+    'scrollbar_bg': '#e0e0e0',
+    'scrollbar_troughcolor': '#ffffff',
+    'output_area_bg': '#f0f0f0',
+    'output_area_fg': '#000000',
+    'analysis_bg': '#f8f8f8',
+    'analysis_fg': '#000000',
+    'highlighter_colors': {
+        'KEYWORD': '#3a45cb',
+        'BUILTIN': '#FF9900',
+        'IDENTIFIER': '#1E0F0F',
+        'OPERATOR': '#D01F1F',
+        'ASSIGN': '#B5711D',
+        'NUMBER': '#36A016',
+        'STRING': '#063970',
+        'STRING_QUOTE': '#063970',
+        'STRING_CONTENT': '#063970',
+        'ESCAPE_CHAR': '#FF6600',
+        'COLON': '#DAA520',
+        'LPAREN': '#1E0F0F',
+        'RPAREN': '#1E0F0F',
+        'COMMA': '#1E0F0F',
+        'LBRACKET': '#1E0F0F',
+        'RBRACKET': '#1E0F0F',
+        'COMMENT': '#6F5F5F'
+    },
+    'error_tag_bg': '#ffcccc',
+    'error_label_fg_ok': 'green',
+    'error_label_fg_error': 'red',
+    'error_label_fg_default': 'black',
+    'bracket_match_bg': '#90EE90',
+    'bracket_match_fg': 'black',
+    'bracket_mismatch_bg': '#FFB6C1',
+    'bracket_mismatch_fg': 'black',
+    'completer_bg': '#ffffff',
+    'completer_fg': 'black',
+    'completer_select_bg': '#e0e0e0',
+    'completer_select_fg': 'black',
+}
+
+dark_theme = {
+    'name': 'dark',
+    'main_frame_bg': '#1a1a1a',
+    'text_area_bg': '#2d2d2d',
+    'text_area_fg': '#d3d3d3',
+    'line_numbers_bg': '#333333',
+    'line_numbers_fg': '#a9b7c6',
+    'select_bg': '#0078D7',
+    'scrollbar_bg': '#555555',
+    'scrollbar_troughcolor': '#1a1a1a',
+    'output_area_bg': '#333333',
+    'output_area_fg': '#d3d3d3',
+    'analysis_bg': '#2d2d2d',
+    'analysis_fg': '#d3d3d3',
+    'highlighter_colors': {
+        'KEYWORD': '#FF8C00',
+        'BUILTIN': '#DA70D6',
+        'IDENTIFIER': '#A9B7C6',
+        'OPERATOR': '#FF6B68',
+        'ASSIGN': '#A9B7C6',
+        'NUMBER': '#6897BB',
+        'STRING': '#6A8759',
+        'STRING_QUOTE': '#6A8759',
+        'STRING_CONTENT': '#6A8759',
+        'ESCAPE_CHAR': '#E6A23C',
+        'COLON': '#A9B7C6',
+        'LPAREN': '#A9B7C6',
+        'RPAREN': '#A9B7C6',
+        'COMMA': '#A9B7C6',
+        'LBRACKET': '#A9B7C6',
+        'RBRACKET': '#A9B7C6',
+        'COMMENT': '#808080'
+    },
+    'error_tag_bg': '#7f0000',
+    'error_label_fg_ok': '#77dd77',
+    'error_label_fg_error': '#ff6961',
+    'error_label_fg_default': '#d3d3d3',
+    'bracket_match_bg': '#3b873b',
+    'bracket_match_fg': '#d3d3d3',
+    'bracket_mismatch_bg': '#8b0000',
+    'bracket_mismatch_fg': '#d3d3d3',
+    'completer_bg': '#333333',
+    'completer_fg': '#d3d3d3',
+    'completer_select_bg': '#4b6eaf',
+    'completer_select_fg': '#d3d3d3',
+}
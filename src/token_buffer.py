@@ -0,0 +1,138 @@
+import sys
+from array import array
+
+from lexer import Lexer, LineIndex
+
+# Token türleri ve tamsayı kimlikleri
+KINDS = (
+    'KEYWORD', 'BUILTIN', 'NUMBER', 'IDENTIFIER', 'OPERATOR', 'ASSIGN', 'STRING',
+    'COLON', 'LPAREN', 'RPAREN', 'COMMA', 'LBRACKET', 'RBRACKET', 'COMMENT',
+    'STRING_QUOTE', 'STRING_CONTENT', 'ESCAPE_CHAR', 'ERROR',
+)
+KIND_IDS = {kind: kind_id for kind_id, kind in enumerate(KINDS)}
+
+
+class TokenBuffer:
+    """Tokenları sütunlar halinde array içinde tutar.
+
+    Her token için tür kimliği (array('B')), başlangıç/bitiş ofseti ve satır
+    numarası (array('I')) saklanır; değerler istendiğinde kaynak metinden
+    dilimlenir. İndeksleme (tür, değer, (satır, sütun)) demeti döndürür, bu
+    yüzden Parser ve token listesi bekleyen diğer kodlar doğrudan kullanabilir.
+    Analiz önbelleği (AnalysisCache) tokenları bu sütunlarla saklar ve yükler.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.line_starts = array('I', LineIndex(source).starts)
+        self.kinds = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.lines = array('I')
+
+    @classmethod
+    def from_code(cls, code, lexer=None, escapes=True):
+        """Kodu tokenize edip tamponu doldur"""
+        lexer = lexer or Lexer()
+        buffer = cls(code)
+        lines = LineIndex.from_starts(buffer.line_starts)
+        kind_ids = KIND_IDS
+        kinds, starts, ends, line_numbers = buffer.kinds, buffer.starts, buffer.ends, buffer.lines
+        for token_type, start, end in lexer.scan_offsets(code, escapes):
+            kinds.append(kind_ids[token_type])
+            starts.append(start)
+            ends.append(end)
+            line_numbers.append(lines.line_of(start) + 1)
+        return buffer
+
+    @classmethod
+    def from_tokens(cls, code, tokens):
+        """Ofsetli düz Token listesinden tamponu kur"""
+        buffer = cls(code)
+        kind_ids = KIND_IDS
+        buffer.kinds = array('B', [kind_ids[token.type] for token in tokens])
+        buffer.starts = array('I', [token.start for token in tokens])
+        buffer.ends = array('I', [token.end for token in tokens])
+        buffer.lines = array('I', [token.position[0] for token in tokens])
+        return buffer
+
+    @classmethod
+    def from_columns(cls, code, kinds, starts, ends):
+        """Tür kimliği ve ofset sütunlarından tamponu kur; satır numaraları hesaplanır"""
+        buffer = cls(code)
+        buffer.kinds, buffer.starts, buffer.ends = kinds, starts, ends
+        # tokenlar sıralı olduğundan satır numarası ileriye doğru yürütülür
+        line_starts = buffer.line_starts.tolist() + [len(code) + 1]
+        line, next_start = 1, line_starts[1]
+        lines = []
+        append = lines.append
+        for start in starts:
+            while start >= next_start:
+                line += 1
+                next_start = line_starts[line]
+            append(line)
+        buffer.lines = array('I', lines)
+        return buffer
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start = self.starts[index]
+        line = self.lines[index]
+        return (KINDS[self.kinds[index]], self.source[start:self.ends[index]],
+                (line, start - self.line_starts[line - 1] + 1))
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def kind(self, index):
+        return KINDS[self.kinds[index]]
+
+    def value(self, index):
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def values_of_kind(self, kind):
+        """Verilen türdeki tüm token değerleri"""
+        kind_id = KIND_IDS[kind]
+        source, starts, ends = self.source, self.starts, self.ends
+        return [source[starts[i]:ends[i]] for i, k in enumerate(self.kinds) if k == kind_id]
+
+    def escaped_tokens(self, string_parts):
+        """Escape vurgulamalı (tür, değer, (satır, sütun)) listesi; STRING tokenları
+        string_parts(kod, başlangıç, bitiş) ile parçalarına ayrılır"""
+        source, line_starts = self.source, self.line_starts
+        string_id = KIND_IDS['STRING']
+        tokens = []
+        append = tokens.append
+        for kind_id, start, end, line in zip(self.kinds, self.starts, self.ends, self.lines):
+            line_start = line_starts[line - 1]
+            if kind_id == string_id:
+                for token_type, part_start, part_end in string_parts(source, start, end):
+                    append((token_type, source[part_start:part_end], (line, part_start - line_start + 1)))
+            else:
+                append((KINDS[kind_id], source[start:end], (line, start - line_start + 1)))
+        return tokens
+
+    def memory_usage(self):
+        """Tamponun kendi kullandığı bayt sayısı (kaynak metin hariç)"""
+        return (sys.getsizeof(self) + sys.getsizeof(self.kinds) + sys.getsizeof(self.starts)
+                + sys.getsizeof(self.ends) + sys.getsizeof(self.lines) + sys.getsizeof(self.line_starts))
+
+
+def token_list_memory(tokens):
+    """Demet listesi halindeki tokenların bayt sayısı (paylaşılan nesneler bir kez sayılır)"""
+    seen = set()
+    total = 0
+    stack = [tokens]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return total
@@ -0,0 +1,384 @@
+from bisect import bisect_right
+from math import ceil, sqrt
+
+from parser import Node, statement_bases, tree_children, tree_item_values
+
+# Tembel Treeview'da tek seferde eklenen en fazla kardeş düğüm; fazlası gruplanır
+LAZY_GROUP_SIZE = 100
+
+
+def same_statement(old, new):
+    """Treeview'da aynı satırı gösteren üst düzey düğümler: aynı nesne veya aynı
+    alt ağaçlı (yalnızca göreli ofseti farklı) kopyası"""
+    return old is new or (old.type == new.type and old.value is new.value)
+
+
+class TreeviewRows:
+    """Düz bir Treeview'ın satırlarını önceki listeyle farkına göre günceller.
+
+    Satırlar (değerler, etiketler) çiftleridir. Ortak önek ve sonek
+    korunur; aradaki değişen bölgede örtüşen satırlar item() ile yerinde
+    güncellenir, fazlası eklenir veya silinir. Bu yüzden değişmeyen
+    satırların seçimi ve kaydırma konumu korunur.
+
+    shift_key verilirse sonek satırları bu anahtarla eşleştirilir (ör. satır
+    numarası hariç değerler). Eşleşip yine de değişen satırlar (düzenlemeden
+    sonra satır numarası kayan tokenlar) görünür olanlar hemen, kalanlar
+    kaydırılıp görünür olduklarında (show_range) güncellenir; Tcl trafiği
+    düzenlemenin ve görüntülenen satırların sayısıyla ölçeklenir.
+    """
+    def __init__(self, treeview, shift_key=None):
+        self.treeview = treeview
+        self.shift_key = shift_key
+        self.items = []
+        self.rows = []
+        # ekranda eski değerle duran öğeler: öğe -> yeni satır
+        self.pending = {}
+
+    def update(self, rows):
+        treeview = self.treeview
+        old_rows, items = self.rows, self.items
+        old_count, new_count = len(old_rows), len(rows)
+        common = min(old_count, new_count)
+        prefix = 0
+        while prefix < common and old_rows[prefix] == rows[prefix]:
+            prefix += 1
+        key = self.shift_key
+        suffix = 0
+        if key is None:
+            while suffix < common - prefix and old_rows[-1 - suffix] == rows[-1 - suffix]:
+                suffix += 1
+        else:
+            while suffix < common - prefix and key(old_rows[-1 - suffix]) == key(rows[-1 - suffix]):
+                suffix += 1
+        old_end, new_end = old_count - suffix, new_count - suffix
+        if prefix == old_end == new_end and not suffix:
+            return
+
+        top = self.top_index() if old_count else 0
+        pending = self.pending
+
+        # değişen bölge: örtüşen satırlar yerinde, fazlası eklenir veya silinir
+        overlap = min(old_end, new_end) - prefix
+        for index in range(prefix, prefix + overlap):
+            if old_rows[index] != rows[index] or items[index] in pending:
+                pending.pop(items[index], None)
+                values, tags = rows[index]
+                treeview.item(items[index], values=values, tags=tags)
+        removed = items[prefix + overlap:old_end]
+        if removed:
+            for item in removed:
+                pending.pop(item, None)
+            treeview.delete(*removed)
+        added = []
+        position = prefix + overlap
+        for values, tags in rows[position:new_end]:
+            added.append(treeview.insert("", position if suffix else "end", values=values, tags=tags))
+            position += 1
+        items[prefix + overlap:old_end] = added
+
+        # kayan sonek: yalnızca değerleri değişen satırlar
+        if suffix and key is not None:
+            shift = new_count - old_count
+            for index in range(new_end, new_count):
+                row = rows[index]
+                if row != old_rows[index - shift]:
+                    pending[items[index]] = row
+        self.rows = rows
+
+        # değişiklik görünür satırların üstündeyse aynı satırı üstte tut
+        if top >= old_end:
+            new_top = top + new_count - old_count
+        else:
+            new_top = min(top, new_end)
+        if new_top != top and new_count:
+            treeview.yview_moveto(new_top / new_count)
+        if pending:
+            self.show_range(*treeview.yview())
+
+    def top_index(self):
+        first = self.treeview.yview()[0]
+        return int(first * len(self.rows) + 0.5)
+
+    def show_range(self, first, last):
+        """yscrollcommand: görünür hale gelen bekleyen satırları güncelle"""
+        pending = self.pending
+        if not pending:
+            return
+        count = len(self.rows)
+        for item in self.items[int(float(first) * count):int(float(last) * count + 0.5) + 1]:
+            row = pending.pop(item, None)
+            if row is not None:
+                self.treeview.item(item, values=row[0], tags=row[1])
+
+    def values(self, item):
+        """Öğenin güncel değerleri (ekrana henüz yansımamış olsa bile)"""
+        row = self.pending.get(item)
+        if row is not None:
+            return row[0]
+        return self.treeview.item(item)["values"]
+
+
+class TreeviewNodes:
+    """Parse ağacını bir Treeview'da gösterir ve yeni ağaçlarla eşitler.
+
+    populate(lazy=True) yalnızca Program ve üst düzey ifadeleri ekler; alt
+    düğümler yerine birer yer tutucu konur ve öğe açıldığında expand ile
+    eklenir. LAZY_GROUP_SIZE'dan fazla kardeş düğüm gruplar halinde eklenir.
+    sync yeni ağaçta yalnızca değişen üst düzey satırları günceller. Öğeler
+    düğümlerine bağlıdır; item_span öğenin kaynaktaki aralığını verir.
+    """
+    def __init__(self, treeview):
+        self.treeview = treeview
+        self.tree = []
+        self.reset()
+
+    def reset(self):
+        # tembel Treeview: henüz açılmamış öğe -> alt düğümler (veya grup düğümleri)
+        self.lazy_items = {}
+        # öğe -> düğüm; grup öğeleri için gruptaki düğümlerin listesi
+        self.item_nodes = {}
+        # alt öğeleri eklenmiş öğe -> alt öğeler (yer tutucu dahil)
+        self.item_children = {}
+        self.program_item = None
+        # Program altındaki üst düzey düğümler ve satırları (ifadeler veya gruplar)
+        self.top_nodes = []
+        self.top_items = []
+        # (Program, üst düzey düğümlerin mutlak taban ofsetleri); item_span ilk istediğinde kurulur
+        self.program_bases = None
+
+    def populate(self, tree=None, lazy=False):
+        """Ağacı (verilmezse son ağacı) Treeview'a baştan ekle; lazy=True ise alt
+        düğümler açılınca eklenir"""
+        if tree is not None:
+            self.tree = tree
+        treeview = self.treeview
+        treeview.delete(*treeview.get_children())
+        self.reset()
+        if not lazy:
+            self._populate_nodes(self.tree)
+            return
+        for program in self.tree:
+            self.program_item = self._insert_tree_item("", program, open=True)
+            self.top_nodes = tree_children(program)
+            self.top_items = self._insert_lazy_children(self.program_item, self.top_nodes)
+
+    def sync(self, tree):
+        """Tembel Treeview'ı yeni ağaca göre yalnızca değişen üst düzey satırları
+        güncelleyerek eşitle.
+
+        Düğümler same_statement ile eşleştirilir: artımlı ayrıştırmada
+        değişmeyen ifadeler aynı Node nesneleri veya yalnızca göreli ofseti
+        farklı kopyalarıdır. Eşleşen ifadelerin öğelerine (açık alt ağaçları ve
+        seçimleri dahil) dokunulmaz, yalnızca öğe kayıtları yeni düğümü
+        gösterir. Öğeler kaynak aralığı yerine düğümlerini gösterdiğinden
+        kayan ifadeler için de Tk çağrısı gerekmez.
+        """
+        treeview = self.treeview
+        self.tree = tree
+        program = tree[0] if tree else None
+        if program is None or self.program_item is None or not treeview.exists(self.program_item):
+            self.populate(lazy=True)
+            return
+        self.item_nodes[self.program_item] = program
+        old, new = self.top_nodes, tree_children(program)
+        common = min(len(old), len(new))
+        # eşleşen ama aynı nesne olmayan düğümlerin yeni sıraları
+        copied = []
+        prefix = 0
+        while prefix < common and same_statement(old[prefix], new[prefix]):
+            if old[prefix] is not new[prefix]:
+                copied.append(prefix)
+            prefix += 1
+        suffix = 0
+        while suffix < common - prefix and same_statement(old[-1 - suffix], new[-1 - suffix]):
+            if old[-1 - suffix] is not new[-1 - suffix]:
+                copied.append(len(new) - 1 - suffix)
+            suffix += 1
+        old_end, new_end = len(old) - suffix, len(new) - suffix
+        grouped = len(new) > LAZY_GROUP_SIZE
+        if grouped != (len(old) > LAZY_GROUP_SIZE):
+            self.populate(lazy=True)
+            return
+        for index in copied:
+            self._replace_top_node(index, new[index])
+        self.top_nodes = new
+        if prefix == old_end == new_end:
+            return
+        if not grouped:
+            self._replace_rows(self.program_item, self.top_items, prefix, old_end, new[prefix:new_end])
+            return
+
+        # gruplar: yalnızca değişen aralığa değen gruplar yeniden bölünür
+        items = self.top_items
+        firsts = []
+        count = 0
+        for item in items:
+            firsts.append(count)
+            count += len(self.item_nodes[item])
+        first_group = max(bisect_right(firsts, prefix) - 1, 0)
+        last_group = max(bisect_right(firsts, max(old_end - 1, prefix)) - 1, first_group)
+        region_start = firsts[first_group]
+        region_end = firsts[last_group] + len(self.item_nodes[items[last_group]]) + len(new) - len(old)
+        group_size = max(LAZY_GROUP_SIZE, ceil(sqrt(len(new))))
+        groups = [new[first:min(first + group_size, region_end)]
+                  for first in range(region_start, region_end, group_size)]
+        self._replace_rows(self.program_item, items, first_group, last_group + 1, groups, region_start)
+        # sonraki grupların sıra aralıkları kaydı
+        if len(new) != len(old):
+            first = region_start + sum(map(len, groups))
+            for item in items[first_group + len(groups):]:
+                group = self.item_nodes[item]
+                treeview.item(item, values=("grup", f"{first + 1}–{first + len(group)}", ""))
+                first += len(group)
+
+    def _replace_top_node(self, index, node):
+        """Satırı değişmeyen üst düzey ifadenin yeni düğüm nesnesini öğe kayıtlarına yaz"""
+        if len(self.top_nodes) <= LAZY_GROUP_SIZE:
+            self.item_nodes[self.top_items[index]] = node
+            return
+        for item in self.top_items:
+            group = self.item_nodes[item]
+            if index < len(group):
+                # grup listesi açılmamış grubun yer tutucu kaydıyla ortaktır
+                group[index] = node
+                children = self.item_children.get(item)
+                if item not in self.lazy_items and children:
+                    self.item_nodes[children[index]] = node
+                return
+            index -= len(group)
+
+    def _replace_rows(self, parent, items, first, last, entries, number=0):
+        """items[first:last] satırlarını entries (düğümler veya gruplar) ile değiştir;
+        örtüşen satırlar yerinde güncellenir. number: ilk grubun sırası"""
+        overlap = min(last - first, len(entries))
+        for index in range(overlap):
+            entry = entries[index]
+            self._reset_lazy_row(items[first + index], entry, number)
+            if entry.__class__ is list:
+                number += len(entry)
+        removed = items[first + overlap:last]
+        if removed:
+            self.treeview.delete(*removed)
+            for item in removed:
+                self._forget_item(item)
+        added = []
+        position = first + overlap
+        for entry in entries[overlap:]:
+            added.append(self._insert_lazy_row(parent, entry, position, number))
+            if entry.__class__ is list:
+                number += len(entry)
+            position += 1
+        items[first + overlap:last] = added
+
+    def expand(self, item):
+        """<<TreeviewOpen>>: açılan öğenin yer tutucusunu gerçek alt düğümlerle değiştir"""
+        nodes = self.lazy_items.pop(item, None)
+        if nodes is None:
+            return
+        self.treeview.delete(*self.item_children.pop(item))
+        self.item_children[item] = self._insert_lazy_children(item, nodes)
+
+    def item_span(self, item):
+        """Öğenin kaynaktaki mutlak (başlangıç, bitiş) aralığı; ofset yoksa None.
+        Düğüm ofsetleri ebeveyne göreli olduğundan üst öğelerin başlangıçları eklenir"""
+        entry = self.item_nodes.get(item)
+        if entry is None:
+            return None
+        first, last = (entry[0], entry[-1]) if entry.__class__ is list else (entry, entry)
+        if first.start is None:
+            return None
+        start, end = first.start, last.end
+        parent = self.treeview.parent(item)
+        while parent:
+            owner = self.item_nodes.get(parent)
+            if owner.__class__ is Node:
+                if owner is self.tree[0]:
+                    # üst düzey ifadeler bir önceki ifadenin bitişine görelidir
+                    bases = self.statement_bases(owner)
+                    start += bases[id(first)]
+                    end += bases[id(last)]
+                else:
+                    start += owner.start
+                    end += owner.start
+                first = last = owner
+            parent = self.treeview.parent(parent)
+        return start, end
+
+    def statement_bases(self, program):
+        """Program'ın statement_bases tablosu; ağaç değişene kadar saklanır"""
+        if self.program_bases is None or self.program_bases[0] is not program:
+            self.program_bases = (program, statement_bases(program))
+        return self.program_bases[1]
+
+    def _insert_lazy_children(self, parent, nodes):
+        """Düğümleri alt düğümleri açılınca eklenecek şekilde ekle; eklenen öğeleri döndürür"""
+        if len(nodes) > LAZY_GROUP_SIZE:
+            group_size = max(LAZY_GROUP_SIZE, ceil(sqrt(len(nodes))))
+            return [self._insert_lazy_row(parent, nodes[first:first + group_size], "end", first)
+                    for first in range(0, len(nodes), group_size)]
+        return [self._insert_lazy_row(parent, node, "end") for node in nodes]
+
+    def _insert_lazy_row(self, parent, entry, index, number=0):
+        """Düğüm veya grup (düğüm listesi) satırı ekle; alt düğümleri varsa yer tutucu koy"""
+        treeview = self.treeview
+        if entry.__class__ is list:
+            item = treeview.insert(parent, index, values=(
+                "grup", f"{number + 1}–{number + len(entry)}", ""), tags=("group",))
+            self.item_nodes[item] = entry
+            children = entry
+        else:
+            item = self._insert_tree_item(parent, entry, index)
+            children = tree_children(entry)
+        if children:
+            self.item_children[item] = [treeview.insert(item, "end", values=("…", "", ""), tags=("placeholder",))]
+            self.lazy_items[item] = children
+        return item
+
+    def _reset_lazy_row(self, item, entry, number=0):
+        """Var olan satırı yeni düğüm veya grupla kapalı ve yer tutuculu hale getir"""
+        treeview = self.treeview
+        children = self.item_children.pop(item, None)
+        if children:
+            treeview.delete(*children)
+            for child in children:
+                self._forget_item(child)
+        self.lazy_items.pop(item, None)
+        if entry.__class__ is list:
+            treeview.item(item, values=("grup", f"{number + 1}–{number + len(entry)}", ""),
+                          tags=("group",), open=False)
+            children = entry
+        else:
+            treeview.item(item, values=tree_item_values(entry), tags=(entry.type.lower(),), open=False)
+            children = tree_children(entry)
+        self.item_nodes[item] = entry
+        if children:
+            self.item_children[item] = [treeview.insert(item, "end", values=("…", "", ""), tags=("placeholder",))]
+            self.lazy_items[item] = children
+
+    def _forget_item(self, item):
+        """Silinen öğe ve alt öğelerinin kayıtlarını bırak (Tk alt öğeleri kendisi siler)"""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            self.item_nodes.pop(current, None)
+            self.lazy_items.pop(current, None)
+            stack.extend(self.item_children.pop(current, ()))
+
+    def _insert_tree_item(self, parent, node, index="end", **options):
+        """Düğümü ekle ve öğeyi düğüme bağla; kaynak aralığı item_span ile bulunur"""
+        item = self.treeview.insert(parent, index, values=tree_item_values(node),
+                                    tags=(node.type.lower(),), **options)
+        self.item_nodes[item] = node
+        return item
+
+    def _populate_nodes(self, nodes):
+        """Tüm düğümleri açık yığınla ekle"""
+        stack = [("", node) for node in reversed(nodes)]
+        while stack:
+            parent, node = stack.pop()
+            if not isinstance(node, Node):
+                continue
+            item = self._insert_tree_item(parent, node)
+            if isinstance(node.value, tuple):
+                stack.extend((item, child) for child in reversed(node.value))